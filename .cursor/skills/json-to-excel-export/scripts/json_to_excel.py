@@ -8,6 +8,7 @@ import sys
 from pathlib import Path
 from urllib.parse import parse_qs, urlparse
 from copy import deepcopy
+from operator import itemgetter
 
 from openpyxl import Workbook
 from openpyxl.worksheet.datavalidation import DataValidation
@@ -161,20 +162,61 @@ _GLOSSARY_ROWS = [
 
 _CLASSIFICATION_COLUMN_PREFIX = "om_class_"
 
+# Keys read by _business_terms_sheet_rows; everything else in an OpenMetadata
+# glossary export (ids, reviewers, children, owners, ...) is dropped on load.
+_GLOSSARY_KEYS = frozenset(
+    {
+        "glossaries",
+        "terms",
+        "glossary",
+        "name",
+        "displayName",
+        "fullyQualifiedName",
+        "description",
+        "synonyms",
+        "entityStatus",
+    }
+)
+
+
+def _glossary_pairs_hook(pairs):
+    return {key: value for key, value in pairs if key in _GLOSSARY_KEYS}
+
 
 def _cell_value(value):
+    value_type = type(value)
+    if value_type is str or value_type is int or value_type is float:
+        return value
     if value is None:
         return ""
     if isinstance(value, bool):
         return "TRUE" if value else "FALSE"
+    # Joined collection values repeat heavily across rows (type lists, units,
+    # tag sets); interning keeps one string object per distinct cell text.
     if isinstance(value, dict):
         pairs = [f"{k}={_cell_value(v)}" for k, v in value.items()]
-        return "; ".join(pairs)
+        return sys.intern("; ".join(pairs))
     if isinstance(value, (list, tuple, set)):
-        return ", ".join(str(_cell_value(v)) for v in value)
+        return sys.intern(", ".join(str(_cell_value(v)) for v in value))
     return value
 
 
+def _row_getter(headers):
+    # itemgetter returns a bare value for a single key; always hand back a tuple.
+    if len(headers) == 1:
+        key = headers[0]
+        return lambda row: (row[key],)
+    return itemgetter(*headers)
+
+
+def _row_values(getter, row, headers):
+    try:
+        return getter(row)
+    except KeyError:
+        # Ragged rows (e.g. nested child sections) fall back to per-key defaults.
+        return tuple(row.get(h, "") for h in headers)
+
+
 def _is_nested(value):
     return isinstance(value, (dict, list))
 
@@ -184,8 +226,11 @@ def _flatten_dict(value, prefix=""):
     if not isinstance(value, dict):
         return out
     for key, item in value.items():
-        col = f"{prefix}{key}" if not prefix else f"{prefix}_{key}"
-        if isinstance(item, dict):
+        col = f"{prefix}_{key}" if prefix else str(key)
+        item_type = type(item)
+        if item_type is str:
+            out[col] = item
+        elif isinstance(item, dict):
             out.update(_flatten_dict(item, col))
         elif isinstance(item, list):
             out[col] = ", ".join(str(_cell_value(v)) for v in item)
@@ -620,42 +665,37 @@ def _glossary_sheet_rows(metadata):
     return rows
 
 
-def _row_from_finding(schema_name, table_name, idx, finding):
-    if not isinstance(finding, dict):
-        return {
-            "schema": schema_name,
-            "table_name": table_name,
-            "finding_index": idx,
-            "check": "",
-            "severity": "",
-            "column": "",
-            "detail": _cell_value(finding),
-            "recommendation": "",
-            "distinct_values": "",
-            "suggested_domain": "",
-            "sample_values": "",
-            "cardinality": "",
-            "delete_strategy": "",
-            "soft_delete_column": "",
-            "soft_delete_type": "",
-            "has_audit_trail": "",
-            "business_date_column": "",
-            "system_ts_column": "",
-            "server_timezone": "",
-            "timezone_columns": "",
-            "distinct_timezones": "",
-            "tz_aware_count": "",
-            "tz_naive_count": "",
-            "detected_unit": "",
-            "canonical_unit": "",
-            "extra_json": "",
-        }
-
-    lag_stats = finding.get("lag_stats") or {}
-    if not isinstance(lag_stats, dict):
-        lag_stats = {}
-
-    known_keys = {
+_FINDING_HEADERS = (
+    "schema",
+    "table_name",
+    "finding_index",
+    "check",
+    "severity",
+    "column",
+    "detail",
+    "recommendation",
+    "distinct_values",
+    "suggested_domain",
+    "sample_values",
+    "cardinality",
+    "delete_strategy",
+    "soft_delete_column",
+    "soft_delete_type",
+    "has_audit_trail",
+    "business_date_column",
+    "system_ts_column",
+    "server_timezone",
+    "timezone_columns",
+    "distinct_timezones",
+    "tz_aware_count",
+    "tz_naive_count",
+    "detected_unit",
+    "canonical_unit",
+    "extra_json",
+)
+
+_FINDING_KNOWN_KEYS = frozenset(
+    {
         "check", "severity", "column", "detail", "recommendation",
         "distinct_values", "suggested_domain", "sample_values", "cardinality",
         "delete_strategy", "soft_delete_column", "soft_delete_type", "has_audit_trail",
@@ -663,7 +703,23 @@ def _row_from_finding(schema_name, table_name, idx, finding):
         "server_timezone", "columns", "distinct_timezones", "tz_aware_count", "tz_naive_count",
         "detected_unit", "canonical_unit",
     }
-    extra_fields = {k: v for k, v in finding.items() if k not in known_keys}
+)
+
+
+def _row_from_finding(schema_name, table_name, idx, finding):
+    if not isinstance(finding, dict):
+        row = dict.fromkeys(_FINDING_HEADERS, "")
+        row["schema"] = schema_name
+        row["table_name"] = table_name
+        row["finding_index"] = idx
+        row["detail"] = _cell_value(finding)
+        return row
+
+    lag_stats = finding.get("lag_stats") or {}
+    if not isinstance(lag_stats, dict):
+        lag_stats = {}
+
+    extra_fields = {k: v for k, v in finding.items() if k not in _FINDING_KNOWN_KEYS}
 
     return {
         "schema": schema_name,
@@ -1136,8 +1192,9 @@ def _write_sheet(ws, rows):
     headers = list(rows[0].keys()) if rows else ["note"]
     ws.append(headers)
     if rows:
+        getter = _row_getter(headers)
         for row in rows:
-            ws.append([_cell_value(row.get(h, "")) for h in headers])
+            ws.append([_cell_value(value) for value in _row_values(getter, row, headers)])
     else:
         ws.append(["No rows"])
     _style_sheet(ws)
@@ -1173,9 +1230,11 @@ def _write_multi_section_sheet(ws, sections):
         row_idx += 1
 
         if rows:
+            getter = _row_getter(headers)
             for row in rows:
-                for col_idx, header in enumerate(headers, start=1):
-                    ws.cell(row=row_idx, column=col_idx, value=_cell_value(row.get(header, "")))
+                values = _row_values(getter, row, headers)
+                for col_idx, value in enumerate(values, start=1):
+                    ws.cell(row=row_idx, column=col_idx, value=_cell_value(value))
                 row_idx += 1
         else:
             ws.cell(row=row_idx, column=1, value="No rows")
@@ -1199,6 +1258,13 @@ def _write_multi_section_sheet(ws, sections):
         ws.column_dimensions["E"].width = 36
 
 
+# List-shaped sheets whose rows are built here from scalar values only; they
+# never need the nested-section split.
+_FLAT_SHEETS = frozenset(
+    {"Glossary", "DataGovernanceTerms", "__dv_classifications", "__rt_meta", "__rt_payload"}
+)
+
+
 def _write_workbook(sheet_rows, output_path):
     wb = Workbook()
     first = True
@@ -1218,6 +1284,8 @@ def _write_workbook(sheet_rows, output_path):
             ws = wb.create_sheet(title=sheet_name)
         if isinstance(rows, dict) and isinstance(rows.get("sections"), list):
             _write_multi_section_sheet(ws, rows["sections"])
+        elif sheet_name in _FLAT_SHEETS:
+            _write_sheet(ws, rows)
         else:
             sections = _split_nested_sections(sheet_name, rows)
             if len(sections) == 1 and sections[0][0] == "Data":
@@ -1267,7 +1335,10 @@ def main():
     glossary_payload = None
     if args.glossary_json:
         glossary_path = Path(args.glossary_json).expanduser().resolve()
-        glossary_payload = json.loads(glossary_path.read_text(encoding="utf-8"))
+        glossary_payload = json.loads(
+            glossary_path.read_text(encoding="utf-8"),
+            object_pairs_hook=_glossary_pairs_hook,
+        )
     elif not args.no_openmetadata:
         glossary_payload = _om_fetch_glossary_payload()
 
@@ -7,34 +7,199 @@ following the shared output schema contract.
 """
 
 import argparse
+import hashlib
+import itertools
 import json
+import math
+import mmap
+import os
+import random
 import re
-from collections import Counter
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Patterns used by the email / phone format checks.
+_EMAIL_RE = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+_PHONE_FORMAT_RE = re.compile(r"^[\+\d\s\-\(\)]+$")
+
+# HyperLogLog settings for column cardinality: 2**12 one-byte registers (~4KB)
+# per column, with exact counting until a column has seen _HLL_SPARSE_LIMIT values.
+_HLL_PRECISION = 12
+_HLL_REGISTERS = 1 << _HLL_PRECISION
+_HLL_SPARSE_LIMIT = 1024
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _stable_hash64(key: Tuple[bool, Any]) -> int:
+    """64-bit hash of a ``(is_str, value)`` key that is identical across runs (str hash() is salted per process)."""
+    is_str, value = key
+    if is_str:
+        digest = hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+        return int.from_bytes(digest, "big")
+    # Numeric hashes are not salted but are not well mixed either: apply splitmix64.
+    mixed = (hash(value) + 0x9E3779B97F4A7C15) & _MASK64
+    mixed = ((mixed ^ (mixed >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    mixed = ((mixed ^ (mixed >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return mixed ^ (mixed >> 31)
+
+
+class _DistinctCounter:
+    """Distinct-value counter: exact set while small, HyperLogLog sketch once large.
+
+    Callers pass ``(type(value) is str, value)`` keys, so '1' stays distinct
+    from the number 1 while 1, 1.0 and True (equal in Python) count once.
+    """
+
+    __slots__ = ("_exact", "_registers")
+
+    def __init__(self) -> None:
+        self._exact: Optional[Set[Any]] = set()
+        self._registers: Optional[bytearray] = None
+
+    @property
+    def is_exact(self) -> bool:
+        return self._exact is not None
+
+    def update(self, distinct: Set[Any]) -> None:
+        """Add a set of values (deduplicated by the caller, so each is hashed once)."""
+        exact = self._exact
+        if exact is not None:
+            exact.update(distinct)
+            if len(exact) <= _HLL_SPARSE_LIMIT:
+                return
+            distinct = exact
+            self._registers = bytearray(_HLL_REGISTERS)
+            self._exact = None
+        for value in distinct:
+            self._add_hashed(value)
+
+    def _add_hashed(self, value: Any) -> None:
+        hashed = _stable_hash64(value)
+        index = hashed & (_HLL_REGISTERS - 1)
+        rank = (64 - _HLL_PRECISION) - (hashed >> _HLL_PRECISION).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def count(self) -> int:
+        if self._exact is not None:
+            return len(self._exact)
+        registers = self._registers
+        alpha = 0.7213 / (1 + 1.079 / _HLL_REGISTERS)
+        estimate = alpha * _HLL_REGISTERS * _HLL_REGISTERS / sum(2.0 ** -rank for rank in registers)
+        zeros = registers.count(0)
+        if estimate <= 2.5 * _HLL_REGISTERS and zeros:
+            # Small-range correction (linear counting).
+            estimate = _HLL_REGISTERS * math.log(_HLL_REGISTERS / zeros)
+        return int(round(estimate))
+
+
+# Tables with more rows than this run the format checks on a reservoir sample of this size.
+_SAMPLE_SIZE = 20000
+_SAMPLE_SEED = 42
+
+# Records are pulled into per-column lists this many rows at a time.
+_SCAN_CHUNK_ROWS = 20000
+
+
+class _Reservoir:
+    """Uniform sample of at most ``size`` records (Algorithm R), fed chunk by chunk."""
+
+    __slots__ = ("size", "sample", "seen", "_rng")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.sample: List[Any] = []
+        self.seen = 0
+        self._rng = random.Random(_SAMPLE_SEED)
+
+    def extend(self, records: Iterable[Any]) -> None:
+        size = self.size
+        sample = self.sample
+        for record in records:
+            self.seen += 1
+            if self.seen <= size:
+                sample.append(record)
+                continue
+            slot = self._rng.randrange(self.seen)
+            if slot < size:
+                sample[slot] = record
+
+
+class _ColumnState:
+    """Per-column accumulators plus name-based classifications computed once."""
+
+    __slots__ = (
+        "name", "type", "is_id", "endswith_id", "is_delete",
+        "numeric", "email", "phone", "nulls", "min", "max", "invalid_emails",
+        "invalid_phones", "unique", "pk_values", "scalars",
+    )
+
+    def __init__(self, name: str, col_type: str) -> None:
+        self.name = name
+        name_lower = name.lower()  # Lowered once for all name-based checks.
+        self.type = col_type
+        self.is_id = name == "id"
+        self.endswith_id = name.endswith("_id")
+        self.is_delete = "deleted" in name_lower or "active" in name_lower
+        self.numeric = col_type in ("integer", "numeric")
+        self.email = "email" in name_lower
+        self.phone = "phone" in name_lower
+        self.nulls = 0
+        self.scalars = 0
+        self.min: Any = None
+        self.max: Any = None
+        self.invalid_emails = 0
+        self.invalid_phones = 0
+        # Exact uniqueness, only checked for PK candidates.
+        self.unique = False
+        self.pk_values: Optional[Set[Tuple[bool, Any]]] = None
+
 
 # Type inference helpers
+def _looks_like_timestamp(value: str) -> bool:
+    """True when ``value`` starts with a YYYY-MM-DD date (what the old timestamp regex matched)."""
+    return (
+        len(value) >= 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdecimal()
+        and value[5:7].isdecimal()
+        and value[8:10].isdecimal()
+    )
+
+
+# Parsed JSON only produces these exact types, so lookups by type() replace isinstance chains.
+_INFERRED_TYPES = {bool: "boolean", int: "integer", float: "numeric"}
+_SCALAR_TYPES = frozenset({str, int, float, bool})
+_NUMBER_TYPES = frozenset({int, float, bool})  # bool included, as isinstance(value, int) did
+
+
 def infer_type(value: Any) -> str:
     """Infer SQL-like type from Python value."""
-    if value is None:
-        return "text"
-    if isinstance(value, bool):
-        return "boolean"
-    if isinstance(value, int):
-        return "integer"
-    if isinstance(value, float):
-        return "numeric"
-    if isinstance(value, str):
-        # Check for common patterns
-        if re.match(r"^\d{4}-\d{2}-\d{2}(\s+\d{2}:\d{2}:\d{2})?", value):
-            return "timestamp"
-        if re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", value):
-            return "text"  # email, but keep as text
-        if re.match(r"^\+?\d[\d\s\-\(\)]+$", value):
-            return "text"  # phone, but keep as text
-        return "text"
-    return "text"
+    if type(value) is str:
+        # Emails and phone numbers are kept as text, so only timestamps need a probe.
+        return "timestamp" if _looks_like_timestamp(value) else "text"
+    return _INFERRED_TYPES.get(type(value), "text")
 
 
 def _normalize_discovery_tables(raw_tables: Any) -> Tuple[List[str], Dict[str, Dict[str, Any]]]:
@@ -64,308 +229,538 @@ def _normalize_discovery_tables(raw_tables: Any) -> Tuple[List[str], Dict[str, D
     return names, metadata_by_table
 
 
+# Table files read ahead (on threads) of the in-process analysis.
+_LOAD_THREADS = 8
+
+# Data files at least this large are memory-mapped instead of read into a bytes copy.
+_MMAP_MIN_BYTES = 64 * 1024
+
+# Table files at least this large have their records streamed with ijson (when
+# installed) instead of materializing the whole payload.
+_STREAM_MIN_BYTES = 128 * 1024 * 1024
+
+
+# Without an explicit worker count, tables are only analyzed in worker processes
+# when their files add up to at least this many bytes.
+_PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+
+
+def _table_files_size(data_dir: Path, table_names: List[str]) -> int:
+    """Total size of the table files _load_table_payload would read."""
+    total = 0
+    for table_name in table_names:
+        for data_file in (data_dir / table_name, data_dir / f"{table_name}.json"):
+            try:
+                total += data_file.stat().st_size
+                break
+            except FileNotFoundError:
+                continue
+    return total
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse a JSON file, using orjson (on a memory map for large files) when it is installed."""
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as f:
+            try:
+                if os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        return orjson.loads(view)
+                return orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                pass  # NaN/Infinity literals or >64-bit integers; let the stdlib parser decide.
+    return json.loads(path.read_bytes())
+
+
+def _iter_streamed_records(path: Path) -> Iterable[Any]:
+    yielded = 0
+    try:
+        with open(path, "rb") as f:
+            for record in ijson.items(f, "data.item", use_float=True):
+                yield record
+                yielded += 1
+    except ijson.JSONError:
+        # As with orjson, let the stdlib parser decide; it raises for a truncated or invalid file.
+        payload = _load_json_file(path)
+        data = payload.get("data") if isinstance(payload, dict) else None
+        if not isinstance(data, list):
+            raise
+        yield from itertools.islice(data, yielded, None)
+
+
+# Small top-level keys of a table file read before its records are streamed. Only keys
+# written ahead of "data" are read; ones after the records are treated as absent.
+_STREAM_HEADER_KEYS = ("metadata", "schema")
+
+
+def _read_stream_header(f: Any) -> Dict[str, Any]:
+    """Collect the top-level _STREAM_HEADER_KEYS values that precede ``data``, stopping at the records."""
+    header: Dict[str, Any] = {}
+    builder = None
+    depth = 0
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if builder is None:
+            if event == "map_key" and value == "data" and not prefix:
+                break  # Scanning on would parse every record a second time.
+            if prefix not in _STREAM_HEADER_KEYS or prefix in header:
+                continue
+            builder = ijson.ObjectBuilder()
+            key = prefix
+        builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        if not depth:
+            header[key] = builder.value
+            builder = None
+            if len(header) == len(_STREAM_HEADER_KEYS):
+                break
+    return header
+
+
+def _stream_table_payload(path: Path) -> Optional[Dict[str, Any]]:
+    """Read the small top-level keys of a large table file; ``data`` becomes a lazy record stream."""
+    with open(path, "rb") as f:
+        if f.read(64).lstrip()[:1] != b"{":
+            return None
+        f.seek(0)
+        header = _read_stream_header(f)
+    payload = {key: value for key, value in header.items() if value is not None}
+    payload["data"] = _iter_streamed_records(path)
+    return payload
+
+
 def _load_table_payload(data_dir: Path, table_name: str) -> Optional[Dict[str, Any]]:
     """Load table payload from api_reader output, accepting with/without .json suffix."""
     candidates = [data_dir / table_name, data_dir / f"{table_name}.json"]
     for data_file in candidates:
-        if not data_file.exists():
+        try:
+            if IJSON_AVAILABLE and data_file.stat().st_size >= _STREAM_MIN_BYTES:
+                try:
+                    payload = _stream_table_payload(data_file)
+                except ijson.JSONError:
+                    payload = _load_json_file(data_file)
+            else:
+                payload = _load_json_file(data_file)
+        except FileNotFoundError:
             continue
-        with open(data_file, "r", encoding="utf-8") as f:
-            payload = json.load(f)
         if isinstance(payload, dict):
             return payload
     return None
 
 
-def analyze_api_data(discovery_file: Path, data_dir: Path, base_url: str) -> Dict[str, Any]:
-    """Analyze API data and generate normalized schema.json."""
-    
-    # Load discovery data
-    with open(discovery_file, "r", encoding="utf-8") as f:
-        discovery = json.load(f)
-    
-    tables_list, discovery_meta_by_table = _normalize_discovery_tables(discovery.get("tables", []))
-    schema_name = "dbo"  # Default from test API
-    
-    # Process each table
-    tables = []
-    all_findings = []
-    
-    for table_name in tables_list:
-        table_data = _load_table_payload(data_dir, table_name)
-        if not table_data:
-            continue
+def _prefetch_table_payloads(data_dir: Path, table_names: List[str]) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yield table payloads in order while the next few are loaded on threads.
+
+    At most _LOAD_THREADS payloads are pending at once, so memory stays bounded
+    no matter how many tables were discovered.
+    """
+    with ThreadPoolExecutor(max_workers=_LOAD_THREADS) as loader:
+        pending: Deque[Future] = deque()
+        for table_name in table_names:
+            pending.append(loader.submit(_load_table_payload, data_dir, table_name))
+            if len(pending) >= _LOAD_THREADS:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _analyze_table(
+    table_name: str,
+    discovered_table_meta: Dict[str, Any],
+    data_dir: Path,
+    schema_name: str,
+    tables_list: List[str],
+) -> Optional[Dict[str, Any]]:
+    """Load and analyze one downloaded API table (process-pool entry point)."""
+    table_data = _load_table_payload(data_dir, table_name)
+    return _analyze_table_payload(table_name, table_data, discovered_table_meta, schema_name, tables_list)
+
+
+def _analyze_table_payload(
+    table_name: str,
+    table_data: Optional[Dict[str, Any]],
+    discovered_table_meta: Dict[str, Any],
+    schema_name: str,
+    tables_list: List[str],
+) -> Optional[Dict[str, Any]]:
+    """Analyze one loaded API table payload; returns its schema.json table entry."""
+    if not table_data:
+        return None
 
-        discovered_table_meta = discovery_meta_by_table.get(table_name, {})
-        api_table_meta = table_data.get("metadata") if isinstance(table_data.get("metadata"), dict) else {}
-        table_meta = api_table_meta or discovered_table_meta
+    api_table_meta = table_data.get("metadata") if isinstance(table_data.get("metadata"), dict) else {}
+    table_meta = api_table_meta or discovered_table_meta
 
-        schema = (
-            table_data.get("schema")
-            or table_meta.get("schema")
-            or schema_name
+    schema = (
+        table_data.get("schema")
+        or table_meta.get("schema")
+        or schema_name
+    )
+    # The first record is peeked for schema inference; all rows are then
+    # scanned in chunks of _SCAN_CHUNK_ROWS.
+    data = table_data.get("data", [])
+    record_iter = iter(data)
+    first_record = next(record_iter, None)
+
+    # Build columns from API metadata when available; fallback to inferred from first row.
+    columns = []
+    value_samples: Dict[str, _DistinctCounter] = {}  # For cardinality / controlled value detection
+
+    metadata_columns = table_meta.get("columns") if isinstance(table_meta, dict) else None
+    if isinstance(metadata_columns, list) and metadata_columns:
+        for col in metadata_columns:
+            if not isinstance(col, dict):
+                continue
+            col_name = str(col.get("name") or "").strip()
+            if not col_name:
+                continue
+            col_type = str(col.get("type") or "text")
+            columns.append({
+                "name": col_name,
+                "type": col_type,
+                "nullable": bool(col.get("nullable", True)),
+                "is_incremental": bool(col.get("is_incremental", False)),
+                "cardinality": None,
+                "null_count": 0,
+                "data_range": {"min": None, "max": None},
+                "data_category": None,
+            })
+            value_samples[col_name] = _DistinctCounter()
+    elif first_record is not None:
+        for col_name, col_value in first_record.items():
+            col_type = infer_type(col_value)
+            columns.append({
+                "name": col_name,
+                "type": col_type,
+                "nullable": True,  # Assume nullable unless proven otherwise
+                "is_incremental": col_name in ("created_at", "updated_at", "id"),
+                "cardinality": None,
+                "null_count": 0,
+                "data_range": {"min": None, "max": None},
+                "data_category": None,
+            })
+            value_samples[col_name] = _DistinctCounter()
+
+    if not columns:
+        return None
+
+    col_states = [_ColumnState(col["name"], col["type"]) for col in columns]
+    for state in col_states:
+        if state.is_id or state.endswith_id:
+            state.pk_values = set()
+
+    # Schema facts (null counts, ranges, cardinality, PK uniqueness) come from an
+    # exact pass over every row; only the format heuristics use the sample.
+    reservoir: Optional[_Reservoir] = None
+    if isinstance(data, list):
+        # Already materialized: scan slices and draw the sample by index afterwards.
+        chunks: Iterable[List[Any]] = (
+            data[start:start + _SCAN_CHUNK_ROWS] for start in range(0, len(data), _SCAN_CHUNK_ROWS)
         )
-        records = table_data.get("data", [])
-
-        # Build columns from API metadata when available; fallback to inferred from first row.
-        columns = []
-        null_counts = Counter()
-        value_samples = {}  # For controlled value detection
-
-        metadata_columns = table_meta.get("columns") if isinstance(table_meta, dict) else None
-        if isinstance(metadata_columns, list) and metadata_columns:
-            for col in metadata_columns:
-                if not isinstance(col, dict):
-                    continue
-                col_name = str(col.get("name") or "").strip()
-                if not col_name:
-                    continue
-                col_type = str(col.get("type") or "text")
-                columns.append({
-                    "name": col_name,
-                    "type": col_type,
-                    "nullable": bool(col.get("nullable", True)),
-                    "is_incremental": bool(col.get("is_incremental", False)),
-                    "cardinality": None,
-                    "null_count": 0,
-                    "data_range": {"min": None, "max": None},
-                    "data_category": None,
-                })
-                value_samples[col_name] = set()
-        elif records:
-            first_record = records[0]
-            for col_name, col_value in first_record.items():
-                col_type = infer_type(col_value)
-                columns.append({
-                    "name": col_name,
-                    "type": col_type,
-                    "nullable": True,  # Assume nullable unless proven otherwise
-                    "is_incremental": col_name in ("created_at", "updated_at", "id"),
-                    "cardinality": None,
-                    "null_count": 0,
-                    "data_range": {"min": None, "max": None},
-                    "data_category": None,
-                })
-                value_samples[col_name] = set()
+    else:
+        all_records = itertools.chain((first_record,), record_iter) if first_record is not None else iter(())
+        chunks = iter(lambda: list(itertools.islice(all_records, _SCAN_CHUNK_ROWS)), [])
+        reservoir = _Reservoir(_SAMPLE_SIZE)
+    row_count = 0
+    # Rows are scanned in bounded chunks: each column is pulled into a list once
+    # per chunk and reduced with C-level builtins (count, set, min/max) instead
+    # of branching per cell.
+    for chunk in chunks:
+        row_count += len(chunk)
+        if reservoir is not None:
+            reservoir.extend(chunk)
+        for state in col_states:
+            col_name = state.name
+            values = [record.get(col_name) for record in chunk]
+            nulls = values.count(None)
+            if nulls:
+                state.nulls += nulls
+                values = [value for value in values if value is not None]
 
-        if not columns:
-            continue
+            # Distinct values are keyed by (is_str, value) without a str() per cell, so
+            # '1' and 1 differ while 1, 1.0 and True (equal in Python) count once.
+            scalars = [value for value in values if type(value) in _SCALAR_TYPES]
+            state.scalars += len(scalars)
+            distinct = {(type(value) is str, value) for value in scalars}
+            value_samples[col_name].update(distinct)
+            pk_values = state.pk_values
+            if pk_values is not None:
+                pk_values.update(distinct)
+                if len(pk_values) < row_count:
+                    # A duplicate or null was seen, so the column cannot be unique.
+                    state.pk_values = None
 
-        # Analyze all records
-        for record in records:
-            for col_name in columns:
-                col_name_str = col_name["name"]
-                value = record.get(col_name_str)
-                
-                if value is None:
-                    null_counts[col_name_str] += 1
-                else:
-                    # Track unique values for cardinality
-                    if isinstance(value, (str, int, float, bool)):
-                        value_samples[col_name_str].add(str(value))
-        
-        # Update column metadata
-        for col in columns:
-            col_name = col["name"]
-            col["null_count"] = null_counts[col_name]
-            if records:
-                col["nullable"] = null_counts[col_name] > 0
-            unique_count = len(value_samples.get(col_name, set()))
-            col["cardinality"] = unique_count if unique_count > 0 else None
-            
-            # Update data range for numeric types
-            if col["type"] in ("integer", "numeric"):
-                numeric_values = [
-                    float(r.get(col_name, 0)) 
-                    for r in records 
-                    if r.get(col_name) is not None and isinstance(r.get(col_name), (int, float))
-                ]
-                if numeric_values:
-                    col["data_range"]["min"] = str(min(numeric_values))
-                    col["data_range"]["max"] = str(max(numeric_values))
-        
-        # Identify primary keys (fields ending in _id or just 'id')
-        meta_primary_keys = table_meta.get("primary_keys") if isinstance(table_meta, dict) else None
-        if isinstance(meta_primary_keys, list) and meta_primary_keys:
-            primary_keys = [str(pk) for pk in meta_primary_keys if str(pk).strip()]
-        else:
-            primary_keys = []
-            for col in columns:
-                col_name = col["name"]
-                if col_name == "id" or (col_name.endswith("_id") and col_name != "id"):
-                    if col["cardinality"] == len(records):
-                        primary_keys.append(col_name)
-            if not primary_keys:
-                for col in columns:
-                    col_name = col["name"]
-                    if col_name == f"{table_name}_id" or col_name == "id":
-                        primary_keys.append(col_name)
-                        break
-        
-        # Identify foreign keys (fields ending in _id that reference other tables)
-        meta_foreign_keys = table_meta.get("foreign_keys") if isinstance(table_meta, dict) else None
-        if isinstance(meta_foreign_keys, list) and meta_foreign_keys:
-            foreign_keys = []
-            for fk in meta_foreign_keys:
-                if isinstance(fk, dict) and fk.get("column") and fk.get("references"):
-                    foreign_keys.append({
-                        "column": str(fk["column"]),
-                        "references": str(fk["references"]),
-                    })
-        else:
-            foreign_keys = []
-            for col in columns:
-                col_name = col["name"]
-                if col_name.endswith("_id") and col_name not in primary_keys:
-                    ref_table = col_name.replace("_id", "")
-                    if ref_table in tables_list:
-                        foreign_keys.append({
-                            "column": col_name,
-                            "references": f"{schema}.{ref_table}({ref_table}_id)"
-                        })
-        
-        # Data quality checks
-        findings = []
-        
-        # Check for missing primary key
-        if not primary_keys:
-            findings.append({
-                "severity": "warning",
-                "check": "missing_primary_key",
+            if state.numeric:
+                # Compare native JSON numbers; float() is applied once when reporting.
+                numbers = [value for value in scalars if type(value) in _NUMBER_TYPES]
+                if numbers:
+                    low = min(numbers)
+                    high = max(numbers)
+                    if state.min is None or low < state.min:
+                        state.min = low
+                    if state.max is None or high > state.max:
+                        state.max = high
+
+    if reservoir is not None:
+        records = reservoir.sample
+    elif row_count > _SAMPLE_SIZE:
+        records = random.Random(_SAMPLE_SEED).sample(data, _SAMPLE_SIZE)
+    else:
+        records = data
+    analyzed_rows = len(records)
+    sampled = analyzed_rows < row_count
+    sample_note = f" (based on a {analyzed_rows}-row sample of {row_count} rows)" if sampled else ""
+
+    for state in col_states:
+        if state.pk_values is not None:
+            state.unique = len(state.pk_values) == row_count
+            state.pk_values = None
+        if state.email or state.phone:
+            values = [text for text in (record.get(state.name) for record in records) if text is not None]
+            if state.email:
+                state.invalid_emails = sum(1 for text in map(str, values) if text and not _EMAIL_RE.match(text))
+            if state.phone:
+                state.invalid_phones = sum(1 for text in map(str, values) if text and not _PHONE_FORMAT_RE.match(text))
+
+    # One pass over the columns updates metadata, collects key candidates and
+    # buckets findings by check (emitted below in the established order).
+    unique_id_columns: List[str] = []
+    fallback_pk: Optional[str] = None
+    fk_candidates: List[str] = []
+    controlled_findings: List[Dict[str, Any]] = []
+    never_null_findings: List[Dict[str, Any]] = []
+    format_findings: List[Dict[str, Any]] = []
+    delete_flags: List[str] = []
+    timestamp_cols: List[str] = []
+    table_pk_name = f"{table_name}_id"
+    for col, state in zip(columns, col_states):
+        col_name = state.name
+        null_count = state.nulls
+        col["null_count"] = null_count
+        if row_count:
+            col["nullable"] = null_count > 0
+        counter = value_samples.get(col_name)
+        unique_count = counter.count() if counter is not None else 0
+        if counter is not None and not counter.is_exact:
+            if state.unique:
+                unique_count = row_count
+            else:
+                # The sketch can overshoot; it never exceeds the values counted.
+                unique_count = min(unique_count, state.scalars)
+                col["cardinality_estimated"] = True
+        cardinality = unique_count if unique_count > 0 else None
+        col["cardinality"] = cardinality
+
+        # Update data range for numeric types
+        if state.min is not None:
+            col["data_range"]["min"] = str(float(state.min))
+            col["data_range"]["max"] = str(float(state.max))
+
+        # Primary/foreign key candidates (fields ending in _id or just 'id')
+        if state.unique and row_count:
+            unique_id_columns.append(col_name)
+        if fallback_pk is None and (state.is_id or col_name == table_pk_name):
+            fallback_pk = col_name
+        if state.endswith_id:
+            fk_candidates.append(col_name)
+
+        # Check for controlled value candidates (low cardinality)
+        if cardinality and cardinality <= 10 and cardinality < row_count * 0.1:  # Less than 10% unique
+            controlled_findings.append({
+                "severity": "info",
+                "check": "controlled_value_candidates",
                 "table": table_name,
-                "message": f"Table '{table_name}' has no identified primary key",
+                "column": col_name,
+                "message": f"Column '{col_name}' has low cardinality ({cardinality} distinct values), may be a controlled value",
             })
-        
-        # Check for controlled value candidates (low cardinality)
-        for col in columns:
-            if col["cardinality"] and col["cardinality"] <= 10 and col["cardinality"] > 0:
-                if col["cardinality"] < len(records) * 0.1:  # Less than 10% unique
-                    findings.append({
-                        "severity": "info",
-                        "check": "controlled_value_candidates",
-                        "table": table_name,
-                        "column": col["name"],
-                        "message": f"Column '{col['name']}' has low cardinality ({col['cardinality']} distinct values), may be a controlled value",
-                    })
-        
+
         # Check for nullable but never null
-        for col in columns:
-            if col["nullable"] and col["null_count"] == 0 and len(records) > 0:
-                findings.append({
-                    "severity": "info",
-                    "check": "nullable_but_never_null",
-                    "table": table_name,
-                    "column": col["name"],
-                    "message": f"Column '{col['name']}' is nullable but contains no null values in sample",
-                })
-        
-        # Check for format inconsistencies (emails, phones)
-        for col in columns:
-            col_name = col["name"]
-            if "email" in col_name.lower():
-                email_values = [
-                    str(r.get(col_name, "")) 
-                    for r in records 
-                    if r.get(col_name) is not None
-                ]
-                invalid_emails = [
-                    e for e in email_values 
-                    if e and not re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", e)
-                ]
-                if invalid_emails:
-                    findings.append({
-                        "severity": "warning",
-                        "check": "format_inconsistency",
-                        "table": table_name,
-                        "column": col_name,
-                        "message": f"Column '{col_name}' contains {len(invalid_emails)} invalid email format(s)",
-                    })
-            
-            if "phone" in col_name.lower():
-                phone_values = [
-                    str(r.get(col_name, "")) 
-                    for r in records 
-                    if r.get(col_name) is not None
-                ]
-                # Basic phone validation
-                invalid_phones = [
-                    p for p in phone_values 
-                    if p and not re.match(r"^[\+\d\s\-\(\)]+$", p)
-                ]
-                if invalid_phones:
-                    findings.append({
-                        "severity": "info",
-                        "check": "format_inconsistency",
-                        "table": table_name,
-                        "column": col_name,
-                        "message": f"Column '{col_name}' contains {len(invalid_phones)} potentially invalid phone format(s)",
-                    })
-        
-        # Check for delete management (soft delete flags)
-        delete_flags = [col["name"] for col in columns if "deleted" in col["name"].lower() or "active" in col["name"].lower()]
-        if not delete_flags:
-            findings.append({
+        if col["nullable"] and null_count == 0 and row_count > 0:
+            never_null_findings.append({
                 "severity": "info",
-                "check": "delete_management",
+                "check": "nullable_but_never_null",
+                "table": table_name,
+                "column": col_name,
+                "message": f"Column '{col_name}' is nullable but contains no null values in sample",
+            })
+
+        # Check for format inconsistencies (emails, phones)
+        if state.invalid_emails:
+            format_findings.append({
+                "severity": "warning",
+                "check": "format_inconsistency",
                 "table": table_name,
-                "message": f"Table '{table_name}' has no identified soft delete flag",
+                "column": col_name,
+                "message": f"Column '{col_name}' contains {state.invalid_emails} invalid email format(s){sample_note}",
             })
-        
-        # Check for late arriving data (timestamp columns)
-        timestamp_cols = [col["name"] for col in columns if col["type"] == "timestamp"]
-        if timestamp_cols:
-            findings.append({
+        if state.invalid_phones:
+            format_findings.append({
                 "severity": "info",
-                "check": "late_arriving_data",
+                "check": "format_inconsistency",
                 "table": table_name,
-                "message": f"Table '{table_name}' has timestamp columns: {', '.join(timestamp_cols)}. Monitor for late-arriving data.",
+                "column": col_name,
+                "message": f"Column '{col_name}' contains {state.invalid_phones} potentially invalid phone format(s){sample_note}",
             })
-        
-        table_entry = {
+
+        if state.is_delete:
+            delete_flags.append(col_name)
+        if state.type == "timestamp":
+            timestamp_cols.append(col_name)
+
+    # Identify primary keys
+    meta_primary_keys = table_meta.get("primary_keys") if isinstance(table_meta, dict) else None
+    if isinstance(meta_primary_keys, list) and meta_primary_keys:
+        primary_keys = [str(pk) for pk in meta_primary_keys if str(pk).strip()]
+    else:
+        primary_keys = unique_id_columns
+        if not primary_keys and fallback_pk is not None:
+            primary_keys = [fallback_pk]
+
+    # Identify foreign keys (fields ending in _id that reference other tables)
+    meta_foreign_keys = table_meta.get("foreign_keys") if isinstance(table_meta, dict) else None
+    if isinstance(meta_foreign_keys, list) and meta_foreign_keys:
+        foreign_keys = []
+        for fk in meta_foreign_keys:
+            if isinstance(fk, dict) and fk.get("column") and fk.get("references"):
+                foreign_keys.append({
+                    "column": str(fk["column"]),
+                    "references": str(fk["references"]),
+                })
+    else:
+        foreign_keys = []
+        for col_name in fk_candidates:
+            if col_name not in primary_keys:
+                ref_table = col_name.replace("_id", "")
+                if ref_table in tables_list:
+                    foreign_keys.append({
+                        "column": col_name,
+                        "references": f"{schema}.{ref_table}({ref_table}_id)"
+                    })
+
+    # Data quality checks
+    findings = []
+
+    # Check for missing primary key
+    if not primary_keys:
+        findings.append({
+            "severity": "warning",
+            "check": "missing_primary_key",
             "table": table_name,
-            "schema": schema,
-            "columns": columns,
-            "primary_keys": primary_keys,
-            "foreign_keys": foreign_keys,
-            "row_count": len(records),
-            "data_quality": {
-                "controlled_value_candidates": [
-                    f for f in findings if f["check"] == "controlled_value_candidates"
-                ],
-                "nullable_but_never_null": [
-                    f for f in findings if f["check"] == "nullable_but_never_null"
-                ],
-                "missing_primary_key": [
-                    f for f in findings if f["check"] == "missing_primary_key"
-                ],
-                "missing_foreign_keys": [],
-                "format_inconsistency": [
-                    f for f in findings if f["check"] == "format_inconsistency"
-                ],
-                "range_violations": [],
-                "delete_management": [
-                    f for f in findings if f["check"] == "delete_management"
-                ],
-                "late_arriving_data": [
-                    f for f in findings if f["check"] == "late_arriving_data"
-                ],
-                "timezone": [],
-                "findings": findings,
-            },
-        }
-        
+            "message": f"Table '{table_name}' has no identified primary key",
+        })
+
+    if sampled:
+        # Let downstream consumers tell sample-based findings apart.
+        for finding in format_findings:
+            finding["sampled"] = True
+    findings.extend(controlled_findings)
+    findings.extend(never_null_findings)
+    findings.extend(format_findings)
+
+    # Check for delete management (soft delete flags)
+    if not delete_flags:
+        findings.append({
+            "severity": "info",
+            "check": "delete_management",
+            "table": table_name,
+            "message": f"Table '{table_name}' has no identified soft delete flag",
+        })
+
+    # Check for late arriving data (timestamp columns)
+    if timestamp_cols:
+        findings.append({
+            "severity": "info",
+            "check": "late_arriving_data",
+            "table": table_name,
+            "message": f"Table '{table_name}' has timestamp columns: {', '.join(timestamp_cols)}. Monitor for late-arriving data.",
+        })
+
+    findings_by_check: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for finding in findings:
+        findings_by_check[finding["check"]].append(finding)
+
+    table_entry = {
+        "table": table_name,
+        "schema": schema,
+        "columns": columns,
+        "primary_keys": primary_keys,
+        "foreign_keys": foreign_keys,
+        "row_count": row_count,
+        "data_quality": {
+            "controlled_value_candidates": findings_by_check.get("controlled_value_candidates", []),
+            "nullable_but_never_null": findings_by_check.get("nullable_but_never_null", []),
+            "missing_primary_key": findings_by_check.get("missing_primary_key", []),
+            "missing_foreign_keys": [],
+            "format_inconsistency": findings_by_check.get("format_inconsistency", []),
+            "range_violations": [],
+            "delete_management": findings_by_check.get("delete_management", []),
+            "late_arriving_data": findings_by_check.get("late_arriving_data", []),
+            "timezone": [],
+            "findings": findings,
+        },
+    }
+    
+    return table_entry
+
+
+def analyze_api_data(
+    discovery_file: Path,
+    data_dir: Path,
+    base_url: str,
+    workers: Optional[int] = None,
+    generated_at: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Analyze API data and generate normalized schema.json."""
+    
+    # Load discovery data
+    discovery = _load_json_file(discovery_file)
+    
+    tables_list, discovery_meta_by_table = _normalize_discovery_tables(discovery.get("tables", []))
+    schema_name = "dbo"  # Default from test API
+    
+    # Process each table
+    tables = []
+    all_findings = []
+    severity_counts: Dict[str, int] = {}
+    check_counts: Dict[str, int] = {}
+    
+    analyze = partial(_analyze_table, data_dir=data_dir, schema_name=schema_name, tables_list=tables_list)
+    table_metas = [discovery_meta_by_table.get(table_name, {}) for table_name in tables_list]
+    if workers is None:
+        # Process startup and pickling outweigh the analysis of small inputs.
+        large = _table_files_size(data_dir, tables_list) >= _PARALLEL_MIN_BYTES
+        workers = (os.cpu_count() or 1) if large else 1
+    workers = min(workers, len(tables_list))
+    if workers > 1:
+        # Tables are independent, so they are analyzed in separate processes; map() keeps discovery order.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            table_entries = list(executor.map(analyze, tables_list, table_metas))
+    else:
+        payloads = _prefetch_table_payloads(data_dir, tables_list)
+        table_entries = [
+            _analyze_table_payload(table_name, table_data, table_meta, schema_name, tables_list)
+            for table_name, table_data, table_meta in zip(tables_list, payloads, table_metas)
+        ]
+
+    for table_entry in table_entries:
+        if table_entry is None:
+            continue
+        findings = table_entry["data_quality"]["findings"]
+        for finding in findings:
+            severity = finding["severity"]
+            severity_counts[severity] = severity_counts.get(severity, 0) + 1
+            check = finding["check"]
+            check_counts[check] = check_counts.get(check, 0) + 1
         tables.append(table_entry)
         all_findings.extend(findings)
     
     # Calculate summary statistics
-    severity_counts = Counter(f["severity"] for f in all_findings)
-    check_counts = Counter(f["check"] for f in all_findings)
-    
     total_rows = sum(t.get("row_count", 0) for t in tables)
     
     schema_document = {
         "metadata": {
-            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "generated_at": generated_at or datetime.now(timezone.utc).isoformat(),
             "database_url": base_url,
             "schema_filter": schema_name,
             "total_tables": len(tables),
@@ -390,7 +785,7 @@ def analyze_api_data(discovery_file: Path, data_dir: Path, base_url: str) -> Dic
             "critical": severity_counts.get("critical", 0),
             "warning": severity_counts.get("warning", 0),
             "info": severity_counts.get("info", 0),
-            "by_check": dict(check_counts),
+            "by_check": check_counts,
             "constraints_found": {},
         },
         "tables": tables,
@@ -405,6 +800,12 @@ def main() -> int:
     parser.add_argument("--data-dir", required=True, help="Directory containing downloaded API data files")
     parser.add_argument("--base-url", required=True, help="Base URL of the API")
     parser.add_argument("--output", required=True, help="Output schema.json file path")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to analyze tables in parallel (default: CPU count once the table files reach 64 MB, else 1)",
+    )
     args = parser.parse_args()
     
     discovery_file = Path(args.discovery)
@@ -419,11 +820,23 @@ def main() -> int:
         print(f"Error: Data directory not found: {data_dir}")
         return 1
     
-    schema_document = analyze_api_data(discovery_file, data_dir, args.base_url)
+    generated_at = datetime.now(timezone.utc).isoformat()
+    schema_document = analyze_api_data(
+        discovery_file,
+        data_dir,
+        args.base_url,
+        workers=args.workers,
+        generated_at=generated_at,
+    )
     
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(schema_document, f, indent=2, default=str)
+    if ORJSON_AVAILABLE:
+        output_file.write_bytes(
+            orjson.dumps(schema_document, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+        )
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(schema_document, f, indent=2, default=str)
     
     print(f"Generated schema.json: {output_file}")
     print(f"  Tables: {len(schema_document['tables'])}")
@@ -7,20 +7,43 @@ Usage:
                 [--azure-sas-token TOKEN] [--s3-uri s3://bucket/key ...] [--gcs-uri gs://bucket/key ...]
                 [--bearer TOKEN] [--bearer-env NAME] [--bearer-from-keyvault] [--bearer-secret NAME]
                 [--api-key KEY] [--header NAME:VALUE]
-                [--download FILE] [--download-dir DIR] [--output FILE]
+                [--download FILE] [--download-dir DIR] [--output FILE] [--pretty]
 """
 
 import argparse
+import codecs
+import hashlib
 import json
+import mmap
 import os
+import re
+import shutil
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote, unquote, urljoin, urlparse
 
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_ENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=(.*)$", re.M)
+
 
 # Load .env from cwd or workspace so KEYVAULT_NAME is available when using --bearer-from-keyvault
+@lru_cache(maxsize=1)
 def _load_dotenv() -> None:
     for d in [os.getcwd(), CURSOR_ROOT]:
         if not d:
@@ -28,16 +51,11 @@ def _load_dotenv() -> None:
         env_path = os.path.join(d, ".env")
         if os.path.isfile(env_path):
             try:
-                with open(env_path, "r", encoding="utf-8") as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith("#") and "=" in line:
-                            name, _, value = line.partition("=")
-                            name, value = name.strip(), value.strip().strip("'\"")
-                            if name and name not in os.environ:
-                                os.environ[name] = value
+                text = Path(env_path).read_text(encoding="utf-8")
             except OSError:
-                pass
+                break
+            for name, value in _ENV_LINE_RE.findall(text):
+                os.environ.setdefault(name, value.strip().strip("'\""))
             break
 
 SKILL_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -45,20 +63,53 @@ CURSOR_ROOT = os.path.normpath(os.path.join(SKILL_DIR, "..", ".."))
 DEFAULT_FLAT_DIR = os.path.join(SKILL_DIR, "flat")
 
 
+# Azure clients are built once per process: DefaultAzureCredential probes several
+# credential sources on construction and caches tokens per instance.
+@lru_cache(maxsize=None)
+def _azure_credential():
+    from azure.identity import DefaultAzureCredential
+
+    return DefaultAzureCredential()
+
+
+@lru_cache(maxsize=None)
+def _secret_client(vault_name: str):
+    from azure.keyvault.secrets import SecretClient
+
+    return SecretClient(vault_url=f"https://{vault_name}.vault.azure.net", credential=_azure_credential())
+
+
+@lru_cache(maxsize=None)
+def _read_keyvault_secret(vault_name: str, secret_name: str) -> Optional[str]:
+    """Secret value from Azure Key Vault, fetched once per run. Raises on error (errors are not cached)."""
+    secret = _secret_client(vault_name).get_secret(secret_name)
+    return secret.value if secret else None
+
+
+@lru_cache(maxsize=None)
+def _blob_service_client(conn: str):
+    from azure.storage.blob import BlobServiceClient
+
+    return BlobServiceClient.from_connection_string(conn)
+
+
 def _get_keyvault_secret(vault_name: str, secret_name: str) -> Optional[str]:
     """Retrieve a secret value from Azure Key Vault. Returns None on error. Never logs the value."""
     try:
-        from azure.identity import DefaultAzureCredential
-        from azure.keyvault.secrets import SecretClient
-
-        credential = DefaultAzureCredential()
-        kv_url = f"https://{vault_name}.vault.azure.net"
-        secret_client = SecretClient(vault_url=kv_url, credential=credential)
-        secret = secret_client.get_secret(secret_name)
-        return secret.value if secret else None
+        return _read_keyvault_secret(vault_name, secret_name)
     except Exception:
         return None
 
+def _get_keyvault_secrets(pairs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Optional[str]]:
+    """Fetch several (vault, secret) values concurrently. Values are cached per run; errors map to None."""
+    unique = list(dict.fromkeys(pairs))
+    if len(unique) < 2:
+        return {pair: _get_keyvault_secret(*pair) for pair in unique}
+    with ThreadPoolExecutor(max_workers=len(unique)) as executor:
+        values = list(executor.map(lambda pair: _get_keyvault_secret(*pair), unique))
+    return dict(zip(unique, values))
+
+
 DISCOVERY_PATHS = [
     "/api/tables",
     "/api",
@@ -69,7 +120,35 @@ DISCOVERY_PATHS = [
 ]
 
 
-def main() -> int:
+@lru_cache(maxsize=32)
+def _discovery_urls(base: str) -> Tuple[str, ...]:
+    """Absolute discovery URLs for ``base``, in DISCOVERY_PATHS order."""
+    return tuple(urljoin(base + "/", path.lstrip("/")) for path in DISCOVERY_PATHS)
+
+
+# ETag-validated discovery responses, kept in the flat folder between runs. Entries are
+# keyed by URL and a hash of the request headers, so other credentials never reuse them;
+# each save keeps only the entries for the current headers.
+DISCOVERY_CACHE_FILE = ".discovery_cache.json"
+
+# Upper bound on concurrent GETs when several paths/URLs are fetched in one run.
+FETCH_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# One slot per pooled connection (pool_maxsize=FETCH_WORKERS). Every fetch and range
+# GET holds a slot while its response is open, so parallel downloads never overflow the pool.
+_CONNECTION_SLOTS = threading.BoundedSemaphore(FETCH_WORKERS)
+
+# Non-JSON downloads larger than this are fetched as parallel HTTP Range requests
+# of RANGE_CHUNK_BYTES each when the server advertises "Accept-Ranges: bytes".
+RANGE_MIN_BYTES = 8 * 1024 * 1024
+RANGE_CHUNK_BYTES = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Read/write buffer for streamed downloads.
+DOWNLOAD_BUFFER_BYTES = 1024 * 1024
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     p = argparse.ArgumentParser(description="Read REST API paths and object/blob file URLs.")
     p.add_argument("base_url", help="Base URL of the API (e.g. http://localhost:8000)")
     p.add_argument("--path", action="append", dest="paths", metavar="PATH", help="Path to fetch (e.g. /api/tables); can repeat")
@@ -162,10 +241,39 @@ def main() -> int:
     p.add_argument("--download", metavar="FILE", help="Download single response body to this file path")
     p.add_argument("--download-dir", metavar="DIR", help="Directory for downloaded files (for multiple URLs/paths)")
     p.add_argument("--output", "-o", metavar="FILE", help="Write JSON to file (default: stdout)")
+    p.add_argument(
+        "--pretty", action="store_true", help="Indent JSON output (default: compact, indented on a terminal)"
+    )
     p.add_argument("--timeout", type=int, default=30, help="Request timeout in seconds (default: 30)")
-    args = p.parse_args()
+    p.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Parallel range requests per large download (default: {DEFAULT_MAX_CONCURRENCY}; 1 disables)",
+    )
+    args = p.parse_args(argv)
 
     _load_dotenv()
+
+    # Resolve every Key Vault secret this run needs (bearer token, storage key) in one
+    # concurrent batch on the shared credential; the lookups below then hit the cache.
+    keyvault_secrets = []
+    bearer_vault = args.key_vault or os.environ.get("KEYVAULT_NAME")
+    if not args.bearer and not args.bearer_env and bearer_vault and args.bearer_secret:
+        keyvault_secrets.append((bearer_vault, args.bearer_secret))
+    storage_vault = args.azure_key_vault or os.environ.get("AZURE_KEY_VAULT_NAME")
+    storage_secret = os.environ.get("AZURE_STORAGE_KEY_SECRET") or args.azure_key_vault_secret
+    storage_blob = all(
+        [
+            args.azure_account or os.environ.get("AZURE_STORAGE_ACCOUNT"),
+            args.azure_container or os.environ.get("AZURE_STORAGE_CONTAINER"),
+            args.azure_blob or os.environ.get("AZURE_STORAGE_BLOB"),
+        ]
+    )
+    if storage_vault and storage_secret and storage_blob and not args.azure_sas_token:
+        keyvault_secrets.append((storage_vault, storage_secret))
+    _get_keyvault_secrets(keyvault_secrets)
+
     bearer_token = None
     auth_source = "none"
     auth_details = {
@@ -191,6 +299,7 @@ def main() -> int:
                     "auth_resolution": auth_details,
                 },
                 args.output,
+                args.pretty,
             )
         if vault_name:
             bearer_token = _get_keyvault_secret(vault_name, args.bearer_secret)
@@ -208,12 +317,13 @@ def main() -> int:
         headers[args.api_key_header] = args.api_key
     for raw in args.header:
         if ":" not in raw:
-            return _write({"error": f"Invalid --header value '{raw}'. Expected NAME:VALUE."}, args.output)
+            return _write(
+                {"error": f"Invalid --header value '{raw}'. Expected NAME:VALUE."}, args.output, args.pretty
+            )
         name, value = raw.split(":", 1)
         headers[name.strip()] = value.strip()
 
-    session = requests.Session()
-    session.headers.update(headers)
+    session = _build_session(headers)
     timeout = args.timeout
 
     os.makedirs(args.flat_dir, exist_ok=True)
@@ -239,6 +349,7 @@ def main() -> int:
                     "error": "Missing Azure storage key secret name. Provide --azure-key-vault-secret <SECRET_NAME> or AZURE_STORAGE_KEY_SECRET.",
                 },
                 args.output,
+                args.pretty,
             )
         kv_entry = _fetch_azure_blob_via_keyvault(
             kv_name,
@@ -259,49 +370,65 @@ def main() -> int:
             azure_kv_results.append(kv_entry)
     else:
         file_urls.extend(_build_azure_urls(args))
-    file_urls.extend(_convert_object_uris(args.s3_uri, "s3"))
-    file_urls.extend(_convert_object_uris(args.gcs_uri, "gcs"))
+    object_uris = [(uri, "s3") for uri in args.s3_uri] + [(uri, "gcs") for uri in args.gcs_uri]
+    file_urls.extend(_convert_object_uris(object_uris))
 
     total_file_targets = len(paths_to_fetch) + len(file_urls) + len(azure_kv_results)
     if args.download and total_file_targets != 1:
         return _write(
             {"error": "--download requires exactly one --path, --file-url, or Azure blob target."},
             args.output,
+            args.pretty,
         )
 
     if args.discover:
         discovery = []
-        for path in DISCOVERY_PATHS:
-            url = urljoin(base + "/", path.lstrip("/"))
-            try:
-                r = session.get(url, timeout=timeout)
-                try:
-                    data = r.json() if r.content else None
-                except Exception:
-                    data = r.text[:2000] if r.text else None
-                discovery.append({"path": path, "status_code": r.status_code, "data": data})
-                if path == "/api/tables" and r.status_code == 200 and isinstance(data, dict) and "tables" in data:
-                    result["tables"] = data.get("tables", [])
-            except requests.RequestException as e:
-                discovery.append({"path": path, "error": str(e)})
+        cache_path = os.path.join(args.flat_dir, DISCOVERY_CACHE_FILE)
+        digest = _headers_digest(headers)
+        cache = _load_discovery_cache(cache_path)
+        stale = [key for key in cache if not key.startswith(digest + " ")]
+        for key in stale:
+            del cache[key]
+        cache_changed = bool(stale)
+        urls = _discovery_urls(base)
+        keys = [f"{digest} {url}" for url in urls]
+        # Probe all discovery paths at once; the pooled session keeps the connections alive.
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(urls))) as executor:
+            probes = list(
+                executor.map(lambda url, key: _probe_discovery(session, url, timeout, cache.get(key)), urls, keys)
+            )
+        for path, key, (status_code, data, fresh, error) in zip(DISCOVERY_PATHS, keys, probes):
+            if error is not None:
+                discovery.append({"path": path, "error": error})
+                continue
+            if fresh is not None:
+                cache[key] = fresh
+                cache_changed = True
+            discovery.append({"path": path, "status_code": status_code, "data": data})
+            if path == "/api/tables" and status_code == 200 and isinstance(data, dict) and "tables" in data:
+                result["tables"] = data.get("tables", [])
+        if cache_changed:
+            _save_discovery_cache(cache_path, cache)
         result["discovery"] = discovery
         if not paths_to_fetch:
-            return _write(result, args.output)
+            return _write(result, args.output, args.pretty)
 
     if not paths_to_fetch and not file_urls and not azure_kv_results and not flat_files:
-        return _write(result, args.output)
+        return _write(result, args.output, args.pretty)
 
-    path_results = []
+    single_target = len(paths_to_fetch) + len(file_urls) == 1
+    fetch_targets = []
     for path in paths_to_fetch:
         url = urljoin(base + "/", path.lstrip("/"))
-        destination = _target_destination(
-            args.download,
-            args.download_dir,
-            url,
-            len(paths_to_fetch) + len(file_urls) == 1,
-            args.flat_dir,
-        )
-        entry = _fetch_url(session, url, timeout, destination=destination)
+        destination = _target_destination(args.download, args.download_dir, url, single_target, args.flat_dir)
+        fetch_targets.append((url, destination))
+    for file_url in file_urls:
+        destination = _target_destination(args.download, args.download_dir, file_url, single_target, args.flat_dir)
+        fetch_targets.append((file_url, destination))
+    fetched = _fetch_many(session, fetch_targets, timeout, args.max_concurrency)
+
+    path_results = []
+    for path, entry in zip(paths_to_fetch, fetched):
         entry["path"] = path
         path_results.append(entry)
 
@@ -311,15 +438,7 @@ def main() -> int:
         result["paths"] = path_results
 
     file_results = []
-    for file_url in file_urls:
-        destination = _target_destination(
-            args.download,
-            args.download_dir,
-            file_url,
-            len(paths_to_fetch) + len(file_urls) == 1,
-            args.flat_dir,
-        )
-        entry = _fetch_url(session, file_url, timeout, destination=destination)
+    for file_url, entry in zip(file_urls, fetched[len(paths_to_fetch):]):
         entry["url"] = file_url
         file_results.append(entry)
 
@@ -329,25 +448,134 @@ def main() -> int:
     elif all_file_results:
         result["files"] = all_file_results
 
+    # Absolute once here, so _safe_join does not resolve the working directory per file.
+    flat_abs = os.path.abspath(args.flat_dir)
     local_results = []
     for rel_path in flat_files:
-        local_results.append(_read_flat_file(args.flat_dir, rel_path))
+        local_results.append(_read_flat_file(flat_abs, rel_path))
 
     if len(local_results) == 1:
         result["flat_file"] = local_results[0]
     elif local_results:
         result["flat_files"] = local_results
 
-    return _write(result, args.output)
+    return _write(result, args.output, args.pretty)
+
+
+def _build_session(headers: dict) -> requests.Session:
+    """Session whose connection pool matches FETCH_WORKERS, so concurrent GETs reuse keep-alive connections."""
+    session = requests.Session()
+    session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=FETCH_WORKERS,
+        # Retry refused connections and gateway errors only: a read timeout is not retried, so a
+        # stalled endpoint fails after one --timeout and a partly sent body is never re-requested.
+        max_retries=Retry(
+            total=3, connect=3, read=0, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _load_discovery_cache(cache_path: str) -> dict:
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _headers_digest(headers: dict) -> str:
+    """SHA-256 of the request headers, so cache keys never contain the credentials themselves."""
+    identity = json.dumps(sorted((name.lower(), value) for name, value in headers.items()))
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
 
 
-def _write(obj: dict, output: Optional[str]) -> int:
-    out = json.dumps(obj, indent=2, default=str)
+def _save_discovery_cache(cache_path: str, cache: dict) -> None:
+    """Replace the cache file atomically; a private temp file per writer keeps concurrent runs apart."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(cache_path)), suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f, default=str)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        os.unlink(tmp_path)
+
+
+def _probe_discovery(
+    session: requests.Session, url: str, timeout: int, cached: Optional[dict]
+) -> Tuple[Optional[int], object, Optional[dict], Optional[str]]:
+    """GET one discovery URL. Returns (status_code, data, new cache entry or None, error or None)."""
+    if not (isinstance(cached, dict) and {"etag", "status_code", "data"} <= cached.keys()):
+        cached = None
+    try:
+        # Revalidate cached documents so unchanged ones come back as a bodiless 304.
+        request_headers = {"If-None-Match": cached["etag"]} if cached else None
+        r = session.get(url, timeout=timeout, headers=request_headers)
+        if cached and r.status_code == 304:
+            return cached["status_code"], cached["data"], None, None
+        try:
+            data = _response_json(r)
+        except Exception:
+            data = _text_preview(r, 2000)
+        etag = r.headers.get("ETag")
+        fresh = {"etag": etag, "status_code": r.status_code, "data": data} if r.status_code == 200 and etag else None
+        return r.status_code, data, fresh, None
+    except requests.RequestException as e:
+        return None, None, None, str(e)
+
+
+def _response_json(r: requests.Response):
+    """Parsed JSON body, or None when empty. Uses orjson when installed; raises like r.json() otherwise."""
+    content = r.content
+    if not content:
+        return None
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass  # Non-UTF-8 bodies or NaN literals: let requests detect the encoding and decide.
+    return r.json()
+
+
+def _text_preview(r: requests.Response, limit: int) -> Optional[str]:
+    """First ``limit`` characters of the body; decodes at most ``4 * limit`` bytes instead of r.text."""
+    head = r.content[: limit * 4]
+    if not head:
+        return None
+    try:
+        decoder = codecs.getincrementaldecoder(r.encoding or "utf-8")(errors="replace")
+    except LookupError:
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    # final=False keeps a character split at the cut from turning into U+FFFD.
+    return decoder.decode(head, final=len(head) == len(r.content))[:limit]
+
+
+def _json_bytes(obj, pretty: bool = True) -> bytes:
+    """JSON as UTF-8 bytes (orjson when installed); two-space indented when ``pretty``."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, option=option, default=str)
+    if pretty:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _write(obj: dict, output: Optional[str], pretty: bool = False) -> int:
+    """Write the result as compact JSON; indent when ``pretty`` or when stdout is a terminal."""
     if output:
-        with open(output, "w", encoding="utf-8") as f:
-            f.write(out)
+        with open(output, "wb") as f:
+            f.write(_json_bytes(obj, pretty))
         return 0
-    print(out)
+    sys.stdout.buffer.write(_json_bytes(obj, pretty or sys.stdout.isatty()) + b"\n")
+    sys.stdout.flush()
     return 0
 
 
@@ -390,44 +618,144 @@ def _json_destination_path(destination: str) -> str:
     return str(path.with_name(path.name + ".json"))
 
 
-def _fetch_url(session: requests.Session, url: str, timeout: int, destination: Optional[str] = None) -> dict:
+def _copy_body(r: requests.Response, f) -> None:
+    """Stream the decoded response body into ``f``; the copy loop runs in C with 1 MiB buffers."""
+    r.raw.decode_content = True
     try:
-        r = session.get(url, timeout=timeout, stream=bool(destination))
-        entry = {"status_code": r.status_code}
-        if destination:
+        shutil.copyfileobj(r.raw, f, DOWNLOAD_BUFFER_BYTES)
+    except urllib3.exceptions.HTTPError as e:
+        raise requests.RequestException(str(e)) from e  # Same error surface as iter_content().
+
+
+def _ranged_download_size(response: requests.Response) -> Optional[int]:
+    """Body size when the response can be re-fetched in byte ranges, else None."""
+    headers = response.headers
+    if headers.get("Accept-Ranges", "").lower() != "bytes":
+        return None
+    if headers.get("Content-Encoding", "identity").lower() != "identity":
+        return None  # Ranges would address the encoded bytes, not the decoded body.
+    try:
+        size = int(headers.get("Content-Length", ""))
+    except ValueError:
+        return None
+    return size if size > RANGE_MIN_BYTES else None
+
+
+def _download_ranges(
+    session: requests.Session, url: str, timeout: int, destination: str, size: int, max_concurrency: int
+) -> bool:
+    """Download ``size`` bytes into ``destination`` with parallel Range GETs. Returns False on any failure."""
+
+    def fetch_range(start: int) -> None:
+        end = min(start + RANGE_CHUNK_BYTES, size)
+        with _CONNECTION_SLOTS:
+            r = session.get(url, timeout=timeout, stream=True, headers={"Range": f"bytes={start}-{end - 1}"})
+            with r:
+                if r.status_code != 206:
+                    raise requests.RequestException(f"Range request returned {r.status_code}")
+                with open(destination, "r+b") as f:
+                    f.seek(start)
+                    _copy_body(r, f)
+                    written = f.tell() - start
+        if written != end - start:
+            raise requests.RequestException("Short range response")
+
+    try:
+        with open(destination, "wb") as f:
+            f.truncate(size)
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            list(executor.map(fetch_range, range(0, size, RANGE_CHUNK_BYTES)))
+        return True
+    except (requests.RequestException, OSError):
+        return False
+
+
+def _fetch_url(
+    session: requests.Session,
+    url: str,
+    timeout: int,
+    destination: Optional[str] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> dict:
+    try:
+        with _CONNECTION_SLOTS:
+            r = session.get(url, timeout=timeout, stream=bool(destination))
+            entry = {"status_code": r.status_code}
+            if not destination:
+                try:
+                    entry["data"] = _response_json(r)
+                except Exception:
+                    entry["data"] = _text_preview(r, 5000)
+                return entry
             content_type = r.headers.get("Content-Type")
             content_length = r.headers.get("Content-Length")
+            size = None
             if _looks_like_json_content_type(content_type):
-                actual_destination = _json_destination_path(destination)
+                destination = _json_destination_path(destination)
                 try:
-                    payload = r.json() if r.content else None
-                    with open(actual_destination, "w", encoding="utf-8") as f:
-                        json.dump(payload, f, indent=2, default=str)
-                        f.write("\n")
+                    payload = _response_json(r)
+                    with open(destination, "wb") as f:
+                        f.write(_json_bytes(payload) + b"\n")
                 except Exception:
-                    with open(actual_destination, "wb") as f:
+                    with open(destination, "wb") as f:
                         for chunk in r.iter_content(chunk_size=1024 * 64):
                             if chunk:
                                 f.write(chunk)
-                entry["downloaded_to"] = actual_destination
             else:
-                with open(destination, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=1024 * 64):
-                        if chunk:
-                            f.write(chunk)
-                entry["downloaded_to"] = destination
-            entry["content_type"] = content_type
-            entry["content_length"] = content_length
-            return entry
-        try:
-            entry["data"] = r.json() if r.content else None
-        except Exception:
-            entry["data"] = r.text[:5000] if r.text else None
+                size = _ranged_download_size(r) if max_concurrency > 1 else None
+                if size:
+                    r.close()  # Hand the connection back to the pool before the range GETs need it.
+                else:
+                    with open(destination, "wb") as f:
+                        _copy_body(r, f)
+        if size and not _download_ranges(session, url, timeout, destination, size, max_concurrency):
+            with _CONNECTION_SLOTS:
+                r = session.get(url, timeout=timeout, stream=True)
+                with r:
+                    entry["status_code"] = r.status_code
+                    with open(destination, "wb") as f:
+                        _copy_body(r, f)
+        entry["downloaded_to"] = destination
+        entry["content_type"] = content_type
+        entry["content_length"] = content_length
         return entry
     except requests.RequestException as e:
         return {"error": str(e)}
 
 
+def _fetch_many(
+    session: requests.Session,
+    targets: List[Tuple[str, Optional[str]]],
+    timeout: int,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[dict]:
+    """Fetch (url, destination) targets concurrently; entries are returned in input order.
+
+    Repeated (url, destination) pairs are fetched once and their entry is copied.
+    """
+    unique = list(dict.fromkeys(targets))
+    destinations = [destination for _, destination in unique if destination]
+    if len(unique) < 2 or len(set(destinations)) < len(destinations):
+        # Nothing to overlap, or two targets would write the same file: keep the serial order.
+        entries = [
+            _fetch_url(session, url, timeout, destination=destination, max_concurrency=max_concurrency)
+            for url, destination in unique
+        ]
+    else:
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(unique))) as executor:
+            futures = [
+                executor.submit(
+                    _fetch_url, session, url, timeout, destination=destination, max_concurrency=max_concurrency
+                )
+                for url, destination in unique
+            ]
+            entries = [future.result() for future in futures]
+    if len(unique) == len(targets):
+        return entries
+    by_target = dict(zip(unique, entries))
+    return [dict(by_target[target]) for target in targets]
+
+
 def _fetch_azure_blob_via_keyvault(
     vault_name: str,
     secret_name: str,
@@ -439,27 +767,22 @@ def _fetch_azure_blob_via_keyvault(
 ) -> Optional[dict]:
     """Fetch blob using storage account key from Key Vault. Returns result dict or None on error."""
     try:
-        from azure.identity import DefaultAzureCredential
-        from azure.keyvault.secrets import SecretClient
-        from azure.storage.blob import BlobServiceClient
-
-        credential = DefaultAzureCredential()
-        kv_url = f"https://{vault_name}.vault.azure.net"
-        secret_client = SecretClient(vault_url=kv_url, credential=credential)
-        key = secret_client.get_secret(secret_name).value
+        key = _read_keyvault_secret(vault_name, secret_name)
         ep = "core.windows.net" if "blob.core.windows.net" in endpoint_suffix else endpoint_suffix
         conn = f"DefaultEndpointsProtocol=https;AccountName={account};AccountKey={key};EndpointSuffix={ep}"
-        client = BlobServiceClient.from_connection_string(conn)
+        client = _blob_service_client(conn)
         blob_client = client.get_container_client(container).get_blob_client(blob_path)
-        content = blob_client.download_blob().readall()
+        downloader = blob_client.download_blob(max_concurrency=DEFAULT_MAX_CONCURRENCY)
         entry = {"url": f"https://{account}.{endpoint_suffix}/{container}/{blob_path}", "status_code": 200}
         if destination:
+            # Stream ranged chunks straight to disk instead of buffering the whole blob.
             with open(destination, "wb") as f:
-                f.write(content)
+                downloader.readinto(f)
             entry["downloaded_to"] = destination
-            entry["content_type"] = blob_client.get_blob_properties().content_settings.content_type
-            entry["content_length"] = len(content)
+            entry["content_type"] = downloader.properties.content_settings.content_type
+            entry["content_length"] = downloader.size
         else:
+            content = downloader.readall()
             try:
                 text = content.decode("utf-8")
                 try:
@@ -503,22 +826,24 @@ def _append_query_token(url: str, token: Optional[str]) -> str:
     return f"{url}{sep}{clean}"
 
 
-def _convert_object_uris(uris: List[str], provider: str) -> List[str]:
+# provider -> (URI scheme, label for errors, public HTTPS URL template)
+_OBJECT_URI_PROVIDERS = {
+    "s3": ("s3", "S3", "https://{bucket}.s3.amazonaws.com/{key}"),
+    "gcs": ("gs", "GCS", "https://storage.googleapis.com/{bucket}/{key}"),
+}
+
+
+def _convert_object_uris(uris: List[Tuple[str, str]]) -> List[str]:
+    """Convert (uri, provider) pairs to public HTTPS object URLs, in order."""
     out = []
-    for uri in uris:
+    for uri, provider in uris:
+        scheme, label, template = _OBJECT_URI_PROVIDERS[provider]
         parsed = urlparse(uri)
-        if provider == "s3" and parsed.scheme != "s3":
-            raise ValueError(f"Invalid S3 URI '{uri}'. Expected s3://bucket/key.")
-        if provider == "gcs" and parsed.scheme != "gs":
-            raise ValueError(f"Invalid GCS URI '{uri}'. Expected gs://bucket/key.")
+        if parsed.scheme != scheme:
+            raise ValueError(f"Invalid {label} URI '{uri}'. Expected {scheme}://bucket/key.")
         if not parsed.netloc or not parsed.path or parsed.path == "/":
             raise ValueError(f"Invalid object URI '{uri}'. Missing bucket or key.")
-        bucket = parsed.netloc
-        key = quote(parsed.path.lstrip("/"), safe="/")
-        if provider == "s3":
-            out.append(f"https://{bucket}.s3.amazonaws.com/{key}")
-        else:
-            out.append(f"https://storage.googleapis.com/{bucket}/{key}")
+        out.append(template.format(bucket=parsed.netloc, key=quote(parsed.path.lstrip("/"), safe="/")))
     return out
 
 
@@ -533,26 +858,66 @@ def _read_flat_file(flat_dir: str, rel_path: str) -> dict:
     entry = {"path": rel_path, "full_path": full_path, "size_bytes": size}
     try:
         with open(full_path, "rb") as f:
-            raw = f.read()
+            if not size:
+                entry["text_preview"] = ""
+                return entry
+            # Map the file so previews only touch the bytes they show.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _flat_file_entry(entry, mm)
+    except OSError as e:
+        return {"path": rel_path, "error": str(e)}
+
+
+def _flat_file_entry(entry: dict, mm: mmap.mmap) -> dict:
+    if ORJSON_AVAILABLE:
         try:
-            text = raw.decode("utf-8")
-        except UnicodeDecodeError:
-            entry["binary"] = True
-            entry["preview_hex"] = raw[:120].hex()
+            with memoryview(mm) as view:
+                entry["data"] = orjson.loads(view)
             return entry
+        except orjson.JSONDecodeError:
+            pass
+    # Without orjson, or for JSON it rejects (NaN, big ints), only JSON-looking files are decoded in full;
+    # that one decode also validates the UTF-8.
+    if not ORJSON_AVAILABLE or mm[:64].lstrip()[:1] in (b"{", b"["):
+        try:
+            text = mm[:].decode("utf-8")
+        except UnicodeDecodeError:
+            return _binary_entry(entry, mm)
         try:
             entry["data"] = json.loads(text)
         except Exception:
             entry["text_preview"] = text[:5000]
         return entry
-    except OSError as e:
-        return {"path": rel_path, "error": str(e)}
+    if not _is_utf8(mm):
+        return _binary_entry(entry, mm)
+    entry["text_preview"] = mm[: 5000 * 4].decode("utf-8", errors="ignore")[:5000]
+    return entry
+
+
+def _binary_entry(entry: dict, mm: mmap.mmap) -> dict:
+    entry["binary"] = True
+    entry["preview_hex"] = mm[:120].hex()
+    return entry
+
+
+def _is_utf8(mm: mmap.mmap) -> bool:
+    """True when the mapping is valid UTF-8, checked one DOWNLOAD_BUFFER_BYTES slice at a time."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        with memoryview(mm) as view:
+            for start in range(0, len(view), DOWNLOAD_BUFFER_BYTES):
+                decoder.decode(view[start : start + DOWNLOAD_BUFFER_BYTES])
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return False
+    return True
 
 
 def _safe_join(base_dir: str, rel_path: str) -> str:
     candidate = os.path.abspath(os.path.join(base_dir, rel_path))
     base_abs = os.path.abspath(base_dir)
-    if os.path.commonpath([candidate, base_abs]) != base_abs:
+    # Plain prefix test on the normalized paths; the separator stops "/data2" matching "/data".
+    if candidate != base_abs and not candidate.startswith(base_abs.rstrip(os.sep) + os.sep):
         raise ValueError(f"Invalid flat file path '{rel_path}'. Must stay within flat folder.")
     return candidate
 
@@ -5,10 +5,13 @@ from __future__ import annotations
 
 import argparse
 import os
-import subprocess
 import sys
 from pathlib import Path
 
+# Call api_reader in-process rather than spawning a new interpreter per invocation.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from api_reader import main as api_main  # noqa: E402
+
 DEFAULT_BASE_URL = "https://skillssimapifilip20260218.azurewebsites.net"
 
 
@@ -20,8 +23,7 @@ def main() -> int:
     parser.add_argument("--output", required=True)
     args = parser.parse_args()
 
-    api_reader = Path(__file__).resolve().parents[1] / "api_reader.py"
-    cmd = [sys.executable, str(api_reader), args.base_url, "--output", args.output]
+    cmd = [args.base_url, "--output", args.output]
 
     if args.discover:
         cmd.append("--discover")
@@ -33,7 +35,7 @@ def main() -> int:
     for p in paths:
         cmd.extend(["--path", p])
 
-    return subprocess.run(cmd).returncode
+    return api_main(cmd)
 
 
 if __name__ == "__main__":
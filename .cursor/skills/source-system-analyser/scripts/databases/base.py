@@ -5,14 +5,271 @@ Each database (PostgreSQL, MSSQL, Oracle) implements this interface to provide
 dialect-specific SQL generation and introspection.
 """
 
+import functools
+import logging
+import json
+import os
+import re
+import tempfile
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Set
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple
 
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+# Introspection methods cached per adapter instance, with the position of ``schema`` after ``engine``
+# (None for per-engine lookups that take no schema).
+_MEMOIZED_METHODS = {
+    "resolve_default_schema": None,
+    "fetch_database_timezone": None,
+    "fetch_schema_bulk": 0,
+    "fetch_check_constraints": 0,
+    "fetch_enum_columns": 0,
+    "fetch_unique_constraints": 0,
+    "fetch_table_descriptions": 0,
+    "fetch_column_descriptions": 0,
+    "fetch_cdc_enabled_tables": 0,
+    "fetch_partition_columns_bulk": 0,
+    "detect_cdc_enabled": 1,
+    "detect_partition_columns": 1,
+}
+
+
+def _memoize(fn: Callable, schema_pos: Optional[int]) -> Callable:
+    """Cache ``fn`` results in the adapter's ``_cache`` keyed by engine, schema and table."""
+
+    if schema_pos is None:
+        @functools.wraps(fn)
+        def engine_wrapper(self, engine, *args, **kwargs):
+            if args or kwargs:
+                return fn(self, engine, *args, **kwargs)
+            key = (fn.__qualname__, id(engine), None, ())
+            try:
+                return self._cache[key]
+            except KeyError:
+                value = self._cache[key] = fn(self, engine)
+                return value
+
+        return engine_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(self, engine, *args, **kwargs):
+        if kwargs or len(args) <= schema_pos:
+            return fn(self, engine, *args, **kwargs)
+        # At most (table_name, schema) identify the call; detect_partition_columns' columns follow from them.
+        key = (fn.__qualname__, id(engine), args[schema_pos], args[:2])
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = fn(self, engine, *args)
+            return value
+
+    return wrapper
+
+
+def _memoize_methods(cls: type) -> None:
+    for name, schema_pos in _MEMOIZED_METHODS.items():
+        fn = cls.__dict__.get(name)
+        if fn is not None and not getattr(fn, "__isabstractmethod__", False):
+            setattr(cls, name, _memoize(fn, schema_pos))
+
+
+# Tagged JSON forms for the container types introspection results use besides lists and str-keyed dicts.
+_CACHE_TAGS = ("__tuple__", "__frozenset__", "__dict__")
+
+
+def _encode_cached(value: Any) -> Any:
+    """JSON-safe form of a cached introspection value; tuples, frozensets and non-str keys round-trip."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode_cached(item) for item in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode_cached(item) for item in value]}
+    if isinstance(value, (set, frozenset)):
+        return {"__frozenset__": [_encode_cached(item) for item in value]}
+    if isinstance(value, dict):
+        if all(isinstance(key, str) and key not in _CACHE_TAGS for key in value):
+            return {key: _encode_cached(item) for key, item in value.items()}
+        return {"__dict__": [[_encode_cached(key), _encode_cached(item)] for key, item in value.items()]}
+    raise TypeError(f"{type(value).__name__} values are not cacheable")
+
+
+def _decode_cached(value: Any) -> Any:
+    """Inverse of _encode_cached()."""
+    if isinstance(value, list):
+        return [_decode_cached(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if len(value) == 1:
+        tag, items = next(iter(value.items()))
+        if tag == "__tuple__":
+            return tuple(_decode_cached(item) for item in items)
+        if tag == "__frozenset__":
+            return frozenset(_decode_cached(item) for item in items)
+        if tag == "__dict__":
+            return {_decode_cached(key): _decode_cached(item) for key, item in items}
+    return {key: _decode_cached(item) for key, item in value.items()}
 
 
 class DialectAdapter(ABC):
-    """Abstract base for database dialect adapters."""
+    """Abstract base for database dialect adapters.
+
+    Introspection results (fetch_*, detect_* and the default schema) are cached per instance;
+    call invalidate() after DDL.
+    """
+
+    def __init__(self) -> None:
+        self._cache: Dict[tuple, Any] = {}
+        self._ddl_markers: Dict[tuple, str] = {}
+        # (id(engine), schema) pairs where a lookup fell back to an empty or partial result.
+        self._failed_lookups: Set[tuple] = set()
+        self._local = threading.local()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _memoize_methods(cls)
+
+    @contextmanager
+    def session(self, engine: Engine) -> Iterator[Connection]:
+        """Pin one connection for this thread's adapter queries on ``engine`` until the block exits."""
+        pinned = self._pinned_connections()
+        if id(engine) in pinned:
+            yield pinned[id(engine)]
+            return
+        with engine.connect() as conn:
+            pinned[id(engine)] = conn
+            try:
+                yield conn
+            finally:
+                del pinned[id(engine)]
+
+    @contextmanager
+    def _connect(self, engine: Engine) -> Iterator[Connection]:
+        """Connection for one adapter query: the session's pinned connection, or a fresh one."""
+        conn = self._pinned_connections().get(id(engine))
+        if conn is None:
+            with engine.connect() as conn:
+                yield conn
+            return
+        try:
+            yield conn
+        except Exception:
+            # Keep the pinned connection usable; PostgreSQL aborts the transaction after a failed statement.
+            conn.rollback()
+            raise
+
+    def _pinned_connections(self) -> Dict[int, Connection]:
+        pinned = getattr(self._local, "connections", None)
+        if pinned is None:
+            pinned = self._local.connections = {}
+        return pinned
+
+    def invalidate(self, schema: Optional[str] = None) -> None:
+        """Drop cached introspection results for ``schema``, or all of them."""
+        if schema is None:
+            self._cache.clear()
+            self._failed_lookups.clear()
+            return
+        for key in [key for key in self._cache if key[2] == schema]:
+            del self._cache[key]
+        self._failed_lookups = {key for key in self._failed_lookups if key[1] != schema}
+
+    def _lookup_failed(self, engine: Engine, schema: str) -> None:
+        """Record that a schema lookup returned a fallback result, so save_cache() does not persist it."""
+        self._failed_lookups.add((id(engine), schema))
+
+    def fetch_ddl_marker(self, engine: Engine, schema: str) -> Optional[str]:
+        """Return a value that changes whenever DDL touches the schema, or None if the dialect has none."""
+        return None
+
+    @staticmethod
+    def _cache_file_key(engine: Engine, schema: str) -> tuple:
+        return (engine.url.render_as_string(hide_password=True), schema)
+
+    @staticmethod
+    def _read_cache_file(path: str) -> Dict[tuple, Any]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+            data = {}
+            for entry in document["entries"]:
+                results = {
+                    (qualname, _decode_cached(args)): _decode_cached(value)
+                    for qualname, args, value in entry["results"]
+                }
+                data[(entry["database"], entry["schema"])] = {"ddl_marker": entry["ddl_marker"], "results": results}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("Ignoring unreadable introspection cache %s: %s", path, e)
+            return {}
+        return data
+
+    def load_cache(self, path: str, engine: Engine, schema: str) -> bool:
+        """Seed the introspection cache for ``schema`` from ``path`` if its DDL marker still matches.
+
+        Returns True on a warm start. The file is JSON written by save_cache().
+        """
+        try:
+            marker = self.fetch_ddl_marker(engine, schema)
+        except Exception as e:
+            logger.warning("Could not read DDL marker for schema %s: %s", schema, e)
+            return False
+        if marker is None:
+            return False
+        self._ddl_markers[(id(engine), schema)] = marker
+        entry = self._read_cache_file(path).get(self._cache_file_key(engine, schema))
+        if not entry or entry.get("ddl_marker") != marker:
+            return False
+        for (qualname, args), value in entry["results"].items():
+            self._cache.setdefault((qualname, id(engine), schema, args), value)
+        return True
+
+    def save_cache(self, path: str, engine: Engine, schema: str) -> None:
+        """Write cached introspection results for ``schema`` to ``path``, stamped with the marker seen by load_cache()."""
+        marker = self._ddl_markers.get((id(engine), schema))
+        if marker is None:
+            return
+        if (id(engine), schema) in self._failed_lookups:
+            # The empty fallbacks would otherwise be served until the schema's DDL changes.
+            logger.warning("Not saving the introspection cache for schema %s: a catalog lookup failed", schema)
+            return
+        results = {
+            (key[0], key[3]): value
+            for key, value in self._cache.items()
+            if key[1] == id(engine) and key[2] == schema
+        }
+        data = self._read_cache_file(path)
+        data[self._cache_file_key(engine, schema)] = {"ddl_marker": marker, "results": results}
+        entries = []
+        for (database, cached_schema), entry in data.items():
+            encoded = []
+            for (qualname, args), value in entry["results"].items():
+                try:
+                    encoded.append([qualname, _encode_cached(args), _encode_cached(value)])
+                except TypeError as e:
+                    logger.debug("Not caching %s for schema %s: %s", qualname, cached_schema, e)
+            entries.append({
+                "database": database,
+                "schema": cached_schema,
+                "ddl_marker": entry["ddl_marker"],
+                "results": encoded,
+            })
+        # A private temp file per writer, so concurrent runs never interleave writes.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"entries": entries}, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
     @abstractmethod
     def quote_identifier(self, name: str) -> str:
@@ -49,13 +306,13 @@ class DialectAdapter(ABC):
         pass
 
     @abstractmethod
-    def fetch_enum_columns(self, engine: Engine, schema: str) -> Dict[str, Dict[str, List[str]]]:
-        """Fetch columns using ENUM types. Returns {table: {column: [values]}}. Empty for dialects without ENUM."""
+    def fetch_enum_columns(self, engine: Engine, schema: str) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+        """Fetch columns using ENUM types. Returns {table: {column: (values)}}. Empty for dialects without ENUM."""
         pass
 
     @abstractmethod
-    def fetch_unique_constraints(self, engine: Engine, schema: str) -> Dict[str, Set[str]]:
-        """Fetch columns with UNIQUE constraints. Returns {table: {col1, col2, ...}}."""
+    def fetch_unique_constraints(self, engine: Engine, schema: str) -> Dict[str, FrozenSet[str]]:
+        """Fetch columns with UNIQUE constraints. Returns {table: frozenset({col1, col2, ...})}."""
         pass
 
     @abstractmethod
@@ -63,6 +320,18 @@ class DialectAdapter(ABC):
         """Check if the table has CDC-friendly settings."""
         pass
 
+    def fetch_cdc_enabled_tables(self, engine: Engine, schema: str) -> FrozenSet[str]:
+        """Return names of tables in the schema with CDC-friendly settings. Empty for dialects without CDC."""
+        return frozenset()
+
+    def fetch_partition_columns_bulk(self, engine: Engine, schema: str) -> Dict[str, List[str]]:
+        """Return declared partition key columns keyed by table, for every partitioned table in the schema."""
+        return {}
+
+    def fetch_partition_columns(self, engine: Engine, table_name: str, schema: str) -> List[str]:
+        """Return the declared partition key columns of one table (no heuristics), from the bulk lookup."""
+        return list(self.fetch_partition_columns_bulk(engine, schema).get(table_name, []))
+
     def fetch_table_descriptions(self, engine: Engine, schema: str) -> Dict[str, str]:
         """Return table descriptions/comments keyed by table name."""
         return {}
@@ -71,10 +340,109 @@ class DialectAdapter(ABC):
         """Return column descriptions/comments keyed by table then column."""
         return {}
 
-    _PARTITION_NAME_HINTS = (
+    def fetch_schema_bulk(self, engine: Engine, schema: str) -> Dict[str, Any]:
+        """Fetch CHECK/UNIQUE constraints, ENUM columns and table/column descriptions for a schema.
+
+        Returns {checks, uniques, enums, table_desc, col_desc}, each shaped like the matching fetch_* result.
+        Dialects override this with a single catalog round-trip that the per-kind methods read from;
+        the default calls those methods one by one.
+        """
+        return {
+            "checks": self.fetch_check_constraints(engine, schema),
+            "uniques": self.fetch_unique_constraints(engine, schema),
+            "enums": self.fetch_enum_columns(engine, schema),
+            "table_desc": self.fetch_table_descriptions(engine, schema),
+            "col_desc": self.fetch_column_descriptions(engine, schema),
+        }
+
+    def fetch_all_parallel(self, engine: Engine, schema: str, max_workers: int = 3) -> Dict[str, Any]:
+        """Run the independent schema-level catalog queries concurrently and return their merged results.
+
+        Returns fetch_schema_bulk()'s dict plus cdc_tables and partition_columns. Each worker checks out
+        its own pooled connection (session pins are per thread); results land in the introspection cache.
+        """
+        fetches = {
+            "bulk": self.fetch_schema_bulk,
+            "cdc_tables": self.fetch_cdc_enabled_tables,
+            "partition_columns": self.fetch_partition_columns_bulk,
+        }
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(fetches)))) as pool:
+            futures = {name: pool.submit(fetch, engine, schema) for name, fetch in fetches.items()}
+            results = {name: future.result() for name, future in futures.items()}
+        merged = dict(results.pop("bulk"))
+        merged.update(results)
+        return merged
+
+    # Log labels for the kinds of a schema bulk query.
+    _SCHEMA_BULK_KINDS = {
+        "checks": "CHECK constraints",
+        "uniques": "UNIQUE constraints",
+        "enums": "ENUM columns",
+        "table_desc": "table descriptions",
+        "col_desc": "column descriptions",
+    }
+
+    def _schema_bulk_by_kind(
+        self, engine: Engine, schema: str, queries: Dict[str, Any], params: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Fallback for a failed bulk query: run each kind's query alone so one failure only loses that kind."""
+        rows: List[tuple] = []
+        for kind, query in queries.items():
+            try:
+                with self._connect(engine) as conn:
+                    rows.extend(conn.execute(query, params))
+            except Exception as e:
+                logger.warning(f"Could not fetch {self._SCHEMA_BULK_KINDS.get(kind, kind)}: {e}")
+                self._lookup_failed(engine, schema)
+        return self._schema_bulk_from_rows(rows)
+
+    @staticmethod
+    def _schema_bulk_from_rows(rows) -> Dict[str, Any]:
+        """Bucket (kind, table, column, name, value, sort_order) rows of a UNION ALL bulk query by kind."""
+        checks: Dict[str, List[Dict]] = defaultdict(list)
+        uniques: Dict[str, Set[str]] = defaultdict(set)
+        enum_labels: Dict[str, Dict[str, List[tuple]]] = defaultdict(lambda: defaultdict(list))
+        table_desc: Dict[str, str] = {}
+        col_desc: Dict[str, Dict[str, str]] = defaultdict(dict)
+        for kind, table, column, name, value, sort_order in rows:
+            if kind == "checks":
+                checks[table].append({"column": column, "constraint_name": name, "check_clause": value})
+            elif kind == "uniques":
+                uniques[table].add(column)
+            elif kind == "enums":
+                enum_labels[table][column].append((sort_order, value))
+            elif kind == "table_desc":
+                if value:
+                    table_desc[str(table)] = str(value)
+            elif kind == "col_desc":
+                if value:
+                    col_desc[str(table)][str(column)] = str(value)
+        # Cached results are shared by every caller, so the sets and label lists are frozen.
+        enums = {
+            table: {column: tuple(label for _, label in sorted(labels, key=lambda pair: pair[0])) for column, labels in cols.items()}
+            for table, cols in enum_labels.items()
+        }
+        return {
+            "checks": dict(checks),
+            "uniques": {table: frozenset(columns) for table, columns in uniques.items()},
+            "enums": enums,
+            "table_desc": table_desc,
+            "col_desc": dict(col_desc),
+        }
+
+    @staticmethod
+    def _group_rows(rows) -> Dict[Any, List[Any]]:
+        """Group (key, value) rows into {key: [values]}, keeping row order within each key."""
+        grouped: Dict[Any, List[Any]] = defaultdict(list)
+        for key, value in rows:
+            grouped[key].append(value)
+        return dict(grouped)
+
+    _PARTITION_NAME_HINTS = frozenset((
         "order_date", "event_time", "event_date", "payment_date", "transaction_date",
         "created_at", "changed_at", "log_date", "partition_date", "report_date",
-    )
+    ))
+    _PARTITION_NAME_RE = re.compile(r"_date|_time|_at")
     _PARTITION_TYPE_PREFIXES = ("date", "timestamp", "timestamptz")
 
     def detect_partition_columns(
@@ -82,14 +450,16 @@ class DialectAdapter(ABC):
     ) -> List[str]:
         """Detect partition key columns. Falls back to heuristic from columns if not supported."""
         candidates = []
+        type_prefixes = self._PARTITION_TYPE_PREFIXES
+        name_hints = self._PARTITION_NAME_HINTS
+        name_search = self._PARTITION_NAME_RE.search
         for col in columns:
+            # Most columns fail the type test, so only date/timestamp columns pay for lowering the name.
+            if not col.get("type", "").lower().startswith(type_prefixes):
+                continue
             name_lower = col["name"].lower()
-            col_type = col.get("type", "").lower()
-            if any(col_type.startswith(p) for p in self._PARTITION_TYPE_PREFIXES):
-                if name_lower in self._PARTITION_NAME_HINTS or any(
-                    h in name_lower for h in ["_date", "_time", "_at"]
-                ):
-                    candidates.append(col["name"])
+            if name_lower in name_hints or name_search(name_lower):
+                candidates.append(col["name"])
         return candidates
 
     @abstractmethod
@@ -106,6 +476,9 @@ class DialectAdapter(ABC):
             return (f"SELECT {lc} * FROM {qt}", {})
         return (f"SELECT * FROM {qt} {lc}", {})
 
+    # Late-arriving check SQL with {qt}, {q_sys}, {q_biz} and {biz_expr} placeholders; None if unsupported.
+    _LATE_SQL_TEMPLATE: Optional[str] = None
+
     def get_late_arriving_biz_expr(self, biz_name: str, biz_type: str) -> Optional[str]:
         """Return dialect-specific expression for business date in lag computation.
         Return None to use default (PostgreSQL-style CAST AS TIMESTAMP)."""
@@ -120,12 +493,28 @@ class DialectAdapter(ABC):
         biz_expr: str,
     ) -> str:
         """Build the SQL for late-arriving data check. Returns full query string."""
-        raise NotImplementedError("Late-arriving data check not implemented for this dialect")
+        if self._LATE_SQL_TEMPLATE is None:
+            raise NotImplementedError("Late-arriving data check not implemented for this dialect")
+        return self._LATE_SQL_TEMPLATE.format_map({
+            "qt": self.quote_table(schema, table_name),
+            "q_sys": self.quote_column(sys_col),
+            "q_biz": self.quote_column(biz_col),
+            "biz_expr": biz_expr,
+        })
 
     def supports_late_arriving_check(self) -> bool:
         """Whether this dialect supports the late-arriving data check."""
         return False
 
+    _LATE_ARRIVING_TYPE_HINTS = ("date", "timestamp")
+
+    def can_run_late_arriving(self, biz_type: str, sys_type: str) -> bool:
+        """Whether both lowercased column types are dates/timestamps, so the lag query can run. Unknown types pass."""
+        return all(
+            not col_type or any(hint in col_type for hint in self._LATE_ARRIVING_TYPE_HINTS)
+            for col_type in (biz_type, sys_type)
+        )
+
     def supports_nulls_first(self) -> bool:
         """Whether ORDER BY supports NULLS FIRST."""
         return False
@@ -136,3 +525,6 @@ class DialectAdapter(ABC):
         if self.supports_nulls_first():
             return f"{quoted} NULLS FIRST"
         return f"CASE WHEN {quoted} IS NULL THEN 0 ELSE 1 END, {quoted}"
+
+
+_memoize_methods(DialectAdapter)
@@ -1,7 +1,7 @@
 """Microsoft SQL Server / Azure SQL dialect adapter."""
 
 import logging
-from typing import Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
@@ -10,10 +10,129 @@ from .base import DialectAdapter
 
 logger = logging.getLogger(__name__)
 
+_MSSQL_TIMEZONE_SQL = text("SELECT CURRENT_TIMEZONE()")
+
+# Native sys.* catalog views; INFORMATION_SCHEMA on SQL Server is a join-heavy wrapper over them.
+# Table-level CHECKs (parent_column_id = 0) list every column their expression references.
+# One SELECT per kind; together they form the bulk UNION ALL query, and each also runs alone as its fallback.
+_MSSQL_SCHEMA_KIND_SQL = {
+    "checks": """
+    SELECT CAST('checks' AS varchar(16)) AS kind, t.name AS table_name, c.name AS column_name, cc.name AS constraint_name,
+        CAST(cc.definition AS nvarchar(max)) AS value, CAST(NULL AS float) AS sort_order
+    FROM sys.check_constraints cc
+    JOIN sys.tables t ON t.object_id = cc.parent_object_id
+    JOIN sys.schemas s ON s.schema_id = t.schema_id
+    JOIN sys.columns c
+        ON c.object_id = cc.parent_object_id
+        AND (c.column_id = cc.parent_column_id
+             OR (cc.parent_column_id = 0 AND c.column_id IN (
+                 SELECT d.referenced_minor_id FROM sys.sql_expression_dependencies d
+                 WHERE d.referencing_id = cc.object_id)))
+    WHERE s.name = :schema
+        AND cc.name NOT LIKE '%_not_null'
+""",
+    "uniques": """
+    SELECT 'uniques', t.name, c.name, NULL, NULL, NULL
+    FROM sys.key_constraints kc
+    JOIN sys.tables t ON t.object_id = kc.parent_object_id
+    JOIN sys.schemas s ON s.schema_id = t.schema_id
+    JOIN sys.index_columns ic ON ic.object_id = kc.parent_object_id AND ic.index_id = kc.unique_index_id
+    JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+    WHERE kc.type = 'UQ' AND s.name = :schema
+""",
+    "table_desc": """
+    SELECT 'table_desc', t.name, NULL, NULL, CAST(ep.value AS nvarchar(max)), NULL
+    FROM sys.tables t
+    JOIN sys.schemas s ON s.schema_id = t.schema_id
+    JOIN sys.extended_properties ep
+      ON ep.major_id = t.object_id
+     AND ep.minor_id = 0
+     AND ep.name = 'MS_Description'
+    WHERE s.name = :schema
+""",
+    "col_desc": """
+    SELECT 'col_desc', t.name, c.name, NULL, CAST(ep.value AS nvarchar(max)), NULL
+    FROM sys.tables t
+    JOIN sys.schemas s ON s.schema_id = t.schema_id
+    JOIN sys.columns c ON c.object_id = t.object_id
+    JOIN sys.extended_properties ep
+      ON ep.major_id = c.object_id
+     AND ep.minor_id = c.column_id
+     AND ep.name = 'MS_Description'
+    WHERE s.name = :schema
+""",
+}
+_MSSQL_SCHEMA_KIND_QUERIES = {kind: text(sql) for kind, sql in _MSSQL_SCHEMA_KIND_SQL.items()}
+_MSSQL_SCHEMA_BULK_SQL = text("    UNION ALL".join(_MSSQL_SCHEMA_KIND_SQL.values()))
+
+_MSSQL_CHANGE_TRACKING_TABLES_SQL = text("""
+    SELECT t.name FROM sys.change_tracking_tables ct
+    JOIN sys.tables t ON ct.object_id = t.object_id
+    JOIN sys.schemas s ON t.schema_id = s.schema_id
+    WHERE s.name = :schema
+""")
+
+_MSSQL_CDC_TABLES_SQL = text("""
+    SELECT t.name FROM cdc.change_tables ct
+    JOIN sys.tables t ON ct.source_object_id = t.object_id
+    JOIN sys.schemas s ON t.schema_id = s.schema_id
+    WHERE s.name = :schema
+""")
+
+_MSSQL_PARTITION_KEYS_SQL = text("""
+    SELECT t.name, c.name
+    FROM sys.indexes i
+    JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+    JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+    JOIN sys.tables t ON i.object_id = t.object_id
+    JOIN sys.schemas s ON t.schema_id = s.schema_id
+    WHERE s.name = :schema
+        AND i.type = 1
+        AND i.data_space_id IN (SELECT data_space_id FROM sys.data_spaces WHERE type = 'P')
+    ORDER BY t.name, ic.key_ordinal
+""")
+
+# modify_date misses extended properties and CDC/change tracking toggles, so those are checksummed too.
+_MSSQL_DDL_MARKER_SQL = text("""
+    SELECT CONCAT(
+        (SELECT CONCAT(COUNT(*), ':', CONVERT(varchar(33), MAX(o.modify_date), 126))
+         FROM sys.objects o WHERE o.schema_id = SCHEMA_ID(:schema)),
+        '|',
+        (SELECT CHECKSUM_AGG(CHECKSUM(t.object_id, t.is_tracked_by_cdc, ct.object_id))
+         FROM sys.tables t
+         LEFT JOIN sys.change_tracking_tables ct ON ct.object_id = t.object_id
+         WHERE t.schema_id = SCHEMA_ID(:schema)),
+        '|',
+        (SELECT CHECKSUM_AGG(CHECKSUM(ep.major_id, ep.minor_id, CAST(ep.value AS nvarchar(4000))))
+         FROM sys.extended_properties ep
+         JOIN sys.objects o ON o.object_id = ep.major_id
+         WHERE ep.class = 1 AND o.schema_id = SCHEMA_ID(:schema))
+    )
+""")
+
 
 class MssqlAdapter(DialectAdapter):
     """Microsoft SQL Server / Azure SQL dialect adapter."""
 
+    # One scan: the p95 window rides along each lag row, then every aggregate reads the same set.
+    _LATE_SQL_TEMPLATE = """
+        WITH lags AS (
+            SELECT DATEDIFF(SECOND, {biz_expr}, {q_sys}) / 3600.0 AS lh
+            FROM {qt}
+            WHERE {q_sys} IS NOT NULL AND {q_biz} IS NOT NULL AND {q_sys} >= {biz_expr}
+        ), ranked AS (
+            SELECT lh, PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY lh) OVER () AS p95
+            FROM lags
+        )
+        SELECT COUNT(*) AS total,
+            SUM(CASE WHEN lh > 24 THEN 1 ELSE 0 END) AS late_1d,
+            SUM(CASE WHEN lh > 168 THEN 1 ELSE 0 END) AS late_7d,
+            ROUND(MIN(lh), 2) AS min_h, ROUND(AVG(lh), 2) AS avg_h,
+            ROUND(MIN(p95), 2) AS p95_h,
+            ROUND(MAX(lh), 2) AS max_h
+        FROM ranked
+    """
+
     def quote_identifier(self, name: str) -> str:
         return f"[{name}]"
 
@@ -22,146 +141,71 @@ class MssqlAdapter(DialectAdapter):
 
     def fetch_database_timezone(self, engine: Engine) -> str:
         try:
-            with engine.connect() as conn:
-                return conn.execute(text("SELECT CURRENT_TIMEZONE()")).scalar() or "Unknown"
+            with self._connect(engine) as conn:
+                return conn.execute(_MSSQL_TIMEZONE_SQL).scalar() or "Unknown"
         except Exception:
             return "Unknown"
 
-    def fetch_check_constraints(self, engine: Engine, schema: str) -> Dict[str, List[Dict]]:
-        result = {}
-        query = text("""
-            SELECT tc.TABLE_NAME, ccu.COLUMN_NAME, tc.CONSTRAINT_NAME, cc.CHECK_CLAUSE
-            FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-            JOIN INFORMATION_SCHEMA.CHECK_CONSTRAINTS cc
-                ON tc.CONSTRAINT_NAME = cc.CONSTRAINT_NAME
-                AND tc.CONSTRAINT_SCHEMA = cc.CONSTRAINT_SCHEMA
-            JOIN INFORMATION_SCHEMA.CONSTRAINT_COLUMN_USAGE ccu
-                ON tc.CONSTRAINT_NAME = ccu.CONSTRAINT_NAME
-                AND tc.TABLE_SCHEMA = ccu.TABLE_SCHEMA
-            WHERE tc.CONSTRAINT_TYPE = 'CHECK'
-                AND tc.TABLE_SCHEMA = :schema
-                AND tc.CONSTRAINT_NAME NOT LIKE '%_not_null'
-        """)
+    def fetch_ddl_marker(self, engine: Engine, schema: str) -> Optional[str]:
+        with self._connect(engine) as conn:
+            return conn.execute(_MSSQL_DDL_MARKER_SQL, {"schema": schema}).scalar()
+
+    def fetch_schema_bulk(self, engine: Engine, schema: str) -> Dict[str, Any]:
+        params = {"schema": schema}
         try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema}).fetchall():
-                    result.setdefault(row[0], []).append({
-                        "column": row[1], "constraint_name": row[2], "check_clause": row[3]
-                    })
+            with self._connect(engine) as conn:
+                return self._schema_bulk_from_rows(conn.execute(_MSSQL_SCHEMA_BULK_SQL, params))
         except Exception as e:
-            logger.warning(f"Could not fetch CHECK constraints: {e}")
-        return result
+            logger.warning(f"Bulk schema catalog query failed, querying each kind separately: {e}")
+            return self._schema_bulk_by_kind(engine, schema, _MSSQL_SCHEMA_KIND_QUERIES, params)
+
+    def fetch_check_constraints(self, engine: Engine, schema: str) -> Dict[str, List[Dict]]:
+        return self.fetch_schema_bulk(engine, schema)["checks"]
 
-    def fetch_enum_columns(self, engine: Engine, schema: str) -> Dict[str, Dict[str, List[str]]]:
+    def fetch_enum_columns(self, engine: Engine, schema: str) -> Dict[str, Dict[str, Tuple[str, ...]]]:
         return {}
 
-    def fetch_unique_constraints(self, engine: Engine, schema: str) -> Dict[str, Set[str]]:
-        result = {}
-        query = text("""
-            SELECT tc.TABLE_NAME, kcu.COLUMN_NAME
-            FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
-            JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
-                ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
-                AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
-            WHERE tc.CONSTRAINT_TYPE = 'UNIQUE' AND tc.TABLE_SCHEMA = :schema
-        """)
-        try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema}).fetchall():
-                    result.setdefault(row[0], set()).add(row[1])
-        except Exception as e:
-            logger.warning(f"Could not fetch UNIQUE constraints: {e}")
-        return result
+    def fetch_unique_constraints(self, engine: Engine, schema: str) -> Dict[str, FrozenSet[str]]:
+        return self.fetch_schema_bulk(engine, schema)["uniques"]
 
-    def detect_cdc_enabled(self, engine: Engine, table_name: str, schema: str) -> bool:
+    def fetch_cdc_enabled_tables(self, engine: Engine, schema: str) -> FrozenSet[str]:
+        tables: Set[str] = set()
+        try:
+            with self._connect(engine) as conn:
+                tables.update(conn.execute(_MSSQL_CHANGE_TRACKING_TABLES_SQL, {"schema": schema}).scalars())
+        except Exception:
+            self._lookup_failed(engine, schema)
+            return frozenset()
         try:
-            with engine.connect() as conn:
-                row = conn.execute(text("""
-                    SELECT 1 FROM sys.change_tracking_tables ct
-                    JOIN sys.tables t ON ct.object_id = t.object_id
-                    JOIN sys.schemas s ON t.schema_id = s.schema_id
-                    WHERE s.name = :schema AND t.name = :table
-                """), {"schema": schema, "table": table_name}).fetchone()
-                if row:
-                    return True
-                row = conn.execute(text("""
-                    SELECT 1 FROM cdc.change_tables ct
-                    JOIN sys.tables t ON ct.source_object_id = t.object_id
-                    JOIN sys.schemas s ON t.schema_id = s.schema_id
-                    WHERE s.name = :schema AND t.name = :table
-                """), {"schema": schema, "table": table_name}).fetchone()
-                return row is not None
+            with self._connect(engine) as conn:
+                tables.update(conn.execute(_MSSQL_CDC_TABLES_SQL, {"schema": schema}).scalars())
         except Exception:
-            return False
+            pass  # cdc.change_tables only exists once CDC has been enabled on the database.
+        return frozenset(tables)
+
+    def detect_cdc_enabled(self, engine: Engine, table_name: str, schema: str) -> bool:
+        return table_name in self.fetch_cdc_enabled_tables(engine, schema)
 
     def fetch_table_descriptions(self, engine: Engine, schema: str) -> Dict[str, str]:
-        result: Dict[str, str] = {}
-        query = text(
-            """
-            SELECT t.name AS table_name, CAST(ep.value AS nvarchar(max)) AS description
-            FROM sys.tables t
-            JOIN sys.schemas s ON s.schema_id = t.schema_id
-            LEFT JOIN sys.extended_properties ep
-              ON ep.major_id = t.object_id
-             AND ep.minor_id = 0
-             AND ep.name = 'MS_Description'
-            WHERE s.name = :schema
-            """
-        )
-        try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema}).fetchall():
-                    if row[1]:
-                        result[str(row[0])] = str(row[1])
-        except Exception as e:
-            logger.warning(f"Could not fetch table descriptions: {e}")
-        return result
+        return self.fetch_schema_bulk(engine, schema)["table_desc"]
 
     def fetch_column_descriptions(self, engine: Engine, schema: str) -> Dict[str, Dict[str, str]]:
-        result: Dict[str, Dict[str, str]] = {}
-        query = text(
-            """
-            SELECT t.name AS table_name, c.name AS column_name, CAST(ep.value AS nvarchar(max)) AS description
-            FROM sys.tables t
-            JOIN sys.schemas s ON s.schema_id = t.schema_id
-            JOIN sys.columns c ON c.object_id = t.object_id
-            LEFT JOIN sys.extended_properties ep
-              ON ep.major_id = c.object_id
-             AND ep.minor_id = c.column_id
-             AND ep.name = 'MS_Description'
-            WHERE s.name = :schema
-            """
-        )
+        return self.fetch_schema_bulk(engine, schema)["col_desc"]
+
+    def fetch_partition_columns_bulk(self, engine: Engine, schema: str) -> Dict[str, List[str]]:
         try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema}).fetchall():
-                    if row[2]:
-                        result.setdefault(str(row[0]), {})[str(row[1])] = str(row[2])
-        except Exception as e:
-            logger.warning(f"Could not fetch column descriptions: {e}")
-        return result
+            with self._connect(engine) as conn:
+                return self._group_rows(conn.execute(_MSSQL_PARTITION_KEYS_SQL, {"schema": schema}))
+        except Exception:
+            self._lookup_failed(engine, schema)
+            return {}
 
     def detect_partition_columns(
         self, engine: Engine, table_name: str, schema: str, columns: List[Dict]
     ) -> List[str]:
-        try:
-            with engine.connect() as conn:
-                row = conn.execute(text("""
-                    SELECT c.name
-                    FROM sys.indexes i
-                    JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
-                    JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-                    JOIN sys.tables t ON i.object_id = t.object_id
-                    JOIN sys.schemas s ON t.schema_id = s.schema_id
-                    WHERE s.name = :schema AND t.name = :table
-                        AND i.type = 1
-                        AND i.data_space_id IN (SELECT data_space_id FROM sys.data_spaces WHERE type = 'P')
-                    ORDER BY ic.key_ordinal
-                """), {"schema": schema, "table": table_name}).fetchall()
-                if row:
-                    return [r[0] for r in row]
-        except Exception:
-            pass
+        exact = self.fetch_partition_columns(engine, table_name, schema)
+        if exact:
+            return exact
         return super().detect_partition_columns(engine, table_name, schema, columns)
 
     def limit_clause(self, limit: int) -> str:
@@ -175,37 +219,6 @@ class MssqlAdapter(DialectAdapter):
         """MSSQL TIMESTAMP is rowversion, not datetime. Use column directly; DATEDIFF works with DATE/DATETIME2."""
         return self.quote_column(biz_name)
 
-    def build_late_arriving_query(
-        self,
-        table_name: str,
-        schema: str,
-        biz_col: str,
-        sys_col: str,
-        biz_expr: str,
-    ) -> str:
-        qt = self.quote_table(schema, table_name)
-        q_sys = self.quote_column(sys_col)
-        q_biz = self.quote_column(biz_col)
-        return f"""
-            SELECT COUNT(*) AS total,
-                SUM(CASE WHEN lh > 24 THEN 1 ELSE 0 END) AS late_1d,
-                SUM(CASE WHEN lh > 168 THEN 1 ELSE 0 END) AS late_7d,
-                ROUND(MIN(lh), 2) AS min_h, ROUND(AVG(lh), 2) AS avg_h,
-                ROUND((SELECT MIN(p95) FROM (
-                    SELECT PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY lh) OVER () AS p95
-                    FROM (SELECT DATEDIFF(SECOND, {biz_expr}, {q_sys}) / 3600.0 AS lh
-                          FROM {qt} WHERE {q_sys} IS NOT NULL AND {q_biz} IS NOT NULL) sub
-                    WHERE lh >= 0
-                ) p), 2) AS p95_h,
-                ROUND(MAX(lh), 2) AS max_h
-            FROM (
-                SELECT DATEDIFF(SECOND, {biz_expr}, {q_sys}) / 3600.0 AS lh
-                FROM {qt}
-                WHERE {q_sys} IS NOT NULL AND {q_biz} IS NOT NULL
-            ) sub
-            WHERE lh >= 0
-        """
-
     def supports_late_arriving_check(self) -> bool:
         return True
 
@@ -1,19 +1,96 @@
 """Oracle dialect adapter."""
 
 import logging
-from typing import Dict, List, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DatabaseError
 
 from .base import DialectAdapter
 
 logger = logging.getLogger(__name__)
 
+_ORA_USER_SQL = text("SELECT USER FROM DUAL")
+
+_ORA_SESSION_TIMEZONE_SQL = text("SELECT SESSIONTIMEZONE FROM DUAL")
+
+_ORA_DB_TIMEZONE_SQL = text("SELECT DBTIMEZONE FROM DUAL")
+
+# Kinds are cast to VARCHAR2: UNION ALL of CHAR literals would blank-pad the shorter ones.
+_ORA_SCHEMA_KIND_TEMPLATES = {
+    "checks": """
+    SELECT CAST('checks' AS VARCHAR2(16)) AS kind, ac.TABLE_NAME, acc.COLUMN_NAME, ac.CONSTRAINT_NAME,
+        ac.SEARCH_CONDITION_VC AS value, CAST(NULL AS NUMBER) AS sort_order
+    FROM {views}_CONSTRAINTS ac
+    JOIN {views}_CONS_COLUMNS acc ON ac.CONSTRAINT_NAME = acc.CONSTRAINT_NAME
+        AND ac.OWNER = acc.OWNER
+    WHERE ac.CONSTRAINT_TYPE = 'C'
+        AND ac.OWNER = :schema
+        AND ac.TABLE_NAME NOT LIKE 'BIN$%'
+        AND ac.SEARCH_CONDITION_VC IS NOT NULL
+        AND ac.CONSTRAINT_NAME NOT LIKE 'SYS_%'
+        AND ac.SEARCH_CONDITION_VC NOT LIKE '%IS NOT NULL%'
+""",
+    "uniques": """
+    SELECT CAST('uniques' AS VARCHAR2(16)), ac.TABLE_NAME, acc.COLUMN_NAME, NULL, NULL, NULL
+    FROM {views}_CONSTRAINTS ac
+    JOIN {views}_CONS_COLUMNS acc ON ac.CONSTRAINT_NAME = acc.CONSTRAINT_NAME
+        AND ac.OWNER = acc.OWNER
+    WHERE ac.CONSTRAINT_TYPE = 'U' AND ac.OWNER = :schema
+        AND ac.TABLE_NAME NOT LIKE 'BIN$%'
+""",
+    "table_desc": """
+    SELECT CAST('table_desc' AS VARCHAR2(16)), TABLE_NAME, NULL, NULL, COMMENTS, NULL
+    FROM {views}_TAB_COMMENTS
+    WHERE OWNER = :schema AND COMMENTS IS NOT NULL
+""",
+    "col_desc": """
+    SELECT CAST('col_desc' AS VARCHAR2(16)), TABLE_NAME, COLUMN_NAME, NULL, COMMENTS, NULL
+    FROM {views}_COL_COMMENTS
+    WHERE OWNER = :schema AND COMMENTS IS NOT NULL
+""",
+}
+_ORA_SCHEMA_BULK_TEMPLATE = "    UNION ALL".join(_ORA_SCHEMA_KIND_TEMPLATES.values())
+
+# DBA_* views skip ALL_*'s per-user visibility checks; they need SELECT_CATALOG_ROLE, so ALL_* is the fallback.
+_ORA_DBA_SCHEMA_BULK_SQL = text(_ORA_SCHEMA_BULK_TEMPLATE.format(views="DBA"))
+_ORA_SCHEMA_BULK_SQL = text(_ORA_SCHEMA_BULK_TEMPLATE.format(views="ALL"))
+# Run one by one when the bulk query fails, so a failing kind leaves the others intact.
+_ORA_SCHEMA_KIND_QUERIES = {kind: text(sql.format(views="ALL")) for kind, sql in _ORA_SCHEMA_KIND_TEMPLATES.items()}
+
+_ORA_PARTITION_KEYS_SQL = text("""
+    SELECT NAME, COLUMN_NAME FROM ALL_PART_KEY_COLUMNS
+    WHERE OWNER = :schema AND OBJECT_TYPE = 'TABLE'
+    ORDER BY NAME, COLUMN_POSITION
+""")
+
+_ORA_DDL_MARKER_SQL = text("""
+    SELECT COUNT(*) || ':' || TO_CHAR(MAX(LAST_DDL_TIME), 'YYYY-MM-DD HH24:MI:SS')
+    FROM ALL_OBJECTS WHERE OWNER = :schema
+""")
+
 
 class OracleAdapter(DialectAdapter):
     """Oracle dialect adapter."""
 
+    # Use CAST to DATE so (ts - date) yields numeric days; * 24 = hours.
+    # Avoids ORA-00932 when mixing TIMESTAMP and DATE (which yields INTERVAL).
+    _LATE_SQL_TEMPLATE = """
+        SELECT COUNT(*) AS total,
+            SUM(CASE WHEN lh > 24 THEN 1 ELSE 0 END) AS late_1d,
+            SUM(CASE WHEN lh > 168 THEN 1 ELSE 0 END) AS late_7d,
+            ROUND(MIN(lh), 2) AS min_h, ROUND(AVG(lh), 2) AS avg_h,
+            ROUND(PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY lh), 2) AS p95_h,
+            ROUND(MAX(lh), 2) AS max_h
+        FROM (
+            SELECT (CAST({q_sys} AS DATE) - CAST({q_biz} AS DATE)) * 24 AS lh
+            FROM {qt}
+            WHERE {q_sys} IS NOT NULL AND {q_biz} IS NOT NULL
+                AND CAST({q_sys} AS DATE) >= CAST({q_biz} AS DATE)
+        ) sub
+    """
+
     def quote_identifier(self, name: str) -> str:
         return f'"{name}"'
 
@@ -22,120 +99,74 @@ class OracleAdapter(DialectAdapter):
 
     def resolve_default_schema(self, engine: Engine) -> str:
         try:
-            with engine.connect() as conn:
-                return conn.execute(text("SELECT USER FROM DUAL")).scalar() or "USER"
+            with self._connect(engine) as conn:
+                return conn.execute(_ORA_USER_SQL).scalar() or "USER"
         except Exception:
             return "USER"
 
     def fetch_database_timezone(self, engine: Engine) -> str:
         try:
-            with engine.connect() as conn:
-                tz = conn.execute(text("SELECT SESSIONTIMEZONE FROM DUAL")).scalar()
+            with self._connect(engine) as conn:
+                tz = conn.execute(_ORA_SESSION_TIMEZONE_SQL).scalar()
                 if tz:
                     return str(tz)
-                tz = conn.execute(text("SELECT DBTIMEZONE FROM DUAL")).scalar()
+                tz = conn.execute(_ORA_DB_TIMEZONE_SQL).scalar()
                 return str(tz) if tz else "Unknown"
         except Exception:
             return "Unknown"
 
-    def fetch_check_constraints(self, engine: Engine, schema: str) -> Dict[str, List[Dict]]:
-        result = {}
-        query = text("""
-            SELECT ac.TABLE_NAME, acc.COLUMN_NAME, ac.CONSTRAINT_NAME, ac.SEARCH_CONDITION_VC
-            FROM ALL_CONSTRAINTS ac
-            JOIN ALL_CONS_COLUMNS acc ON ac.CONSTRAINT_NAME = acc.CONSTRAINT_NAME
-                AND ac.OWNER = acc.OWNER
-            WHERE ac.CONSTRAINT_TYPE = 'C'
-                AND ac.OWNER = :schema
-                AND ac.TABLE_NAME NOT LIKE 'BIN$%'
-                AND ac.SEARCH_CONDITION_VC IS NOT NULL
-                AND ac.CONSTRAINT_NAME NOT LIKE 'SYS_%'
-                AND ac.SEARCH_CONDITION_VC NOT LIKE '%IS NOT NULL%'
-        """)
+    def fetch_ddl_marker(self, engine: Engine, schema: str) -> Optional[str]:
+        with self._connect(engine) as conn:
+            return conn.execute(_ORA_DDL_MARKER_SQL, {"schema": schema.upper()}).scalar()
+
+    def fetch_schema_bulk(self, engine: Engine, schema: str) -> Dict[str, Any]:
+        params = {"schema": schema.upper()}
         try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema.upper()}).fetchall():
-                    result.setdefault(row[0], []).append({
-                        "column": row[1], "constraint_name": row[2], "check_clause": row[3] or ""
-                    })
+            with self._connect(engine) as conn:
+                try:
+                    rows = conn.execute(_ORA_DBA_SCHEMA_BULK_SQL, params)
+                except DatabaseError:
+                    rows = conn.execute(_ORA_SCHEMA_BULK_SQL, params)
+                return self._schema_bulk_from_rows(rows)
         except Exception as e:
-            logger.warning(f"Could not fetch CHECK constraints: {e}")
-        return result
+            logger.warning(f"Bulk schema catalog query failed, querying each kind separately: {e}")
+            return self._schema_bulk_by_kind(engine, schema, _ORA_SCHEMA_KIND_QUERIES, params)
 
-    def fetch_enum_columns(self, engine: Engine, schema: str) -> Dict[str, Dict[str, List[str]]]:
+    def fetch_check_constraints(self, engine: Engine, schema: str) -> Dict[str, List[Dict]]:
+        return self.fetch_schema_bulk(engine, schema)["checks"]
+
+    def fetch_enum_columns(self, engine: Engine, schema: str) -> Dict[str, Dict[str, Tuple[str, ...]]]:
         return {}
 
-    def fetch_unique_constraints(self, engine: Engine, schema: str) -> Dict[str, Set[str]]:
-        result = {}
-        query = text("""
-            SELECT ac.TABLE_NAME, acc.COLUMN_NAME
-            FROM ALL_CONSTRAINTS ac
-            JOIN ALL_CONS_COLUMNS acc ON ac.CONSTRAINT_NAME = acc.CONSTRAINT_NAME
-                AND ac.OWNER = acc.OWNER
-            WHERE ac.CONSTRAINT_TYPE = 'U' AND ac.OWNER = :schema
-                AND ac.TABLE_NAME NOT LIKE 'BIN$%'
-        """)
-        try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema.upper()}).fetchall():
-                    result.setdefault(row[0], set()).add(row[1])
-        except Exception as e:
-            logger.warning(f"Could not fetch UNIQUE constraints: {e}")
-        return result
+    def fetch_unique_constraints(self, engine: Engine, schema: str) -> Dict[str, FrozenSet[str]]:
+        return self.fetch_schema_bulk(engine, schema)["uniques"]
 
     def detect_cdc_enabled(self, engine: Engine, table_name: str, schema: str) -> bool:
         return False
 
     def fetch_table_descriptions(self, engine: Engine, schema: str) -> Dict[str, str]:
-        result: Dict[str, str] = {}
-        query = text(
-            """
-            SELECT TABLE_NAME, COMMENTS
-            FROM ALL_TAB_COMMENTS
-            WHERE OWNER = :schema
-            """
-        )
-        try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema.upper()}).fetchall():
-                    if row[1]:
-                        result[str(row[0])] = str(row[1])
-        except Exception as e:
-            logger.warning(f"Could not fetch table descriptions: {e}")
-        return result
+        return self.fetch_schema_bulk(engine, schema)["table_desc"]
 
     def fetch_column_descriptions(self, engine: Engine, schema: str) -> Dict[str, Dict[str, str]]:
-        result: Dict[str, Dict[str, str]] = {}
-        query = text(
-            """
-            SELECT TABLE_NAME, COLUMN_NAME, COMMENTS
-            FROM ALL_COL_COMMENTS
-            WHERE OWNER = :schema
-            """
-        )
+        return self.fetch_schema_bulk(engine, schema)["col_desc"]
+
+    def fetch_partition_columns_bulk(self, engine: Engine, schema: str) -> Dict[str, List[str]]:
         try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema.upper()}).fetchall():
-                    if row[2]:
-                        result.setdefault(str(row[0]), {})[str(row[1])] = str(row[2])
-        except Exception as e:
-            logger.warning(f"Could not fetch column descriptions: {e}")
-        return result
+            with self._connect(engine) as conn:
+                return self._group_rows(conn.execute(_ORA_PARTITION_KEYS_SQL, {"schema": schema.upper()}))
+        except Exception:
+            self._lookup_failed(engine, schema)
+            return {}
+
+    def fetch_partition_columns(self, engine: Engine, table_name: str, schema: str) -> List[str]:
+        return list(self.fetch_partition_columns_bulk(engine, schema).get(table_name.upper(), []))
 
     def detect_partition_columns(
         self, engine: Engine, table_name: str, schema: str, columns: List[Dict]
     ) -> List[str]:
-        try:
-            with engine.connect() as conn:
-                rows = conn.execute(text("""
-                    SELECT COLUMN_NAME FROM ALL_PART_KEY_COLUMNS
-                    WHERE OWNER = :schema AND NAME = :table AND OBJECT_TYPE = 'TABLE'
-                    ORDER BY COLUMN_POSITION
-                """), {"schema": schema.upper(), "table": table_name.upper()}).fetchall()
-                if rows:
-                    return [r[0] for r in rows]
-        except Exception:
-            pass
+        exact = self.fetch_partition_columns(engine, table_name, schema)
+        if exact:
+            return exact
         return super().detect_partition_columns(engine, table_name, schema, columns)
 
     def limit_clause(self, limit: int) -> str:
@@ -145,34 +176,6 @@ class OracleAdapter(DialectAdapter):
         qt = self.quote_table(schema, table) if schema else self.quote_identifier(table)
         return (f"SELECT * FROM {qt} FETCH FIRST {limit} ROWS ONLY", {})
 
-    def build_late_arriving_query(
-        self,
-        table_name: str,
-        schema: str,
-        biz_col: str,
-        sys_col: str,
-        biz_expr: str,
-    ) -> str:
-        qt = self.quote_table(schema, table_name)
-        q_sys = self.quote_column(sys_col)
-        q_biz = self.quote_column(biz_col)
-        # Use CAST to DATE so (ts - date) yields numeric days; * 24 = hours.
-        # Avoids ORA-00932 when mixing TIMESTAMP and DATE (which yields INTERVAL).
-        return f"""
-            SELECT COUNT(*) AS total,
-                SUM(CASE WHEN lh > 24 THEN 1 ELSE 0 END) AS late_1d,
-                SUM(CASE WHEN lh > 168 THEN 1 ELSE 0 END) AS late_7d,
-                ROUND(MIN(lh), 2) AS min_h, ROUND(AVG(lh), 2) AS avg_h,
-                ROUND(PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY lh), 2) AS p95_h,
-                ROUND(MAX(lh), 2) AS max_h
-            FROM (
-                SELECT (CAST({q_sys} AS DATE) - CAST({q_biz} AS DATE)) * 24 AS lh
-                FROM {qt}
-                WHERE {q_sys} IS NOT NULL AND {q_biz} IS NOT NULL
-            ) sub
-            WHERE lh >= 0
-        """
-
     def supports_late_arriving_check(self) -> bool:
         return True
 
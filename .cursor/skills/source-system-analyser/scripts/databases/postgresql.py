@@ -1,7 +1,7 @@
 """PostgreSQL dialect adapter."""
 
 import logging
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
@@ -10,10 +10,107 @@ from .base import DialectAdapter
 
 logger = logging.getLogger(__name__)
 
+_PG_TIMEZONE_SQL = text("SHOW timezone")
+
+# One SELECT per kind; together they form the bulk UNION ALL query, and each also runs alone as its fallback.
+_PG_SCHEMA_KIND_SQL = {
+    "checks": """
+    SELECT 'checks' AS kind, tc.table_name::text, ccu.column_name::text, tc.constraint_name::text,
+           cc.check_clause::text, NULL::real
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.check_constraints cc ON tc.constraint_name = cc.constraint_name AND tc.constraint_schema = cc.constraint_schema
+    JOIN information_schema.constraint_column_usage ccu ON tc.constraint_name = ccu.constraint_name AND tc.constraint_schema = ccu.constraint_schema
+    WHERE tc.constraint_type = 'CHECK' AND tc.table_schema = :schema AND tc.constraint_name NOT LIKE '%_not_null'
+""",
+    "uniques": """
+    SELECT 'uniques', tc.table_name::text, kcu.column_name::text, NULL, NULL, NULL
+    FROM information_schema.table_constraints tc
+    JOIN information_schema.key_column_usage kcu ON tc.constraint_name = kcu.constraint_name AND tc.table_schema = kcu.table_schema
+    WHERE tc.constraint_type = 'UNIQUE' AND tc.table_schema = :schema
+""",
+    "enums": """
+    SELECT 'enums', c.relname::text, a.attname::text, NULL, e.enumlabel::text, e.enumsortorder
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+    JOIN pg_enum e ON e.enumtypid = a.atttypid
+    WHERE n.nspname = :schema AND c.relkind IN ('r', 'v', 'f', 'p')
+""",
+    "table_desc": """
+    SELECT 'table_desc', c.relname::text, NULL, NULL, obj_description(c.oid, 'pg_class'), NULL
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = :schema AND c.relkind = 'r' AND obj_description(c.oid, 'pg_class') IS NOT NULL
+""",
+    "col_desc": """
+    SELECT 'col_desc', c.relname::text, a.attname::text, NULL, col_description(a.attrelid, a.attnum), NULL
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_attribute a ON a.attrelid = c.oid
+    WHERE n.nspname = :schema
+      AND c.relkind = 'r'
+      AND a.attnum > 0
+      AND NOT a.attisdropped
+      AND col_description(a.attrelid, a.attnum) IS NOT NULL
+""",
+}
+_PG_SCHEMA_KIND_QUERIES = {kind: text(sql) for kind, sql in _PG_SCHEMA_KIND_SQL.items()}
+
+# Streamed through a server-side cursor: wide schemas return one row per commented column and enum label.
+_PG_SCHEMA_BULK_SQL = text("    UNION ALL".join(_PG_SCHEMA_KIND_SQL.values()))
+_PG_SCHEMA_BULK_OPTIONS = {"stream_results": True, "yield_per": 1000}
+
+_PG_CDC_TABLES_SQL = text(
+    "SELECT c.relname FROM pg_class c "
+    "JOIN pg_namespace n ON n.oid = c.relnamespace "
+    "WHERE n.nspname = :schema AND c.relreplident IN ('f', 'i')"
+)
+
+_PG_PARTITION_KEYS_SQL = text("""
+    SELECT c.relname, a.attname FROM pg_partitioned_table pt
+    JOIN pg_class c ON c.oid = pt.partrelid
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = ANY(pt.partattrs::smallint[])
+    WHERE n.nspname = :sch
+    ORDER BY c.relname, a.attnum
+""")
+
+# PostgreSQL keeps no last-DDL time; every DDL rewrites the touched catalog rows, so their xmins change.
+# Enum labels only count for enum types used by the schema's columns.
+_PG_DDL_MARKER_SQL = text("""
+    SELECT md5(coalesce(string_agg(x, ',' ORDER BY x), '')) FROM (
+        SELECT 'c' || c.oid || ':' || c.xmin FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace WHERE n.nspname = :schema
+        UNION ALL
+        SELECT 'k' || k.oid || ':' || k.xmin FROM pg_constraint k
+        JOIN pg_namespace n ON n.oid = k.connamespace WHERE n.nspname = :schema
+        UNION ALL
+        SELECT 'd' || d.objoid || '.' || d.objsubid || ':' || d.xmin FROM pg_description d
+        JOIN pg_class c ON c.oid = d.objoid AND d.classoid = 'pg_class'::regclass
+        JOIN pg_namespace n ON n.oid = c.relnamespace WHERE n.nspname = :schema
+        UNION ALL
+        SELECT 'e' || e.oid || ':' || e.xmin FROM pg_enum e
+        WHERE e.enumtypid IN (
+            SELECT a.atttypid FROM pg_attribute a
+            JOIN pg_class c ON c.oid = a.attrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = :schema AND a.attnum > 0 AND NOT a.attisdropped
+        )
+    ) s(x)
+""")
+
 
 class PostgresqlAdapter(DialectAdapter):
     """PostgreSQL dialect adapter."""
 
+    _LATE_SQL_TEMPLATE = """
+        SELECT COUNT(*) AS total, COUNT(*) FILTER (WHERE lh > 24) AS late_1d, COUNT(*) FILTER (WHERE lh > 168) AS late_7d,
+               ROUND(MIN(lh)::numeric, 2) AS min_h, ROUND(AVG(lh)::numeric, 2) AS avg_h,
+               ROUND(PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY lh)::numeric, 2) AS p95_h, ROUND(MAX(lh)::numeric, 2) AS max_h
+        FROM (SELECT EXTRACT(EPOCH FROM ({q_sys} - {biz_expr}))/3600.0 AS lh FROM {qt}
+              WHERE {q_sys} IS NOT NULL AND {q_biz} IS NOT NULL AND {q_sys} >= {biz_expr}) sub
+    """
+
     def quote_identifier(self, name: str) -> str:
         return f'"{name}"'
 
@@ -22,136 +119,66 @@ class PostgresqlAdapter(DialectAdapter):
 
     def fetch_database_timezone(self, engine: Engine) -> str:
         try:
-            with engine.connect() as conn:
-                return conn.execute(text("SHOW timezone")).scalar() or "Unknown"
+            with self._connect(engine) as conn:
+                return conn.execute(_PG_TIMEZONE_SQL).scalar() or "Unknown"
         except Exception:
             return "Unknown"
 
-    def fetch_check_constraints(self, engine: Engine, schema: str) -> Dict[str, List[Dict]]:
-        result = {}
-        query = text("""
-            SELECT tc.table_name, ccu.column_name, tc.constraint_name, cc.check_clause
-            FROM information_schema.table_constraints tc
-            JOIN information_schema.check_constraints cc ON tc.constraint_name = cc.constraint_name AND tc.constraint_schema = cc.constraint_schema
-            JOIN information_schema.constraint_column_usage ccu ON tc.constraint_name = ccu.constraint_name AND tc.constraint_schema = ccu.constraint_schema
-            WHERE tc.constraint_type = 'CHECK' AND tc.table_schema = :schema AND tc.constraint_name NOT LIKE '%_not_null'
-        """)
-        try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema}).fetchall():
-                    result.setdefault(row[0], []).append({
-                        "column": row[1], "constraint_name": row[2], "check_clause": row[3]
-                    })
-        except Exception as e:
-            logger.warning(f"Could not fetch CHECK constraints: {e}")
-        return result
-
-    def fetch_enum_columns(self, engine: Engine, schema: str) -> Dict[str, Dict[str, List[str]]]:
-        result = {}
-        query = text("""
-            SELECT c.table_name, c.column_name, c.udt_name, array_agg(e.enumlabel ORDER BY e.enumsortorder) AS enum_values
-            FROM information_schema.columns c
-            JOIN pg_type t ON t.typname = c.udt_name
-            JOIN pg_enum e ON e.enumtypid = t.oid
-            WHERE c.table_schema = :schema AND c.data_type = 'USER-DEFINED'
-            GROUP BY c.table_name, c.column_name, c.udt_name
-        """)
-        try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema}).fetchall():
-                    result.setdefault(row[0], {})[row[1]] = list(row[3])
-        except Exception as e:
-            logger.warning(f"Could not fetch ENUM columns: {e}")
-        return result
-
-    def fetch_unique_constraints(self, engine: Engine, schema: str) -> Dict[str, Set[str]]:
-        result = {}
-        query = text("""
-            SELECT tc.table_name, kcu.column_name
-            FROM information_schema.table_constraints tc
-            JOIN information_schema.key_column_usage kcu ON tc.constraint_name = kcu.constraint_name AND tc.table_schema = kcu.table_schema
-            WHERE tc.constraint_type = 'UNIQUE' AND tc.table_schema = :schema
-        """)
+    def fetch_ddl_marker(self, engine: Engine, schema: str) -> Optional[str]:
+        with self._connect(engine) as conn:
+            return conn.execute(_PG_DDL_MARKER_SQL, {"schema": schema}).scalar()
+
+    def fetch_schema_bulk(self, engine: Engine, schema: str) -> Dict[str, Any]:
+        params = {"schema": schema}
         try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema}).fetchall():
-                    result.setdefault(row[0], set()).add(row[1])
+            with self._connect(engine) as conn:
+                return self._schema_bulk_from_rows(conn.execute(
+                    _PG_SCHEMA_BULK_SQL, params, execution_options=_PG_SCHEMA_BULK_OPTIONS
+                ))
         except Exception as e:
-            logger.warning(f"Could not fetch UNIQUE constraints: {e}")
-        return result
+            logger.warning(f"Bulk schema catalog query failed, querying each kind separately: {e}")
+            return self._schema_bulk_by_kind(engine, schema, _PG_SCHEMA_KIND_QUERIES, params)
 
-    def detect_cdc_enabled(self, engine: Engine, table_name: str, schema: str) -> bool:
+    def fetch_check_constraints(self, engine: Engine, schema: str) -> Dict[str, List[Dict]]:
+        return self.fetch_schema_bulk(engine, schema)["checks"]
+
+    def fetch_enum_columns(self, engine: Engine, schema: str) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+        return self.fetch_schema_bulk(engine, schema)["enums"]
+
+    def fetch_unique_constraints(self, engine: Engine, schema: str) -> Dict[str, FrozenSet[str]]:
+        return self.fetch_schema_bulk(engine, schema)["uniques"]
+
+    def fetch_cdc_enabled_tables(self, engine: Engine, schema: str) -> FrozenSet[str]:
         try:
-            with engine.connect() as conn:
-                row = conn.execute(text(
-                    "SELECT c.relreplident FROM pg_class c "
-                    "JOIN pg_namespace n ON n.oid = c.relnamespace "
-                    "WHERE n.nspname = :schema AND c.relname = :table"
-                ), {"schema": schema, "table": table_name}).fetchone()
-                return row and row[0] in ('f', 'i')
+            with self._connect(engine) as conn:
+                return frozenset(conn.execute(_PG_CDC_TABLES_SQL, {"schema": schema}).scalars())
         except Exception:
-            return False
+            self._lookup_failed(engine, schema)
+            return frozenset()
+
+    def detect_cdc_enabled(self, engine: Engine, table_name: str, schema: str) -> bool:
+        return table_name in self.fetch_cdc_enabled_tables(engine, schema)
 
     def fetch_table_descriptions(self, engine: Engine, schema: str) -> Dict[str, str]:
-        result: Dict[str, str] = {}
-        query = text(
-            """
-            SELECT c.relname AS table_name, obj_description(c.oid, 'pg_class') AS description
-            FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE n.nspname = :schema AND c.relkind = 'r'
-            """
-        )
-        try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema}).fetchall():
-                    if row[1]:
-                        result[str(row[0])] = str(row[1])
-        except Exception as e:
-            logger.warning(f"Could not fetch table descriptions: {e}")
-        return result
+        return self.fetch_schema_bulk(engine, schema)["table_desc"]
 
     def fetch_column_descriptions(self, engine: Engine, schema: str) -> Dict[str, Dict[str, str]]:
-        result: Dict[str, Dict[str, str]] = {}
-        query = text(
-            """
-            SELECT c.relname AS table_name, a.attname AS column_name, col_description(a.attrelid, a.attnum) AS description
-            FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            JOIN pg_attribute a ON a.attrelid = c.oid
-            WHERE n.nspname = :schema
-              AND c.relkind = 'r'
-              AND a.attnum > 0
-              AND NOT a.attisdropped
-            """
-        )
+        return self.fetch_schema_bulk(engine, schema)["col_desc"]
+
+    def fetch_partition_columns_bulk(self, engine: Engine, schema: str) -> Dict[str, List[str]]:
         try:
-            with engine.connect() as conn:
-                for row in conn.execute(query, {"schema": schema}).fetchall():
-                    if row[2]:
-                        result.setdefault(str(row[0]), {})[str(row[1])] = str(row[2])
-        except Exception as e:
-            logger.warning(f"Could not fetch column descriptions: {e}")
-        return result
+            with self._connect(engine) as conn:
+                return self._group_rows(conn.execute(_PG_PARTITION_KEYS_SQL, {"sch": schema}))
+        except Exception:
+            self._lookup_failed(engine, schema)
+            return {}
 
     def detect_partition_columns(
         self, engine: Engine, table_name: str, schema: str, columns: List[Dict]
     ) -> List[str]:
-        try:
-            q = text("""
-                SELECT a.attname FROM pg_partitioned_table pt
-                JOIN pg_class c ON c.oid = pt.partrelid
-                JOIN pg_namespace n ON n.oid = c.relnamespace
-                JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = ANY(pt.partattrs::smallint[])
-                WHERE c.relname = :tbl AND n.nspname = :sch
-                ORDER BY a.attnum
-            """)
-            with engine.connect() as conn:
-                rows = conn.execute(q, {"tbl": table_name, "sch": schema}).fetchall()
-            if rows:
-                return [r[0] for r in rows]
-        except Exception:
-            pass
+        exact = self.fetch_partition_columns(engine, table_name, schema)
+        if exact:
+            return exact
         # Fallback to heuristic from column names/types
         return super().detect_partition_columns(engine, table_name, schema, columns)
 
@@ -162,25 +189,6 @@ class PostgresqlAdapter(DialectAdapter):
         qt = self.quote_table(schema, table) if schema else self.quote_identifier(table)
         return (f"SELECT * FROM {qt} LIMIT :limit", {"limit": limit})
 
-    def build_late_arriving_query(
-        self,
-        table_name: str,
-        schema: str,
-        biz_col: str,
-        sys_col: str,
-        biz_expr: str,
-    ) -> str:
-        qt = self.quote_table(schema, table_name)
-        q_sys = self.quote_column(sys_col)
-        q_biz = self.quote_column(biz_col)
-        return f"""
-            SELECT COUNT(*) AS total, COUNT(*) FILTER (WHERE lh > 24) AS late_1d, COUNT(*) FILTER (WHERE lh > 168) AS late_7d,
-                   ROUND(MIN(lh)::numeric, 2) AS min_h, ROUND(AVG(lh)::numeric, 2) AS avg_h,
-                   ROUND(PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY lh)::numeric, 2) AS p95_h, ROUND(MAX(lh)::numeric, 2) AS max_h
-            FROM (SELECT EXTRACT(EPOCH FROM ({q_sys} - {biz_expr}))/3600.0 AS lh FROM {qt} WHERE {q_sys} IS NOT NULL AND {q_biz} IS NOT NULL) sub
-            WHERE lh >= 0
-        """
-
     def supports_late_arriving_check(self) -> bool:
         return True
 
@@ -5,36 +5,55 @@ from __future__ import annotations
 
 import argparse
 import csv
+import hashlib
 import json
+import os
+import pickle
 import re
-from datetime import datetime, timezone
+import tempfile
+from datetime import date, datetime, time, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 try:
     import yaml  # type: ignore
 except Exception:
     yaml = None
 
+try:
+    from python_calamine import CalamineWorkbook  # type: ignore
+except Exception:
+    CalamineWorkbook = None
+
 
 def _norm_header(name: str) -> str:
     return str(name or "").strip().lower().replace(" ", "_")
 
 
+_TRUE_STRINGS = frozenset({"1", "true", "t", "yes", "y"})
+
+
 def _as_bool(value: Any, default: bool = False) -> bool:
     if value is None or value == "":
         return default
-    if isinstance(value, bool):
+    if value is True or value is False:
         return value
-    s = str(value).strip().lower()
-    return s in {"1", "true", "t", "yes", "y"}
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_STRINGS
+    return str(value).strip().lower() in _TRUE_STRINGS
 
 
 def _as_int(value: Any) -> int | None:
     if value is None or value == "":
         return None
+    # Typed cells (XLSX) skip the str round-trip; bools stay rejected as before.
+    if type(value) is int:
+        return value
     try:
-        return int(float(str(value).strip()))
+        if type(value) is float:
+            return int(value)
+        return int(float(value.strip() if isinstance(value, str) else str(value).strip()))
     except Exception:
         return None
 
@@ -75,25 +94,60 @@ def _resolve_csv_delimiter(path: Path, delimiter: str | None) -> str:
     return _detect_csv_delimiter(path)
 
 
-def _read_csv(path: Path, delimiter: str | None = None) -> list[dict[str, Any]]:
+def _read_csv(path: Path, delimiter: str | None = None) -> Iterator[dict[str, Any]]:
+    # Rows are yielded lazily so large exports are folded without holding the whole file in memory.
     resolved = _resolve_csv_delimiter(path, delimiter)
     with path.open("r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f, delimiter=resolved)
-        out: list[dict[str, Any]] = []
+        reader = csv.reader(f, delimiter=resolved)
+        header_row = next(reader, None)
+        if header_row is None:
+            return
+        # Normalize the header once; rows are zipped onto it like csv.DictReader would
+        # (short rows padded with None, surplus cells collected under the blank key).
+        headers = [_norm_header(h) for h in header_row]
+        width = len(headers)
+        padding = dict.fromkeys(headers)
         for row in reader:
-            out.append({_norm_header(k): v for k, v in row.items()})
-        return out
-
-
-def _read_xlsx(path: Path, sheet_name: str | None) -> list[dict[str, Any]]:
+            if not row:
+                continue
+            item = dict(zip(headers, row))
+            if len(row) < width:
+                item = {**padding, **item}
+            elif len(row) > width:
+                item[_norm_header(None)] = row[width:]
+            yield item
+
+
+def _calamine_value(value: Any) -> Any:
+    # Match openpyxl's cell values: empty cells are None, whole numbers int, dates datetime.
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime.combine(value, time())
+    return value
+
+
+def _read_xlsx_rows(path: Path, sheet_name: str | None):
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(str(path))
+        ws = wb.get_sheet_by_name(sheet_name or wb.sheet_names[0])
+        return (tuple(_calamine_value(v) for v in r) for r in ws.to_python(skip_empty_area=False))
     try:
         from openpyxl import load_workbook
     except ImportError as exc:
-        raise SystemExit("Reading .xlsx requires openpyxl. Install with: pip install openpyxl") from exc
+        raise SystemExit(
+            "Reading .xlsx requires python-calamine or openpyxl. Install with: pip install openpyxl"
+        ) from exc
 
     wb = load_workbook(path, read_only=True, data_only=True)
     ws = wb[sheet_name] if sheet_name else wb[wb.sheetnames[0]]
-    rows = ws.iter_rows(values_only=True)
+    return ws.iter_rows(values_only=True)
+
+
+def _read_xlsx(path: Path, sheet_name: str | None) -> list[dict[str, Any]]:
+    rows = _read_xlsx_rows(path, sheet_name)
     headers_raw = next(rows, None)
     if not headers_raw:
         return []
@@ -108,31 +162,160 @@ def _read_xlsx(path: Path, sheet_name: str | None) -> list[dict[str, Any]]:
     return data
 
 
-def _read_tabular(path: str, sheet_name: str | None = None, delimiter: str | None = None) -> list[dict[str, Any]]:
+# Parsed XLSX rows keyed by workbook content + sheet; bump the version when _read_xlsx output changes.
+_XLSX_CACHE_DIR = Path.home() / ".cache" / "tabular_schema_json"
+_XLSX_CACHE_VERSION = 1
+# Least recently used entries beyond this count are deleted after each cache write.
+_XLSX_CACHE_MAX_ENTRIES = 64
+
+
+def _xlsx_cache_prefix(path: Path, sheet_name: str | None) -> str:
+    # One prefix per workbook location + sheet, so an edited workbook replaces its own older entry.
+    source = hashlib.blake2b(f"{path.resolve()}\0{sheet_name or ''}".encode("utf-8"), digest_size=6)
+    return f"{path.stem}.{source.hexdigest()}"
+
+
+def _xlsx_cache_path(path: Path, sheet_name: str | None) -> Path:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{_XLSX_CACHE_VERSION}\0{sheet_name or ''}\0".encode("utf-8"))
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return _XLSX_CACHE_DIR / f"{_xlsx_cache_prefix(path, sheet_name)}.{h.hexdigest()}.pickle"
+
+
+def _prune_xlsx_cache(keep: Path, prefix: str) -> None:
+    others = []
+    for entry in _XLSX_CACHE_DIR.glob("*.pickle"):
+        if entry == keep:
+            continue
+        try:
+            if entry.name.startswith(prefix + "."):
+                entry.unlink()  # Rows of an earlier version of the same workbook + sheet.
+            else:
+                others.append((entry.stat().st_mtime, entry))
+        except OSError:
+            pass  # Removed by a concurrent run.
+    others.sort(reverse=True)
+    for _, entry in others[_XLSX_CACHE_MAX_ENTRIES - 1:]:
+        try:
+            entry.unlink()
+        except OSError:
+            pass
+
+
+def _cached_read_xlsx(path: Path, sheet_name: str | None) -> list[dict[str, Any]]:
+    cache_path = _xlsx_cache_path(path, sheet_name)
+    try:
+        with cache_path.open("rb") as f:
+            rows = pickle.load(f)
+    except Exception:
+        pass
+    else:
+        try:
+            os.utime(cache_path)  # Hits refresh the entry's place in the LRU order.
+        except OSError:
+            pass
+        return rows
+    rows = _read_xlsx(path, sheet_name)
+    tmp_name = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per writer; concurrent runs each replace the entry atomically.
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as f:
+            tmp_name = f.name
+            pickle.dump(rows, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_path)
+        tmp_name = None
+        _prune_xlsx_cache(cache_path, _xlsx_cache_prefix(path, sheet_name))
+    except OSError:
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+    return rows
+
+
+def _read_tabular(
+    path: str, sheet_name: str | None = None, delimiter: str | None = None, use_cache: bool = True
+) -> Iterable[dict[str, Any]]:
     p = Path(path)
     if p.suffix.lower() == ".csv":
         return _read_csv(p, delimiter=delimiter)
     if p.suffix.lower() == ".xlsx":
-        return _read_xlsx(p, sheet_name)
+        return _cached_read_xlsx(p, sheet_name) if use_cache else _read_xlsx(p, sheet_name)
     raise SystemExit(f"Unsupported file type: {p.suffix}. Use .csv or .xlsx")
 
 
-def _get(row: dict[str, Any], *keys: str, default: Any = None) -> Any:
-    for k in keys:
-        if k in row and row.get(k) not in (None, ""):
-            return row.get(k)
-    return default
+# Accepted header aliases per canonical field, in priority order.
+_COLUMN_ALIASES: dict[str, tuple[str, ...]] = {
+    "table": ("table", "table_name", "entity", "object"),
+    "column": ("column", "column_name", "name", "field", "attribute"),
+    "type": ("type", "data_type", "dtype", "column_type"),
+    "schema": ("schema", "schema_name"),
+    "primary_key": ("primary_key", "pk"),
+    "foreign_key": ("foreign_key", "fk"),
+    "row_count": ("row_count",),
+    "cdc_enabled": ("cdc_enabled",),
+    "is_incremental": ("is_incremental", "incremental"),
+    "semantic_class": ("semantic_class",),
+    "nullable": ("nullable", "is_nullable"),
+    "column_description": ("column_description", "description"),
+    "cardinality": ("cardinality", "distinct_count"),
+    "null_count": ("null_count", "nulls"),
+    "min": ("min", "min_value"),
+    "max": ("max", "max_value"),
+    "data_category": ("data_category", "category"),
+    "detected_unit": ("detected_unit", "unit"),
+    "canonical_unit": ("canonical_unit",),
+    "unit_system": ("unit_system",),
+    "factor_to_canonical": ("factor_to_canonical",),
+    "offset_to_canonical": ("offset_to_canonical",),
+}
+_TABLE_ALIASES: dict[str, tuple[str, ...]] = {
+    "table": _COLUMN_ALIASES["table"],
+    "schema": _COLUMN_ALIASES["schema"],
+    "table_description": ("table_description", "description"),
+    "row_count": ("row_count", "rows"),
+    "cdc_enabled": ("cdc_enabled", "cdc"),
+}
+
+
+def _alias_ranks(aliases: dict[str, tuple[str, ...]]) -> dict[str, tuple[str, int]]:
+    return {alias: (canon, rank) for canon, opts in aliases.items() for rank, alias in enumerate(opts)}
+
+
+_COLUMN_ALIAS_RANKS = _alias_ranks(_COLUMN_ALIASES)
+_TABLE_ALIAS_RANKS = _alias_ranks(_TABLE_ALIASES)
 
 
-def _headers(rows: list[dict[str, Any]]) -> list[str]:
+def _canonical_row(row: dict[str, Any], alias_ranks: dict[str, tuple[str, int]]) -> dict[str, Any]:
+    # One pass over the row's cells; each field keeps its highest-priority non-empty alias.
+    out: dict[str, Any] = {}
+    ranks: dict[str, int] = {}
+    for key, value in row.items():
+        hit = alias_ranks.get(key)
+        if hit is None or value is None or value == "":
+            continue
+        canon, rank = hit
+        if canon not in ranks or rank < ranks[canon]:
+            out[canon] = value
+            ranks[canon] = rank
+    return out
+
+
+def _scan_rows(rows: Iterable[dict[str, Any]], sample_size: int) -> tuple[int, list[str], list[dict[str, Any]]]:
+    count = 0
     seen: set[str] = set()
-    out: list[str] = []
+    headers: list[str] = []
+    samples: list[dict[str, Any]] = []
     for r in rows:
+        count += 1
+        if len(samples) < sample_size:
+            samples.append(r)
         for k in r.keys():
             if k not in seen:
                 seen.add(k)
-                out.append(k)
-    return out
+                headers.append(k)
+    return count, headers, samples
 
 
 def _fk_to_join_candidate(fk: dict[str, Any]) -> dict[str, Any] | None:
@@ -258,6 +441,9 @@ def _load_context_rules() -> None:
         pass
 
 
+# Name-derived inference depends only on the column name once the rules are loaded, so it is
+# memoized per distinct name; exports repeat the same names across many tables.
+@lru_cache(maxsize=None)
 def _infer_semantic_class(col_name: str) -> str | None:
     _load_context_rules()
     lower = col_name.lower()
@@ -267,33 +453,42 @@ def _infer_semantic_class(col_name: str) -> str | None:
     return None
 
 
-def _extract_unit_from_name(col_name: str) -> str | None:
+@lru_cache(maxsize=1)
+def _unit_alias_patterns() -> tuple[tuple[re.Pattern[str], str], ...]:
     _load_context_rules()
+    patterns = []
+    for alias in sorted(_UNIT_ALIASES.keys(), key=len, reverse=True):
+        norm_alias = re.sub(r"[^a-z0-9]+", "_", alias).strip("_")
+        patterns.append((re.compile(rf"(?:^|_){re.escape(norm_alias)}(?:$|_)"), _UNIT_ALIASES[alias]))
+    return tuple(patterns)
+
+
+@lru_cache(maxsize=None)
+def _extract_unit_from_name(col_name: str) -> str | None:
     lower = re.sub(r"[^a-z0-9]+", "_", col_name.lower()).strip("_")
     if not lower:
         return None
-    for alias in sorted(_UNIT_ALIASES.keys(), key=len, reverse=True):
-        norm_alias = re.sub(r"[^a-z0-9]+", "_", alias).strip("_")
-        if re.search(rf"(?:^|_){re.escape(norm_alias)}(?:$|_)", lower):
-            return _UNIT_ALIASES[alias]
+    for pattern, unit in _unit_alias_patterns():
+        if pattern.search(lower):
+            return unit
     return None
 
 
-def _build_unit_context(col_name: str, semantic_class: str | None, raw_row: dict[str, Any]) -> dict[str, Any] | None:
+def _build_unit_context(col_name: str, semantic_class: str | None, row: dict[str, Any]) -> dict[str, Any] | None:
     _load_context_rules()
-    detected = _get(raw_row, "detected_unit", "unit")
-    if detected not in (None, ""):
+    detected = row.get("detected_unit")
+    if detected is not None:
         detected = str(detected).strip().lower()
     else:
         detected = _extract_unit_from_name(col_name)
-    canonical = _get(raw_row, "canonical_unit")
-    if canonical in (None, "") and detected:
+    canonical = row.get("canonical_unit")
+    if canonical is None and detected:
         canonical = _UNIT_CONVERSION.get(detected, {}).get("canonical_unit")
-    unit_system = _get(raw_row, "unit_system")
-    if unit_system in (None, "") and detected:
+    unit_system = row.get("unit_system")
+    if unit_system is None and detected:
         unit_system = _UNIT_CONVERSION.get(detected, {}).get("unit_system", "unknown")
-    factor = _as_float(_get(raw_row, "factor_to_canonical"))
-    offset = _as_float(_get(raw_row, "offset_to_canonical"))
+    factor = _as_float(row.get("factor_to_canonical"))
+    offset = _as_float(row.get("offset_to_canonical"))
     if factor is None and detected in _UNIT_CONVERSION:
         factor = _UNIT_CONVERSION[detected].get("factor_to_canonical")
     if offset is None and detected in _UNIT_CONVERSION:
@@ -367,89 +562,93 @@ def _suggest_role(headers: list[str]) -> dict[str, str | None]:
                 return o
         return None
 
+    return {role: pick(*_COLUMN_ALIASES[role]) for role in ("table", "column", "type", "schema", "primary_key", "foreign_key")}
+
+
+def _new_table(table: str, schema: str, row_count: int = 0, cdc_enabled: bool = False) -> dict[str, Any]:
     return {
-        "table": pick("table", "table_name", "entity", "object"),
-        "column": pick("column", "column_name", "name", "field", "attribute"),
-        "type": pick("type", "data_type", "dtype", "column_type"),
-        "schema": pick("schema", "schema_name"),
-        "primary_key": pick("primary_key", "pk"),
-        "foreign_key": pick("foreign_key", "fk"),
+        "table": table,
+        "schema": schema,
+        "table_description": None,
+        "columns": [],
+        "primary_keys": [],
+        "foreign_keys": [],
+        "row_count": row_count,
+        "field_classifications": [],
+        "sensitive_fields": [],
+        "incremental_columns": [],
+        "partition_columns": [],
+        "join_candidates": [],
+        "unit_summary": {
+            "columns_with_units": 0,
+            "columns_without_units": 0,
+            "mixed_unit_groups": [],
+            "unknown_unit_columns": [],
+        },
+        "cdc_enabled": cdc_enabled,
+        "has_primary_key": False,
+        "has_foreign_keys": False,
+        "has_sensitive_fields": False,
+        "data_quality": {
+            "findings": [],
+            "summary": {"critical": 0, "warning": 0, "info": 0},
+            "constraints_found": {},
+        },
     }
 
 
-def _parse_columns(rows: list[dict[str, Any]], default_schema: str) -> dict[str, dict[str, Any]]:
+def _parse_columns(rows: Iterable[dict[str, Any]], default_schema: str) -> dict[str, dict[str, Any]]:
     tables: dict[str, dict[str, Any]] = {}
-    for r in rows:
-        table = str(_get(r, "table", "table_name", "entity", "object", default="")).strip()
-        column = str(_get(r, "column", "column_name", "name", "field", "attribute", default="")).strip()
-        col_type = str(_get(r, "type", "data_type", "dtype", "column_type", default="text")).strip() or "text"
+    for raw in rows:
+        r = _canonical_row(raw, _COLUMN_ALIAS_RANKS)
+        table = str(r.get("table", "")).strip()
+        column = str(r.get("column", "")).strip()
+        col_type = str(r.get("type", "text")).strip() or "text"
         if not table or not column:
             continue
-        schema = str(_get(r, "schema", "schema_name", default=default_schema)).strip() or default_schema
-
-        t = tables.setdefault(
-            table,
-            {
-                "table": table,
-                "schema": schema,
-                "table_description": None,
-                "columns": [],
-                "primary_keys": [],
-                "foreign_keys": [],
-                "row_count": _as_int(_get(r, "row_count")) or 0,
-                "field_classifications": [],
-                "sensitive_fields": [],
-                "incremental_columns": [],
-                "partition_columns": [],
-                "join_candidates": [],
-                "unit_summary": {
-                    "columns_with_units": 0,
-                    "columns_without_units": 0,
-                    "mixed_unit_groups": [],
-                    "unknown_unit_columns": [],
-                },
-                "cdc_enabled": _as_bool(_get(r, "cdc_enabled"), False),
-                "has_primary_key": False,
-                "has_foreign_keys": False,
-                "has_sensitive_fields": False,
-                "data_quality": {
-                    "findings": [],
-                    "summary": {"critical": 0, "warning": 0, "info": 0},
-                    "constraints_found": {},
-                },
-            },
-        )
+        schema = str(r.get("schema", default_schema)).strip() or default_schema
+
+        t = tables.get(table)
+        if t is None:
+            t = tables[table] = _new_table(
+                table,
+                schema,
+                row_count=_as_int(r.get("row_count")) or 0,
+                cdc_enabled=_as_bool(r.get("cdc_enabled"), False),
+            )
 
-        is_incremental = _as_bool(_get(r, "is_incremental", "incremental"), False)
-        semantic_class = _get(r, "semantic_class")
-        if semantic_class in (None, ""):
+        is_incremental = _as_bool(r.get("is_incremental"), False)
+        semantic_class = r.get("semantic_class")
+        if semantic_class is None:
             semantic_class = _infer_semantic_class(column)
         else:
             semantic_class = str(semantic_class).strip()
+        min_value = r.get("min")
+        max_value = r.get("max")
         col = {
             "name": column,
             "type": col_type,
-            "nullable": _as_bool(_get(r, "nullable", "is_nullable"), True),
-            "column_description": _get(r, "column_description", "description"),
+            "nullable": _as_bool(r.get("nullable"), True),
+            "column_description": r.get("column_description"),
             "is_incremental": is_incremental,
-            "cardinality": _as_int(_get(r, "cardinality", "distinct_count")),
-            "null_count": _as_int(_get(r, "null_count", "nulls")),
+            "cardinality": _as_int(r.get("cardinality")),
+            "null_count": _as_int(r.get("null_count")),
             "data_range": {
-                "min": None if _get(r, "min", "min_value") in (None, "") else str(_get(r, "min", "min_value")),
-                "max": None if _get(r, "max", "max_value") in (None, "") else str(_get(r, "max", "max_value")),
+                "min": None if min_value is None else str(min_value),
+                "max": None if max_value is None else str(max_value),
             },
-            "data_category": _get(r, "data_category", "category") or None,
+            "data_category": r.get("data_category") or None,
             "semantic_class": semantic_class,
             "unit_context": _build_unit_context(column, semantic_class, r),
         }
         t["columns"].append(col)
 
-        if _as_bool(_get(r, "primary_key", "pk"), False):
+        if _as_bool(r.get("primary_key"), False):
             t["primary_keys"].append(column)
         if is_incremental:
             t["incremental_columns"].append(column)
 
-        fk = str(_get(r, "foreign_key", "fk", default="")).strip()
+        fk = str(r.get("foreign_key", "")).strip()
         if fk:
             t["foreign_keys"].append({"column": column, "references": fk})
 
@@ -472,68 +671,42 @@ def _parse_columns(rows: list[dict[str, Any]], default_schema: str) -> dict[str,
     return tables
 
 
-def _merge_table_rows(tables: dict[str, dict[str, Any]], rows: list[dict[str, Any]], default_schema: str) -> None:
-    for r in rows:
-        table = str(_get(r, "table", "table_name", "entity", "object", default="")).strip()
+def _merge_table_rows(tables: dict[str, dict[str, Any]], rows: Iterable[dict[str, Any]], default_schema: str) -> None:
+    for raw in rows:
+        r = _canonical_row(raw, _TABLE_ALIAS_RANKS)
+        table = str(r.get("table", "")).strip()
         if not table:
             continue
-        t = tables.setdefault(
-            table,
-            {
-                "table": table,
-                "schema": str(_get(r, "schema", "schema_name", default=default_schema)).strip() or default_schema,
-                "table_description": None,
-                "columns": [],
-                "primary_keys": [],
-                "foreign_keys": [],
-                "row_count": 0,
-                "field_classifications": [],
-                "sensitive_fields": [],
-                "incremental_columns": [],
-                "partition_columns": [],
-                "join_candidates": [],
-                "unit_summary": {
-                    "columns_with_units": 0,
-                    "columns_without_units": 0,
-                    "mixed_unit_groups": [],
-                    "unknown_unit_columns": [],
-                },
-                "cdc_enabled": False,
-                "has_primary_key": False,
-                "has_foreign_keys": False,
-                "has_sensitive_fields": False,
-                "data_quality": {
-                    "findings": [],
-                    "summary": {"critical": 0, "warning": 0, "info": 0},
-                    "constraints_found": {},
-                },
-            },
-        )
-        if _get(r, "schema", "schema_name") not in (None, ""):
-            t["schema"] = str(_get(r, "schema", "schema_name")).strip()
-        if _get(r, "table_description", "description") not in (None, ""):
-            t["table_description"] = str(_get(r, "table_description", "description")).strip()
-        if _as_int(_get(r, "row_count", "rows")) is not None:
-            t["row_count"] = _as_int(_get(r, "row_count", "rows")) or 0
-        if _get(r, "cdc_enabled", "cdc") not in (None, ""):
-            t["cdc_enabled"] = _as_bool(_get(r, "cdc_enabled", "cdc"), False)
+        t = tables.get(table)
+        if t is None:
+            schema = str(r.get("schema", default_schema)).strip() or default_schema
+            t = tables[table] = _new_table(table, schema)
+        if "schema" in r:
+            t["schema"] = str(r["schema"]).strip()
+        if "table_description" in r:
+            t["table_description"] = str(r["table_description"]).strip()
+        row_count = _as_int(r.get("row_count"))
+        if row_count is not None:
+            t["row_count"] = row_count or 0
+        if "cdc_enabled" in r:
+            t["cdc_enabled"] = _as_bool(r["cdc_enabled"], False)
 
 
 def cmd_inspect(args: argparse.Namespace) -> None:
     out: dict[str, Any] = {"files": []}
 
     def add_file(path: str, sheet: str | None, kind: str, delimiter: str | None = None) -> None:
-        rows = _read_tabular(path, sheet, delimiter=delimiter)
+        rows = _read_tabular(path, sheet, delimiter=delimiter, use_cache=not args.no_cache)
         p = Path(path)
-        headers = _headers(rows)
+        row_count, headers, sample_rows = _scan_rows(rows, args.sample_size)
         entry = {
             "kind": kind,
             "path": path,
             "sheet": sheet,
-            "row_count": len(rows),
+            "row_count": row_count,
             "headers": headers,
             "suggested_mapping": _suggest_role(headers),
-            "sample_rows": rows[: args.sample_size],
+            "sample_rows": sample_rows,
         }
         if p.suffix.lower() == ".csv":
             entry["delimiter"] = _resolve_csv_delimiter(p, delimiter)
@@ -552,11 +725,15 @@ def cmd_inspect(args: argparse.Namespace) -> None:
 
 
 def cmd_to_json(args: argparse.Namespace) -> None:
-    col_rows = _read_tabular(args.columns_file, args.columns_sheet, delimiter=args.columns_delimiter)
+    col_rows = _read_tabular(
+        args.columns_file, args.columns_sheet, delimiter=args.columns_delimiter, use_cache=not args.no_cache
+    )
     tables = _parse_columns(col_rows, args.default_schema)
 
     if args.tables_file:
-        table_rows = _read_tabular(args.tables_file, args.tables_sheet, delimiter=args.tables_delimiter)
+        table_rows = _read_tabular(
+            args.tables_file, args.tables_sheet, delimiter=args.tables_delimiter, use_cache=not args.no_cache
+        )
         _merge_table_rows(tables, table_rows, args.default_schema)
 
     ordered_tables = [tables[k] for k in sorted(tables.keys())]
@@ -699,6 +876,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_inspect.add_argument("--tables-delimiter", default=None, help="CSV delimiter for --tables-file (auto-detected when omitted)")
     p_inspect.add_argument("--sample-size", type=int, default=5, help="Number of sample rows per file")
     p_inspect.add_argument("--output", default=None, help="Optional output JSON path")
+    p_inspect.add_argument("--no-cache", action="store_true", help="Re-parse .xlsx files instead of reusing ~/.cache/tabular_schema_json")
     p_inspect.set_defaults(func=cmd_inspect)
 
     p_to = sub.add_parser("to-json", help="Convert tabular schema files to schema.json-like output")
@@ -710,6 +888,7 @@ def build_parser() -> argparse.ArgumentParser:
     p_to.add_argument("--tables-delimiter", default=None, help="CSV delimiter for --tables-file (auto-detected when omitted)")
     p_to.add_argument("--output", required=True, help="Output JSON path")
     p_to.add_argument("--default-schema", default="public", help="Schema name used when missing in source")
+    p_to.add_argument("--no-cache", action="store_true", help="Re-parse .xlsx files instead of reusing ~/.cache/tabular_schema_json")
     p_to.set_defaults(func=cmd_to_json)
 
     p_from = sub.add_parser("from-json", help="Export schema.json to CSV templates")
@@ -22,6 +22,7 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
 from datetime import datetime, timezone
 from collections import Counter
+from contextlib import nullcontext
 from urllib.parse import quote
 
 import requests
@@ -1690,51 +1691,6 @@ def detect_sensitive_fields(columns: List[Dict]) -> Dict[str, str]:
     return result
 
 
-def _detect_partition_columns_exact(engine: Engine, table_name: str, schema: str) -> List[str]:
-    """Detect physically configured partition columns from dialect catalogs."""
-    try:
-        dialect_name = str(engine.dialect.name or "").lower()
-        with engine.connect() as conn:
-            if dialect_name == "mssql":
-                rows = conn.execute(text("""
-                    SELECT c.name
-                    FROM sys.indexes i
-                    JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
-                    JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-                    JOIN sys.tables t ON i.object_id = t.object_id
-                    JOIN sys.schemas s ON t.schema_id = s.schema_id
-                    WHERE s.name = :schema AND t.name = :table
-                        AND i.type = 1
-                        AND i.data_space_id IN (SELECT data_space_id FROM sys.data_spaces WHERE type = 'P')
-                    ORDER BY ic.key_ordinal
-                """), {"schema": schema, "table": table_name}).fetchall()
-                return [r[0] for r in rows] if rows else []
-
-            if dialect_name == "postgresql":
-                rows = conn.execute(text("""
-                    SELECT a.attname
-                    FROM pg_partitioned_table pt
-                    JOIN pg_class c ON c.oid = pt.partrelid
-                    JOIN pg_namespace n ON n.oid = c.relnamespace
-                    JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = ANY(pt.partattrs::smallint[])
-                    WHERE c.relname = :tbl AND n.nspname = :sch
-                    ORDER BY a.attnum
-                """), {"tbl": table_name, "sch": schema}).fetchall()
-                return [r[0] for r in rows] if rows else []
-
-            if dialect_name == "oracle":
-                rows = conn.execute(text("""
-                    SELECT COLUMN_NAME
-                    FROM ALL_PART_KEY_COLUMNS
-                    WHERE OWNER = :schema AND NAME = :table AND OBJECT_TYPE = 'TABLE'
-                    ORDER BY COLUMN_POSITION
-                """), {"schema": schema.upper(), "table": table_name.upper()}).fetchall()
-                return [r[0] for r in rows] if rows else []
-    except Exception:
-        pass
-    return []
-
-
 def detect_partition_columns(
     columns: List[Dict],
     table_name: Optional[str] = None,
@@ -1744,7 +1700,7 @@ def detect_partition_columns(
 ) -> tuple[List[str], str]:
     """Return partition columns and detection mode: exact|candidate|none."""
     if adapter and engine and table_name:
-        exact_columns = _detect_partition_columns_exact(engine, table_name, schema)
+        exact_columns = adapter.fetch_partition_columns(engine, table_name, schema)
         if exact_columns:
             return exact_columns, "exact"
         candidates = adapter.detect_partition_columns(engine, table_name, schema, columns)
@@ -3229,6 +3185,7 @@ _SYSTEM_TS_PATTERNS = ("created_at", "inserted_at", "created_date", "record_crea
 
 def check_late_arriving_data(engine: Engine, tables: List[Dict], schema: str, adapter=None) -> List[Dict]:
     findings = []
+    lag_supported = adapter is None or adapter.supports_late_arriving_check()
     for tbl in tables:
         table_name = tbl["table"]
         row_count = tbl.get("row_count", 0)
@@ -3249,7 +3206,7 @@ def check_late_arriving_data(engine: Engine, tables: List[Dict], schema: str, ad
         biz_name = biz_col["name"]
         sys_name = sys_col["name"]
         biz_type = biz_col.get("type", "").lower()
-        if adapter and not adapter.supports_late_arriving_check():
+        if not lag_supported or (adapter and not adapter.can_run_late_arriving(biz_type, sys_col.get("type", "").lower())):
             continue
         if adapter:
             custom_expr = adapter.get_late_arriving_biz_expr(biz_name, biz_type)
@@ -3269,8 +3226,8 @@ def check_late_arriving_data(engine: Engine, tables: List[Dict], schema: str, ad
                 SELECT COUNT(*) AS total, COUNT(*) FILTER (WHERE lh > 24) AS late_1d, COUNT(*) FILTER (WHERE lh > 168) AS late_7d,
                        ROUND(MIN(lh)::numeric, 2) AS min_h, ROUND(AVG(lh)::numeric, 2) AS avg_h,
                        ROUND(PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY lh)::numeric, 2) AS p95_h, ROUND(MAX(lh)::numeric, 2) AS max_h
-                FROM (SELECT EXTRACT(EPOCH FROM ("{sys_name}" - {biz_expr}))/3600.0 AS lh FROM "{schema}"."{table_name}" WHERE "{sys_name}" IS NOT NULL AND "{biz_name}" IS NOT NULL) sub
-                WHERE lh >= 0
+                FROM (SELECT EXTRACT(EPOCH FROM ("{sys_name}" - {biz_expr}))/3600.0 AS lh FROM "{schema}"."{table_name}"
+                      WHERE "{sys_name}" IS NOT NULL AND "{biz_name}" IS NOT NULL AND "{sys_name}" >= {biz_expr}) sub
             """)
         try:
             with engine.connect() as conn:
@@ -3489,6 +3446,7 @@ def build_source_system_document(
     generate_missing_descriptions: bool = True,
     system_description: Optional[str] = None,
     system_description_config_path: Optional[str] = None,
+    introspection_cache_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Analyze source database schema and data quality and return the schema document."""
     config = config or load_config(tool_name="source_system_analyzer")
@@ -3515,21 +3473,31 @@ def build_source_system_document(
     logger.info(f"Starting source system analysis for schema: {schema}")
 
     try:
-        schema_meta = fetch_schema_metadata(engine, schema=schema, config=config)
-        tables = schema_meta["tables"]
-        all_columns = schema_meta["columns"]
-        all_pks = schema_meta["primary_keys"]
-        all_fks = schema_meta["foreign_keys"]
-
-        if not tables:
-            logger.warning("No tables found to analyze.")
-            return {"error": "No tables found"}
-
-        logger.info(f"Found {len(tables)} tables")
-
-        connection_info = parse_connection_info(engine)
-        db_timezone = fetch_database_timezone(engine, adapter=adapter)
-        row_counts = fetch_row_counts(engine, tables, schema=schema, adapter=adapter)
+        # Catalog reads share one pinned connection; it is released before the
+        # per-table analysis and description calls.
+        with adapter.session(engine) if adapter else nullcontext():
+            if introspection_cache_path and adapter and adapter.load_cache(introspection_cache_path, engine, schema):
+                logger.info("Reusing introspection cache %s for schema %s", introspection_cache_path, schema)
+            schema_meta = fetch_schema_metadata(engine, schema=schema, config=config)
+            tables = schema_meta["tables"]
+            all_columns = schema_meta["columns"]
+            all_pks = schema_meta["primary_keys"]
+            all_fks = schema_meta["foreign_keys"]
+
+            if not tables:
+                logger.warning("No tables found to analyze.")
+                return {"error": "No tables found"}
+
+            logger.info(f"Found {len(tables)} tables")
+
+            connection_info = parse_connection_info(engine)
+            db_timezone = fetch_database_timezone(engine, adapter=adapter)
+            row_counts = fetch_row_counts(engine, tables, schema=schema, adapter=adapter)
+            if adapter:
+                # Warm every schema-level catalog lookup at once; the adapter calls below are cache hits.
+                adapter.fetch_all_parallel(engine, schema)
+            table_descriptions = adapter.fetch_table_descriptions(engine, schema) if adapter else {}
+            column_descriptions = adapter.fetch_column_descriptions(engine, schema) if adapter else {}
         openmetadata_classifications = fetch_openmetadata_classification_catalog()
         openmetadata_glossary_assignments, openmetadata_enrichment = _fetch_openmetadata_glossary_assignments(
             database_name=str(connection_info.get("database") or ""),
@@ -3558,9 +3526,6 @@ def build_source_system_document(
         stored_projection_lookup = _projection_lookup(engine, config)
         for key, value in stored_projection_lookup.items():
             projection_lookup.setdefault(key, value)
-        table_descriptions = adapter.fetch_table_descriptions(engine, schema) if adapter else {}
-        column_descriptions = adapter.fetch_column_descriptions(engine, schema) if adapter else {}
-
         enriched_tables = []
         total_rows = 0
 
@@ -3968,6 +3933,12 @@ def build_source_system_document(
             "tables": enriched_tables,
         }
 
+        if adapter and introspection_cache_path:
+            try:
+                adapter.save_cache(introspection_cache_path, engine, schema)
+            except OSError as e:
+                logger.warning(f"Could not write introspection cache {introspection_cache_path}: {e}")
+
         return schema_document
 
     except Exception as e:
@@ -3985,6 +3956,7 @@ def analyze_source_system(
     generate_missing_descriptions: bool = True,
     system_description: Optional[str] = None,
     system_description_config_path: Optional[str] = None,
+    introspection_cache_path: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Analyze source database schema and data quality, save combined output to schema.json."""
     schema_document = build_source_system_document(
@@ -3996,6 +3968,7 @@ def analyze_source_system(
         generate_missing_descriptions=generate_missing_descriptions,
         system_description=system_description,
         system_description_config_path=system_description_config_path,
+        introspection_cache_path=introspection_cache_path,
     )
 
     if schema_document.get("error") == "db_analysis_config_required":
@@ -4056,6 +4029,11 @@ if __name__ == "__main__":
         default=None,
         help="Path to the JSON file that stores the persisted system description (default: source-system-description.json).",
     )
+    parser.add_argument(
+        "--introspection-cache",
+        default=None,
+        help="Reuse catalog introspection results from this file while the schema's DDL is unchanged (opt-in).",
+    )
     args = parser.parse_args()
     if args.system_description is not None:
         config_path = _save_system_description_config(
@@ -4076,6 +4054,7 @@ if __name__ == "__main__":
         dialect_override=args.dialect,
         system_description=args.system_description,
         system_description_config_path=args.system_description_config,
+        introspection_cache_path=args.introspection_cache,
     )
     if result.get("error") == "db_analysis_config_required":
         print(json.dumps(result, indent=2))
@@ -51,8 +51,10 @@ sqlalchemy.text = lambda value: value
 sqlalchemy.func = types.SimpleNamespace(count=lambda *args, **kwargs: None)
 sqlalchemy_engine = types.ModuleType("sqlalchemy.engine")
 sqlalchemy_engine.Engine = object
+sqlalchemy_engine.Connection = object
 sqlalchemy_exc = types.ModuleType("sqlalchemy.exc")
 sqlalchemy_exc.SAWarning = Warning
+sqlalchemy_exc.DatabaseError = Exception
 sys.modules["sqlalchemy"] = sqlalchemy
 sys.modules["sqlalchemy.engine"] = sqlalchemy_engine
 sys.modules["sqlalchemy.exc"] = sqlalchemy_exc
@@ -0,0 +1,102 @@
+import importlib.util
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+MODULE_PATH = Path("/home/filip/Projects/skills/.cursor/skills/source-system-analyser/scripts/apis/api_analyzer.py")
+SPEC = importlib.util.spec_from_file_location("api_analyzer", MODULE_PATH)
+api_analyzer = importlib.util.module_from_spec(SPEC)
+assert SPEC and SPEC.loader
+SPEC.loader.exec_module(api_analyzer)
+
+
+def _large_rows(row_count):
+    rows = [
+        {"id": index, "customer_id": index, "amount": index % 100, "note": "x", "email": "a@b.co"}
+        for index in range(row_count)
+    ]
+    # Outliers placed after the first sample-sized block of rows.
+    rows[-1]["note"] = None
+    rows[-1]["amount"] = 1000000
+    rows[-2]["customer_id"] = rows[-3]["customer_id"]
+    return rows
+
+
+def _analyze(data):
+    return api_analyzer._analyze_table_payload("orders", {"data": data}, {}, "dbo", ["orders"])
+
+
+def _column(entry, name):
+    return next(col for col in entry["columns"] if col["name"] == name)
+
+
+class ApiAnalyzerSamplingTests(unittest.TestCase):
+    def test_streamed_table_above_sample_size_keeps_exact_schema_facts(self):
+        row_count = api_analyzer._SAMPLE_SIZE * 5
+        entry = _analyze(iter(_large_rows(row_count)))
+
+        self.assertEqual(entry["row_count"], row_count)
+        note = _column(entry, "note")
+        self.assertEqual(note["null_count"], 1)
+        self.assertTrue(note["nullable"])
+        self.assertEqual(_column(entry, "amount")["data_range"], {"min": "0.0", "max": "1000000.0"})
+        self.assertEqual(entry["primary_keys"], ["id"])
+
+    def test_materialized_table_above_sample_size_keeps_exact_schema_facts(self):
+        row_count = api_analyzer._SAMPLE_SIZE * 5
+        entry = _analyze(_large_rows(row_count))
+
+        self.assertEqual(entry["row_count"], row_count)
+        self.assertEqual(_column(entry, "note")["null_count"], 1)
+        self.assertEqual(_column(entry, "amount")["data_range"]["max"], "1000000.0")
+        self.assertEqual(entry["primary_keys"], ["id"])
+        self.assertEqual(_column(entry, "id")["cardinality"], row_count)
+        self.assertNotIn("cardinality_estimated", _column(entry, "id"))
+
+    def test_sketched_cardinality_is_labelled_and_bounded_by_row_count(self):
+        row_count = api_analyzer._SAMPLE_SIZE + 1
+        rows = _large_rows(row_count)
+        for row in rows:
+            row["customer_id"] = row["id"] % 5000
+        customer_id = _column(_analyze(rows), "customer_id")
+
+        self.assertTrue(customer_id["cardinality_estimated"])
+        self.assertLessEqual(customer_id["cardinality"], row_count)
+        self.assertAlmostEqual(customer_id["cardinality"], 5000, delta=500)
+        self.assertNotIn("cardinality_estimated", _column(_analyze(rows), "amount"))
+
+    def test_mixed_scalar_types_keep_strings_apart_from_numbers(self):
+        entry = _analyze(iter([{"id": 1, "code": value} for value in (1, "1", 1.0, True)]))
+
+        self.assertEqual(_column(entry, "code")["cardinality"], 2)
+
+    def test_sketch_hashes_typed_values_without_str(self):
+        counter = api_analyzer._DistinctCounter()
+        values = list(range(20000)) + [str(value) for value in range(20000)]
+        with patch.object(api_analyzer, "str", side_effect=AssertionError("str() called"), create=True):
+            counter.update({(type(value) is str, value) for value in values})
+
+        self.assertFalse(counter.is_exact)
+        self.assertAlmostEqual(counter.count(), 40000, delta=4000)
+        self.assertNotEqual(
+            api_analyzer._stable_hash64((False, 1)), api_analyzer._stable_hash64((True, "1"))
+        )
+
+    def test_only_format_findings_are_marked_sampled(self):
+        row_count = api_analyzer._SAMPLE_SIZE + 1
+        rows = _large_rows(row_count)
+        for row in rows:
+            row["email"] = "not-an-email"
+        entry = _analyze(iter(rows))
+
+        format_findings = entry["data_quality"]["format_inconsistency"]
+        self.assertEqual(len(format_findings), 1)
+        self.assertTrue(format_findings[0]["sampled"])
+        self.assertIn(f"sample of {row_count} rows", format_findings[0]["message"])
+        for finding in entry["data_quality"]["nullable_but_never_null"]:
+            self.assertNotIn("sampled", finding)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+MODULE_PATH = Path("/home/filip/Projects/skills/.cursor/skills/source-system-analyser/scripts/apis/api_analyzer.py")
+SPEC = importlib.util.spec_from_file_location("api_analyzer", MODULE_PATH)
+api_analyzer = importlib.util.module_from_spec(SPEC)
+assert SPEC and SPEC.loader
+SPEC.loader.exec_module(api_analyzer)
+
+
+@unittest.skipUnless(api_analyzer.IJSON_AVAILABLE, "ijson is not installed")
+class ApiAnalyzerStreamingTests(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.data_dir = Path(tmpdir.name)
+        # Every table file is treated as large enough to stream.
+        patcher = patch.object(api_analyzer, "_STREAM_MIN_BYTES", 1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write(self, name, text):
+        (self.data_dir / f"{name}.json").write_text(text, encoding="utf-8")
+
+    def test_header_keys_before_data_are_read_in_one_parse_pass(self):
+        self._write("orders", json.dumps({
+            "schema": "sales",
+            "metadata": {"columns": [{"name": "id", "type": "integer", "nullable": False}]},
+            "data": [{"id": 1}, {"id": 2}],
+        }))
+
+        with patch.object(api_analyzer.ijson, "parse", wraps=api_analyzer.ijson.parse) as parse:
+            payload = api_analyzer._load_table_payload(self.data_dir, "orders")
+        entry = api_analyzer._analyze_table_payload("orders", payload, {}, "dbo", ["orders"])
+
+        self.assertEqual(parse.call_count, 1)
+        self.assertEqual(payload["schema"], "sales")
+        self.assertEqual(entry["schema"], "sales")
+        self.assertEqual(entry["row_count"], 2)
+        self.assertEqual(entry["columns"][0]["data_range"], {"min": "1.0", "max": "2.0"})
+
+    def test_header_scan_stops_at_the_records(self):
+        self._write("orders", json.dumps({
+            "metadata": {},
+            "data": [{"id": index} for index in range(1000)],
+            "schema": "sales",
+        }))
+        events = []
+        parse = api_analyzer.ijson.parse
+
+        def counting_parse(*args, **kwargs):
+            for event in parse(*args, **kwargs):
+                events.append(event)
+                yield event
+
+        with patch.object(api_analyzer.ijson, "parse", side_effect=counting_parse):
+            payload = api_analyzer._load_table_payload(self.data_dir, "orders")
+        entry = api_analyzer._analyze_table_payload("orders", payload, {}, "dbo", ["orders"])
+
+        self.assertLess(len(events), 10)
+        self.assertNotIn("schema", payload)
+        self.assertEqual(entry["schema"], "dbo")
+        self.assertEqual(entry["row_count"], 1000)
+
+    def test_records_ijson_rejects_fall_back_to_the_stdlib_parser(self):
+        self._write("orders", '{"schema": "sales", "metadata": {}, "data": [{"id": 1}, {"id": NaN}, {"id": 3}]}')
+
+        payload = api_analyzer._load_table_payload(self.data_dir, "orders")
+        entry = api_analyzer._analyze_table_payload("orders", payload, {}, "dbo", ["orders"])
+
+        self.assertEqual(entry["row_count"], 3)
+
+    def test_truncated_file_raises_the_same_error_as_the_loaded_path(self):
+        self._write("orders", '{"schema": "sales", "metadata": {}, "data": [{"id": 1}, {"id": 2')
+
+        payload = api_analyzer._load_table_payload(self.data_dir, "orders")
+        with self.assertRaises(json.JSONDecodeError):
+            api_analyzer._analyze_table_payload("orders", payload, {}, "dbo", ["orders"])
+        with patch.object(api_analyzer, "_STREAM_MIN_BYTES", 1 << 40), self.assertRaises(json.JSONDecodeError):
+            api_analyzer._load_table_payload(self.data_dir, "orders")
+
+
+if __name__ == "__main__":
+    unittest.main()
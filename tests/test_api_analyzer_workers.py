@@ -0,0 +1,58 @@
+import importlib.util
+import json
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+
+MODULE_PATH = Path("/home/filip/Projects/skills/.cursor/skills/source-system-analyser/scripts/apis/api_analyzer.py")
+SPEC = importlib.util.spec_from_file_location("api_analyzer", MODULE_PATH)
+api_analyzer = importlib.util.module_from_spec(SPEC)
+assert SPEC and SPEC.loader
+SPEC.loader.exec_module(api_analyzer)
+
+
+class ApiAnalyzerWorkerTests(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.root = Path(tmpdir.name)
+        self.data_dir = self.root / "data"
+        self.data_dir.mkdir()
+        for table in ("customers", "orders"):
+            (self.data_dir / f"{table}.json").write_text(json.dumps({"data": [{"id": 1}, {"id": 2}]}), encoding="utf-8")
+        self.discovery = self.root / "discovery.json"
+        self.discovery.write_text(json.dumps({"tables": ["customers", "orders"]}), encoding="utf-8")
+
+    def _analyze(self):
+        return api_analyzer.analyze_api_data(self.discovery, self.data_dir, "https://api.example.test")
+
+    def test_small_inputs_are_analyzed_without_a_process_pool(self):
+        with patch.object(api_analyzer.os, "cpu_count", return_value=4), \
+             patch.object(api_analyzer, "ProcessPoolExecutor") as pool:
+            document = self._analyze()
+
+        pool.assert_not_called()
+        self.assertEqual([table["table"] for table in document["tables"]], ["customers", "orders"])
+
+    def test_large_inputs_use_the_process_pool(self):
+        with patch.object(api_analyzer, "_PARALLEL_MIN_BYTES", 1), \
+             patch.object(api_analyzer.os, "cpu_count", return_value=4), \
+             patch.object(api_analyzer, "ProcessPoolExecutor", side_effect=ThreadPoolExecutor) as pool:
+            document = self._analyze()
+
+        pool.assert_called_once()
+        self.assertEqual([table["table"] for table in document["tables"]], ["customers", "orders"])
+
+    def test_table_files_size_counts_each_table_once(self):
+        (self.data_dir / "orders").write_bytes(b"{}")
+
+        size = api_analyzer._table_files_size(self.data_dir, ["customers", "orders", "missing"])
+
+        self.assertEqual(size, (self.data_dir / "customers.json").stat().st_size + 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+MODULE_PATH = Path("/home/filip/Projects/skills/.cursor/skills/source-system-analyser/scripts/apis/api_reader.py")
+SPEC = importlib.util.spec_from_file_location("api_reader", MODULE_PATH)
+api_reader = importlib.util.module_from_spec(SPEC)
+assert SPEC and SPEC.loader
+SPEC.loader.exec_module(api_reader)
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b"", etag=None):
+        self.status_code = status_code
+        self.headers = {"ETag": etag} if etag else {}
+        self.content = content
+        self.encoding = "utf-8"
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeDiscoverySession:
+    """Serves /api/tables with an ETag and answers a matching If-None-Match with 304."""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.requests = []
+
+    def get(self, url, timeout=30, headers=None):
+        self.requests.append((url, dict(headers or {})))
+        if not url.endswith("/api/tables"):
+            return FakeResponse(404)
+        if (headers or {}).get("If-None-Match") == '"v1"':
+            return FakeResponse(304)
+        return FakeResponse(200, json.dumps({"tables": self.tables}).encode("utf-8"), etag='"v1"')
+
+
+class ApiReaderDiscoveryCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.flat_dir = tmpdir.name
+        self.output = str(Path(tmpdir.name) / "result.json")
+        patcher = patch.object(api_reader, "_load_dotenv")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _discover(self, session, token):
+        argv = ["http://api.test", "--discover", "--flat-dir", self.flat_dir, "--bearer", token, "-o", self.output]
+        with patch.object(api_reader, "_build_session", return_value=session):
+            api_reader.main(argv)
+        result = json.loads(Path(self.output).read_text(encoding="utf-8"))
+        return result.get("tables")
+
+    def _tables_request_headers(self, session):
+        return [headers for url, headers in session.requests if url.endswith("/api/tables")]
+
+    def test_200_with_etag_is_cached_without_the_token(self):
+        self.assertEqual(self._discover(FakeDiscoverySession(["orders"]), "secret-a"), ["orders"])
+
+        cache_text = (Path(self.flat_dir) / api_reader.DISCOVERY_CACHE_FILE).read_text(encoding="utf-8")
+        cache = json.loads(cache_text)
+        self.assertEqual([entry["etag"] for entry in cache.values()], ['"v1"'])
+        self.assertNotIn("secret-a", cache_text)
+
+    def test_304_returns_the_cached_body_for_the_same_credentials(self):
+        self._discover(FakeDiscoverySession(["orders"]), "secret-a")
+
+        session = FakeDiscoverySession(["changed"])
+        self.assertEqual(self._discover(session, "secret-a"), ["orders"])
+        self.assertEqual(self._tables_request_headers(session), [{"If-None-Match": '"v1"'}])
+
+    def test_other_credentials_do_not_reuse_the_cached_body(self):
+        self._discover(FakeDiscoverySession(["orders"]), "secret-a")
+
+        session = FakeDiscoverySession(["invoices"])
+        self.assertEqual(self._discover(session, "secret-b"), ["invoices"])
+        self.assertEqual(self._tables_request_headers(session), [{}])
+
+    def test_headers_digest_depends_on_every_header(self):
+        digest = api_reader._headers_digest({"Authorization": "Bearer a"})
+
+        self.assertEqual(digest, api_reader._headers_digest({"authorization": "Bearer a"}))
+        self.assertNotEqual(digest, api_reader._headers_digest({"Authorization": "Bearer b"}))
+        self.assertNotEqual(digest, api_reader._headers_digest({"Authorization": "Bearer a", "X-API-Key": "k"}))
+
+    def test_entries_for_other_credentials_are_dropped_on_save(self):
+        self._discover(FakeDiscoverySession(["orders"]), "secret-a")
+        self._discover(FakeDiscoverySession(["invoices"]), "secret-b")
+
+        cache = json.loads((Path(self.flat_dir) / api_reader.DISCOVERY_CACHE_FILE).read_text(encoding="utf-8"))
+        digest = api_reader._headers_digest({"Authorization": "Bearer secret-b"})
+        self.assertEqual(list(cache), [f"{digest} http://api.test/api/tables"])
+        self.assertEqual(cache[f"{digest} http://api.test/api/tables"]["data"], {"tables": ["invoices"]})
+
+    def test_cache_file_is_replaced_atomically(self):
+        self._discover(FakeDiscoverySession(["orders"]), "secret-a")
+        with patch.object(api_reader.json, "dump", side_effect=OSError("disk full")):
+            self._discover(FakeDiscoverySession(["orders"]), "secret-b")
+
+        cache = json.loads((Path(self.flat_dir) / api_reader.DISCOVERY_CACHE_FILE).read_text(encoding="utf-8"))
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(sorted(path.name for path in Path(self.flat_dir).iterdir()),
+                         sorted([api_reader.DISCOVERY_CACHE_FILE, "result.json"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
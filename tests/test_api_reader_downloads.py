@@ -1,8 +1,12 @@
 import importlib.util
+import io
 import json
+import re
 import tempfile
+import threading
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 
 MODULE_PATH = Path("/home/filip/Projects/skills/.cursor/skills/source-system-analyser/scripts/apis/api_reader.py")
@@ -17,6 +21,7 @@ class FakeResponse:
         self.status_code = status_code
         self.headers = {"Content-Type": content_type, "Content-Length": str(len(content))}
         self._content = content
+        self.raw = io.BytesIO(content)
         self._payload = payload if payload is not None else {}
 
     @property
@@ -38,10 +43,69 @@ class FakeSession:
         return self.response
 
 
+class RangeResponse(FakeResponse):
+    def __init__(self, *, status_code, content, headers=None):
+        super().__init__(status_code=status_code, content_type="application/octet-stream", content=content)
+        self.headers.update(headers or {})
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class RangeSession:
+    """Serves ``body`` with Accept-Ranges; ``range_status``/``short`` break the range GETs."""
+
+    def __init__(self, body, range_status=206, short=False):
+        self.body = body
+        self.range_status = range_status
+        self.short = short
+        self.responses = []
+        self.open_at_range = []
+        self.lock = threading.Lock()
+
+    def get(self, url, timeout=30, stream=False, headers=None):
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", (headers or {}).get("Range", ""))
+        with self.lock:
+            if match is None:
+                response = RangeResponse(status_code=200, content=self.body, headers={"Accept-Ranges": "bytes"})
+            else:
+                self.open_at_range.append([r for r in self.responses if not r.closed])
+                start, end = int(match.group(1)), int(match.group(2)) + 1
+                content = self.body[start:end - 1] if self.short else self.body[start:end]
+                response = RangeResponse(status_code=self.range_status, content=content)
+            self.responses.append(response)
+        return response
+
+
 class ApiReaderDownloadTests(unittest.TestCase):
     def test_filename_from_url_uses_last_path_segment(self):
         self.assertEqual(api_reader._filename_from_url("https://example.com/api/analyze?schema=dbo"), "analyze")
 
+    def test_session_retries_connects_and_gateway_errors_but_not_read_timeouts(self):
+        session = api_reader._build_session({})
+        retry = session.get_adapter("https://example.com").max_retries
+
+        self.assertEqual((retry.total, retry.connect, retry.read), (3, 3, 0))
+        self.assertEqual(set(retry.status_forcelist), {502, 503, 504})
+        self.assertEqual(session.get_adapter("http://example.com")._pool_maxsize, api_reader.FETCH_WORKERS)
+
+    def test_target_directory_is_recreated_after_deletion(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            download_dir = Path(tmpdir) / "downloads"
+            for _ in range(2):
+                destination = api_reader._target_destination(None, str(download_dir), "https://example.com/a.csv", False, tmpdir)
+                self.assertTrue(download_dir.is_dir())
+                download_dir.rmdir()
+            self.assertEqual(destination, str(download_dir / "a.csv"))
+
     def test_json_download_adds_json_suffix_and_pretty_prints(self):
         response = FakeResponse(
             content_type="application/json; charset=utf-8",
@@ -70,5 +134,51 @@ class ApiReaderDownloadTests(unittest.TestCase):
             self.assertEqual(written.read_bytes(), b"hello")
 
 
+class ApiReaderRangedDownloadTests(unittest.TestCase):
+    BODY = bytes(range(256)) * 4
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.destination = str(Path(tmpdir.name) / "blob.bin")
+        for name, value in (("RANGE_MIN_BYTES", 100), ("RANGE_CHUNK_BYTES", 100)):
+            patcher = patch.object(api_reader, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _download(self, session):
+        result = api_reader._fetch_url(session, "https://example.com/blob.bin", 30, destination=self.destination)
+        self.assertEqual(Path(result["downloaded_to"]).read_bytes(), self.BODY)
+        return result
+
+    def test_ranged_download_assembles_the_chunks(self):
+        session = RangeSession(self.BODY)
+
+        self._download(session)
+
+        self.assertEqual(len(session.responses), 1 + 11)
+        self.assertTrue(all(r.closed for r in session.responses))
+        # The first response is closed before any range GET takes a pooled connection.
+        self.assertNotIn(session.responses[0], [r for open_ in session.open_at_range for r in open_])
+
+    def test_non_206_range_falls_back_to_a_full_download(self):
+        session = RangeSession(self.BODY, range_status=200)
+
+        result = self._download(session)
+
+        self.assertEqual(result["status_code"], 200)
+        self.assertTrue(session.responses[-1].closed)
+
+    def test_short_range_response_falls_back_to_a_full_download(self):
+        self._download(RangeSession(self.BODY, short=True))
+
+    def test_range_gets_wait_for_a_free_connection_slot(self):
+        session = RangeSession(self.BODY)
+        with patch.object(api_reader, "_CONNECTION_SLOTS", threading.BoundedSemaphore(1)):
+            self._download(session)
+
+        self.assertTrue(all(open_ == [] for open_ in session.open_at_range))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,74 @@
+import codecs
+import importlib.util
+import mmap
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+MODULE_PATH = Path("/home/filip/Projects/skills/.cursor/skills/source-system-analyser/scripts/apis/api_reader.py")
+SPEC = importlib.util.spec_from_file_location("api_reader", MODULE_PATH)
+api_reader = importlib.util.module_from_spec(SPEC)
+assert SPEC and SPEC.loader
+SPEC.loader.exec_module(api_reader)
+
+
+class ApiReaderFlatFileTests(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.flat_dir = tmpdir.name
+        patcher = patch.object(api_reader, "DOWNLOAD_BUFFER_BYTES", 3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _write(self, name, content):
+        (Path(self.flat_dir) / name).write_bytes(content)
+
+    def test_utf8_check_decodes_fixed_size_slices(self):
+        content = "héllo wörld ".encode("utf-8") * 50
+        self._write("notes.txt", content)
+        sizes = []
+        real_decoder = codecs.getincrementaldecoder("utf-8")
+
+        class RecordingDecoder(real_decoder):
+            def decode(self, data, final=False):
+                sizes.append(len(data))
+                return super().decode(data, final)
+
+        with open(Path(self.flat_dir) / "notes.txt", "rb") as f, \
+             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+             patch.object(api_reader.codecs, "getincrementaldecoder", return_value=RecordingDecoder):
+            self.assertTrue(api_reader._is_utf8(mm))
+
+        self.assertLessEqual(max(sizes), 3)
+        self.assertEqual(sum(sizes), len(content))
+
+    def test_text_split_mid_character_is_still_utf8(self):
+        self._write("notes.txt", "héllo wörld ".encode("utf-8") * 50)
+
+        entry = api_reader._read_flat_file(self.flat_dir, "notes.txt")
+
+        self.assertTrue(entry["text_preview"].startswith("héllo wörld"))
+        self.assertNotIn("binary", entry)
+
+    def test_invalid_utf8_is_reported_as_binary(self):
+        self._write("blob.bin", b"abc" * 10 + b"\xff\xfe" + b"x" * 10)
+        self._write("broken.json", b'{"a": \xff}')
+
+        for name in ("blob.bin", "broken.json"):
+            entry = api_reader._read_flat_file(self.flat_dir, name)
+            self.assertTrue(entry["binary"], name)
+            self.assertEqual(entry["preview_hex"], (Path(self.flat_dir) / name).read_bytes()[:120].hex())
+
+    def test_json_rejected_by_orjson_is_parsed_by_the_stdlib(self):
+        self._write("values.json", b'{"a": NaN, "b": [1, 2]}')
+
+        entry = api_reader._read_flat_file(self.flat_dir, "values.json")
+
+        self.assertEqual(entry["data"]["b"], [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,8 +15,10 @@ sqlalchemy.Table = object
 sqlalchemy.select = lambda *args, **kwargs: None
 sqlalchemy_engine = types.ModuleType("sqlalchemy.engine")
 sqlalchemy_engine.Engine = object
+sqlalchemy_engine.Connection = object
 sqlalchemy_exc = types.ModuleType("sqlalchemy.exc")
 sqlalchemy_exc.SAWarning = Warning
+sqlalchemy_exc.DatabaseError = Exception
 databases = types.ModuleType("databases")
 databases.get_adapter = lambda *args, **kwargs: None
 databases.get_adapter_for_engine = lambda *args, **kwargs: None
@@ -11,6 +11,7 @@ sqlalchemy.select = lambda *args, **kwargs: None
 sqlalchemy.text = lambda value: value
 sqlalchemy_engine = types.ModuleType("sqlalchemy.engine")
 sqlalchemy_engine.Engine = object
+sqlalchemy_engine.Connection = object
 sys.modules.setdefault("sqlalchemy", sqlalchemy)
 sys.modules.setdefault("sqlalchemy.engine", sqlalchemy_engine)
 
@@ -0,0 +1,281 @@
+import importlib.util
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+
+PACKAGE_DIR = Path("/home/fillip/projec/cursorskills/.cursor/skills/source-system-analyser/scripts/databases")
+
+
+def _load_adapters_package():
+    # Other test modules stub ``databases`` and ``sqlalchemy`` in sys.modules, so
+    # the package is loaded under its own name against the real sqlalchemy.
+    stubs = {name: sys.modules.pop(name) for name in list(sys.modules) if name.split(".")[0] == "sqlalchemy"}
+    try:
+        spec = importlib.util.spec_from_file_location(
+            "dialect_adapters", PACKAGE_DIR / "__init__.py", submodule_search_locations=[str(PACKAGE_DIR)]
+        )
+        package = importlib.util.module_from_spec(spec)
+        sys.modules["dialect_adapters"] = package
+        spec.loader.exec_module(package)
+        return package
+    finally:
+        for name in [name for name in sys.modules if name.split(".")[0] == "sqlalchemy"]:
+            del sys.modules[name]
+        sys.modules.update(stubs)
+
+
+dialect_adapters = _load_adapters_package()
+base = sys.modules["dialect_adapters.base"]
+PostgresqlAdapter = dialect_adapters.PostgresqlAdapter
+
+
+class FakeResult:
+    def __init__(self, value=None, rows=None):
+        self._value = value
+        self._rows = rows or []
+
+    def scalar(self):
+        return self._value
+
+    def scalars(self):
+        return iter(row[0] for row in self._rows)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self.engine = engine
+        self.closed = False
+        self.rollbacks = 0
+        self.execution_options = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.closed = True
+        return False
+
+    def execute(self, statement, params=None, execution_options=None):
+        self.engine.statements.append(self)
+        self.execution_options.append(execution_options)
+        if self.engine.fail or statement in self.engine.failing:
+            raise RuntimeError("query failed")
+        return FakeResult(value="UTC", rows=self.engine.rows_by_statement.get(statement, self.engine.rows))
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+class FakeEngine:
+    def __init__(self):
+        self.connections = []
+        self.statements = []
+        self.fail = False
+        self.rows = []
+        self.rows_by_statement = {}
+        self.failing = set()
+        self.url = types.SimpleNamespace(render_as_string=lambda hide_password: "postgresql://user@localhost/demo")
+
+    def connect(self):
+        conn = FakeConnection(self)
+        self.connections.append(conn)
+        return conn
+
+
+class DialectAdapterSessionTests(unittest.TestCase):
+    def test_session_pins_one_connection_until_exit(self):
+        adapter = PostgresqlAdapter()
+        engine = FakeEngine()
+
+        with adapter.session(engine) as pinned:
+            adapter.fetch_database_timezone(engine)
+            adapter.fetch_ddl_marker(engine, "public")
+            self.assertFalse(pinned.closed)
+        self.assertTrue(pinned.closed)
+        self.assertEqual(engine.connections, [pinned])
+        self.assertEqual(engine.statements, [pinned, pinned])
+
+        adapter.fetch_ddl_marker(engine, "public")
+        self.assertEqual(len(engine.connections), 2)
+        self.assertTrue(engine.connections[1].closed)
+
+    def test_failed_query_rolls_back_and_keeps_the_pinned_connection(self):
+        adapter = PostgresqlAdapter()
+        engine = FakeEngine()
+
+        with adapter.session(engine) as pinned:
+            engine.fail = True
+            with self.assertRaises(RuntimeError):
+                adapter.fetch_ddl_marker(engine, "public")
+            engine.fail = False
+            adapter.fetch_ddl_marker(engine, "public")
+
+        self.assertEqual(pinned.rollbacks, 1)
+        self.assertEqual(engine.connections, [pinned])
+
+
+    def test_postgresql_bulk_query_is_streamed(self):
+        adapter = PostgresqlAdapter()
+        engine = FakeEngine()
+
+        adapter.fetch_schema_bulk(engine, "public")
+
+        self.assertEqual(engine.connections[0].execution_options, [{"stream_results": True, "yield_per": 1000}])
+
+
+BULK_ROWS = [
+    ("checks", "orders", "amount", "orders_amount_check", "(amount > 0)", None),
+    ("uniques", "orders", "order_no", None, None, None),
+    ("enums", "orders", "status", None, "shipped", 2.0),
+    ("enums", "orders", "status", None, "new", 1.0),
+    ("table_desc", "orders", None, None, "Customer orders", None),
+    ("col_desc", "orders", "amount", None, "Gross amount", None),
+]
+
+
+class MarkedPostgresqlAdapter(PostgresqlAdapter):
+    def __init__(self, marker):
+        super().__init__()
+        self.marker = marker
+
+    def fetch_ddl_marker(self, engine, schema):
+        return self.marker
+
+
+class SchemaBulkTests(unittest.TestCase):
+    def test_schema_bulk_rows_are_bucketed_by_kind(self):
+        bulk = base.DialectAdapter._schema_bulk_from_rows(BULK_ROWS + [
+            ("uniques", "orders", "ref", None, None, None),
+            ("table_desc", "empty", None, None, None, None),
+        ])
+
+        self.assertEqual(bulk["checks"], {
+            "orders": [{"column": "amount", "constraint_name": "orders_amount_check", "check_clause": "(amount > 0)"}],
+        })
+        self.assertEqual(bulk["uniques"], {"orders": frozenset({"order_no", "ref"})})
+        self.assertEqual(bulk["enums"], {"orders": {"status": ("new", "shipped")}})
+        self.assertEqual(bulk["table_desc"], {"orders": "Customer orders"})
+        self.assertEqual(bulk["col_desc"], {"orders": {"amount": "Gross amount"}})
+
+    def test_failed_bulk_query_falls_back_to_one_query_per_kind(self):
+        postgresql = sys.modules["dialect_adapters.postgresql"]
+        queries = postgresql._PG_SCHEMA_KIND_QUERIES
+        engine = FakeEngine()
+        engine.failing = {postgresql._PG_SCHEMA_BULK_SQL, queries["checks"]}
+        engine.rows_by_statement = {
+            query: [row for row in BULK_ROWS if row[0] == kind] for kind, query in queries.items()
+        }
+
+        with self.assertLogs(base.logger, level="WARNING") as logs:
+            adapter = PostgresqlAdapter()
+            checks = adapter.fetch_check_constraints(engine, "public")
+            uniques = adapter.fetch_unique_constraints(engine, "public")
+            table_descriptions = adapter.fetch_table_descriptions(engine, "public")
+            column_descriptions = adapter.fetch_column_descriptions(engine, "public")
+
+        self.assertEqual(checks, {})
+        self.assertEqual(uniques, {"orders": frozenset({"order_no"})})
+        self.assertEqual(adapter.fetch_enum_columns(engine, "public"), {"orders": {"status": ("new", "shipped")}})
+        self.assertEqual(table_descriptions, {"orders": "Customer orders"})
+        self.assertEqual(column_descriptions, {"orders": {"amount": "Gross amount"}})
+        self.assertEqual(len(engine.statements), 1 + len(queries))
+        self.assertTrue(any("Could not fetch CHECK constraints" in line for line in logs.output))
+
+
+class DialectAdapterCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = str(Path(tmpdir.name) / "introspection.json")
+
+    def _save(self, marker):
+        adapter = MarkedPostgresqlAdapter(marker)
+        engine = FakeEngine()
+        engine.rows = BULK_ROWS
+        self.assertFalse(adapter.load_cache(self.path, engine, "public"))
+        bulk = adapter.fetch_schema_bulk(engine, "public")
+        adapter.save_cache(self.path, engine, "public")
+        return bulk
+
+    def test_cache_round_trips_results_through_json(self):
+        bulk = self._save("m1")
+        with open(self.path, encoding="utf-8") as f:
+            json.load(f)
+
+        adapter = MarkedPostgresqlAdapter("m1")
+        engine = FakeEngine()
+        self.assertTrue(adapter.load_cache(self.path, engine, "public"))
+        cached = adapter.fetch_schema_bulk(engine, "public")
+
+        self.assertEqual(engine.statements, [])
+        self.assertEqual(cached, bulk)
+        self.assertEqual(cached["uniques"]["orders"], frozenset({"order_no"}))
+        self.assertEqual(cached["enums"]["orders"]["status"], ("new", "shipped"))
+
+    def test_changed_ddl_marker_ignores_the_cached_results(self):
+        self._save("m1")
+
+        adapter = MarkedPostgresqlAdapter("m2")
+        engine = FakeEngine()
+        self.assertFalse(adapter.load_cache(self.path, engine, "public"))
+        adapter.fetch_schema_bulk(engine, "public")
+
+        self.assertEqual(len(engine.statements), 1)
+
+    def test_corrupt_cache_file_is_ignored_and_rewritten(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+
+        with self.assertLogs(base.logger, level="WARNING"):
+            self._save("m1")
+
+        self.assertTrue(MarkedPostgresqlAdapter("m1").load_cache(self.path, FakeEngine(), "public"))
+
+    def test_failed_lookups_are_not_written_to_the_cache_file(self):
+        postgresql = sys.modules["dialect_adapters.postgresql"]
+        for failing in (
+            {postgresql._PG_PARTITION_KEYS_SQL},
+            {postgresql._PG_CDC_TABLES_SQL},
+            {postgresql._PG_SCHEMA_BULK_SQL, postgresql._PG_SCHEMA_KIND_QUERIES["checks"]},
+        ):
+            adapter = MarkedPostgresqlAdapter("m1")
+            engine = FakeEngine()
+            engine.failing = failing
+            self.assertFalse(adapter.load_cache(self.path, engine, "public"))
+            with self.assertLogs(base.logger, level="WARNING") as logs:
+                adapter.fetch_all_parallel(engine, "public")
+                adapter.save_cache(self.path, engine, "public")
+
+            self.assertFalse(Path(self.path).exists())
+            self.assertTrue(any("Not saving the introspection cache" in line for line in logs.output))
+
+    def test_invalidate_clears_a_recorded_failure(self):
+        postgresql = sys.modules["dialect_adapters.postgresql"]
+        adapter = MarkedPostgresqlAdapter("m1")
+        engine = FakeEngine()
+        engine.failing = {postgresql._PG_PARTITION_KEYS_SQL}
+        adapter.load_cache(self.path, engine, "public")
+        adapter.fetch_partition_columns_bulk(engine, "public")
+
+        engine.failing = set()
+        adapter.invalidate("public")
+        adapter.fetch_all_parallel(engine, "public")
+        adapter.save_cache(self.path, engine, "public")
+
+        self.assertTrue(MarkedPostgresqlAdapter("m1").load_cache(self.path, FakeEngine(), "public"))
+
+    def test_postgresql_marker_only_hashes_enums_used_by_the_schema(self):
+        marker_sql = str(sys.modules["dialect_adapters.postgresql"]._PG_DDL_MARKER_SQL)
+
+        self.assertIn("e.enumtypid IN", marker_sql)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -437,5 +437,30 @@ class JsonExcelLayoutTests(unittest.TestCase):
             )
 
 
+class SheetWriterCellTests(unittest.TestCase):
+    ROWS = [
+        {"name": "id", "value": "text"},
+        {"name": None, "value": ["a", "b"]},
+        {"name": True, "value": {"k": 1}},
+    ]
+    EXPECTED = [("id", "text"), ("", "a, b"), ("TRUE", "k=1")]
+
+    def test_sheet_converts_every_cell_regardless_of_the_first_row(self):
+        from openpyxl import Workbook
+
+        ws = Workbook().active
+        json_to_excel._write_sheet(ws, self.ROWS)
+
+        self.assertEqual(list(ws.iter_rows(min_row=2, values_only=True)), self.EXPECTED)
+
+    def test_multi_section_sheet_converts_every_cell(self):
+        from openpyxl import Workbook
+
+        ws = Workbook().active
+        json_to_excel._write_multi_section_sheet(ws, [("Section", self.ROWS)])
+
+        self.assertEqual(list(ws.iter_rows(min_row=3, max_row=5, values_only=True)), self.EXPECTED)
+
+
 if __name__ == "__main__":
     unittest.main()
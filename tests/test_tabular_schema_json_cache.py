@@ -0,0 +1,110 @@
+import importlib.util
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+MODULE_PATH = Path("/home/fillip/projec/cursorskills/.cursor/skills/source-system-analyser/scripts/flat/tabular_schema_json.py")
+SPEC = importlib.util.spec_from_file_location("tabular_schema_json", MODULE_PATH)
+tabular_schema_json = importlib.util.module_from_spec(SPEC)
+assert SPEC and SPEC.loader
+SPEC.loader.exec_module(tabular_schema_json)
+
+
+class XlsxCacheTests(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        root = Path(tmpdir.name)
+        self.cache_dir = root / "cache"
+        self.workbook = root / "schema.xlsx"
+        self.workbook.write_bytes(b"workbook v1")
+        self.reads = 0
+
+        def fake_read_xlsx(path, sheet_name):
+            self.reads += 1
+            return [{"content": path.read_bytes().decode("utf-8"), "sheet": sheet_name}]
+
+        for name, value in (("_XLSX_CACHE_DIR", self.cache_dir), ("_read_xlsx", fake_read_xlsx)):
+            patcher = patch.object(tabular_schema_json, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _read(self, path=None, sheet_name=None):
+        return tabular_schema_json._cached_read_xlsx(path or self.workbook, sheet_name)
+
+    def _entries(self):
+        return sorted(entry.name for entry in self.cache_dir.iterdir())
+
+    def test_unchanged_workbook_is_served_from_the_cache(self):
+        first = self._read()
+        second = self._read()
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.reads, 1)
+        self.assertEqual(len(self._entries()), 1)
+        self.assertTrue(self._entries()[0].endswith(".pickle"))
+
+    def test_changed_workbook_is_reparsed_and_replaces_its_old_entry(self):
+        self._read()
+        old_entries = self._entries()
+        self.workbook.write_bytes(b"workbook v2")
+
+        rows = self._read()
+
+        self.assertEqual(rows[0]["content"], "workbook v2")
+        self.assertEqual(self.reads, 2)
+        self.assertEqual(len(self._entries()), 1)
+        self.assertNotEqual(self._entries(), old_entries)
+
+    def test_other_sheets_and_workbooks_keep_their_entries(self):
+        other = self.workbook.parent / "other" / "schema.xlsx"
+        other.parent.mkdir()
+        other.write_bytes(b"workbook v1")
+
+        self._read()
+        self._read(sheet_name="Columns")
+        self._read(path=other)
+
+        self.assertEqual(len(self._entries()), 3)
+
+    def test_corrupt_entry_is_reparsed_and_rewritten(self):
+        self._read()
+        entry = self.cache_dir / self._entries()[0]
+        entry.write_bytes(b"not a pickle")
+
+        rows = self._read()
+
+        self.assertEqual(rows[0]["content"], "workbook v1")
+        self.assertEqual(self.reads, 2)
+        self._read()
+        self.assertEqual(self.reads, 2)
+
+    def test_cache_keeps_only_the_most_recently_used_entries(self):
+        workbooks = []
+        for index in range(4):
+            workbook = self.workbook.parent / f"book{index}.xlsx"
+            workbook.write_bytes(b"book %d" % index)
+            workbooks.append(workbook)
+
+        with patch.object(tabular_schema_json, "_XLSX_CACHE_MAX_ENTRIES", 2):
+            for mtime, workbook in enumerate(workbooks[:3]):
+                self._read(path=workbook)
+                for entry in self.cache_dir.glob(f"{workbook.stem}.*"):
+                    os.utime(entry, (mtime, mtime))
+            self._read(path=workbooks[3])
+
+        self.assertEqual([name.split(".")[0] for name in self._entries()], ["book2", "book3"])
+
+    def test_failed_write_leaves_no_temp_file(self):
+        with patch.object(tabular_schema_json.pickle, "dump", side_effect=OSError("disk full")):
+            rows = self._read()
+
+        self.assertEqual(rows[0]["content"], "workbook v1")
+        self.assertEqual(self._entries(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
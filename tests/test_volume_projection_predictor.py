@@ -10,6 +10,7 @@ sqlalchemy.create_engine = lambda *args, **kwargs: None
 sqlalchemy.text = lambda value: value
 sqlalchemy_engine = types.ModuleType("sqlalchemy.engine")
 sqlalchemy_engine.Engine = object
+sqlalchemy_engine.Connection = object
 sys.modules.setdefault("sqlalchemy", sqlalchemy)
 sys.modules.setdefault("sqlalchemy.engine", sqlalchemy_engine)
 